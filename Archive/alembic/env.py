@@ -0,0 +1,67 @@
+"""
+Alembic environment: xrisimopoiei to engine kai ta models tou app
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.config import get_settings
+from app.database import Base, engine
+
+#Import ola ta models gia to autogenerate
+from app.models import user, program, screening  # noqa: F401
+
+config = context.config
+settings = get_settings()
+
+#To logging rythmizetai mono apo to CLI (oxi otan trexei mesa sto app)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """
+    Paragogi SQL script xoris connection (alembic upgrade head --sql)
+    """
+    context.configure(
+        url=settings.database_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+    
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """
+    Efarmogi ton migrations sto database tou app
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+    
+    with engine.connect() as connection:
+        _run_with_connection(connection)
+
+
+def _run_with_connection(connection):
+    #To SQLite den kanei ALTER se constraints: batch mode (copy tou pinaka)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
+    
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
\ No newline at end of file
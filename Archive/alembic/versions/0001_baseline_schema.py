@@ -0,0 +1,128 @@
+"""baseline schema
+
+To schema opos to dimiourgouse to create_all prin apo ta migrations.
+Se vaseis pou exoun idi tous pinakes den kanei tipota.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+USER_ROLES = ("USER", "ADMIN")
+PROGRAM_STATES = (
+    "CREATED", "SUBMISSION", "ASSIGNMENT", "REVIEW",
+    "SCHEDULING", "FINAL_PUBLICATION", "DECISION", "ANNOUNCED"
+)
+PROGRAM_ROLE_TYPES = ("PROGRAMMER", "STAFF", "SUBMITTER")
+SCREENING_STATES = ("CREATED", "SUBMITTED", "REVIEWED", "APPROVED", "SCHEDULED", "REJECTED")
+
+
+def upgrade():
+    #Offline (--sql): to script einai gia adeio database
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table("users"):
+        #Vasi apo to create_all (prin ta migrations): to schema yparxei idi
+        return
+    
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("username", sa.String(50), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("full_name", sa.String(100), nullable=False),
+        sa.Column("email", sa.String(100)),
+        sa.Column("role", sa.Enum(*USER_ROLES, name="userrole"), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("failed_login_attempts", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"])
+    
+    op.create_table(
+        "programs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("state", sa.Enum(*PROGRAM_STATES, name="programstate"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_programs_id", "programs", ["id"])
+    op.create_index("ix_programs_name", "programs", ["name"], unique=True)
+    op.create_index("ix_programs_start_date", "programs", ["start_date"])
+    op.create_index("ix_programs_end_date", "programs", ["end_date"])
+    op.create_index("ix_programs_state", "programs", ["state"])
+    
+    op.create_table(
+        "auth_tokens",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("token", sa.String(500), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("is_valid", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_auth_tokens_id", "auth_tokens", ["id"])
+    op.create_index("ix_auth_tokens_user_id", "auth_tokens", ["user_id"])
+    op.create_index("ix_auth_tokens_token", "auth_tokens", ["token"], unique=True)
+    
+    op.create_table(
+        "program_roles",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("program_id", sa.Integer(), sa.ForeignKey("programs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("role", sa.Enum(*PROGRAM_ROLE_TYPES, name="programroletype"), nullable=False),
+        sa.Column("assigned_at", sa.DateTime(), nullable=False),
+        sa.UniqueConstraint("user_id", "program_id", "role", name="unique_user_program_role")
+    )
+    op.create_index("ix_program_roles_id", "program_roles", ["id"])
+    op.create_index("ix_program_roles_user_id", "program_roles", ["user_id"])
+    op.create_index("ix_program_roles_program_id", "program_roles", ["program_id"])
+    
+    op.create_table(
+        "screenings",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("program_id", sa.Integer(), sa.ForeignKey("programs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("submitter_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        sa.Column("handler_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="SET NULL")),
+        sa.Column("film_title", sa.String(200), nullable=False),
+        sa.Column("film_cast", sa.Text()),
+        sa.Column("film_genre", sa.String(100)),
+        sa.Column("film_duration", sa.Integer()),
+        sa.Column("auditorium_name", sa.String(100)),
+        sa.Column("start_time", sa.DateTime()),
+        sa.Column("end_time", sa.DateTime()),
+        sa.Column("state", sa.Enum(*SCREENING_STATES, name="screeningstate"), nullable=False),
+        sa.Column("review_score", sa.Numeric(3, 2)),
+        sa.Column("review_comments", sa.Text()),
+        sa.Column("rejection_reason", sa.Text()),
+        sa.Column("approval_notes", sa.Text()),
+        sa.Column("is_finally_submitted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_screenings_id", "screenings", ["id"])
+    op.create_index("ix_screenings_program_id", "screenings", ["program_id"])
+    op.create_index("ix_screenings_submitter_id", "screenings", ["submitter_id"])
+    op.create_index("ix_screenings_handler_id", "screenings", ["handler_id"])
+    op.create_index("ix_screenings_film_title", "screenings", ["film_title"])
+    op.create_index("ix_screenings_film_genre", "screenings", ["film_genre"])
+    op.create_index("ix_screenings_state", "screenings", ["state"])
+
+
+def downgrade():
+    #Diagrafei olous tous pinakes tou baseline (kai ta dedomena tous)
+    #Me tin antistrofi seira apo to upgrade logo ton foreign keys
+    for table in ("screenings", "program_roles", "auth_tokens", "programs", "users"):
+        op.drop_table(table)
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""auth_tokens: SHA-256 digests, revocation columns, sweeper indexes
+
+Antikathista to palio script app/migrate_auth_tokens.py. Kathe vima
+elegxei to yparxon schema, opote trexei kai se vaseis pou eixan idi
+perasei apo to script i dimiourgithikan me ta nea models.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+import hashlib
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+#Posa rows enimeronontai se kathe batch tou backfill
+BACKFILL_BATCH_SIZE = 1000
+
+
+#To schema tou 0001 (gia to offline mode, xoris connection)
+BASELINE_COLUMNS = {"id", "user_id", "token", "expires_at", "is_valid", "created_at"}
+BASELINE_INDEXES = {"ix_auth_tokens_id", "ix_auth_tokens_user_id", "ix_auth_tokens_token"}
+
+
+def upgrade():
+    if context.is_offline_mode():
+        columns, indexes = BASELINE_COLUMNS, BASELINE_INDEXES
+    else:
+        inspector = sa.inspect(op.get_bind())
+        columns = {column["name"] for column in inspector.get_columns("auth_tokens")}
+        indexes = {index["name"] for index in inspector.get_indexes("auth_tokens")}
+    
+    #Stiles jti kai revoked_at gia to stateless JWT mode
+    if "jti" not in columns:
+        op.add_column("auth_tokens", sa.Column("jti", sa.String(32), nullable=True))
+    if "ix_auth_tokens_jti" not in indexes:
+        op.create_index("ix_auth_tokens_jti", "auth_tokens", ["jti"], unique=True)
+    
+    if "revoked_at" not in columns:
+        op.add_column("auth_tokens", sa.Column("revoked_at", sa.DateTime(), nullable=True))
+    if "ix_auth_tokens_revoked_at" not in indexes:
+        op.create_index("ix_auth_tokens_revoked_at", "auth_tokens", ["revoked_at"])
+    
+    #Antikatastasi tou token VARCHAR(500) me SHA-256 digest BINARY(32)
+    if "token" in columns:
+        if "token_hash" not in columns:
+            op.add_column("auth_tokens", sa.Column("token_hash", sa.BINARY(32), nullable=True))
+        
+        _backfill_token_hashes()
+        
+        with op.batch_alter_table("auth_tokens") as batch_op:
+            batch_op.alter_column("token_hash", existing_type=sa.BINARY(32), nullable=False)
+            if "ix_auth_tokens_token" in indexes:
+                batch_op.drop_index("ix_auth_tokens_token")
+            batch_op.drop_column("token")
+    
+    if "ix_auth_tokens_token_hash" not in indexes:
+        op.create_index("ix_auth_tokens_token_hash", "auth_tokens", ["token_hash"], unique=True)
+    
+    #Indexes gia to invalidation ana user kai to sweeper
+    if "ix_auth_tokens_user_id_is_valid" not in indexes:
+        op.create_index("ix_auth_tokens_user_id_is_valid", "auth_tokens", ["user_id", "is_valid"])
+    if "ix_auth_tokens_expires_at" not in indexes:
+        op.create_index("ix_auth_tokens_expires_at", "auth_tokens", ["expires_at"])
+
+
+def downgrade():
+    #Ta tokens den ginontai restore apo ta digests: ola ta sessions xanontai
+    op.drop_index("ix_auth_tokens_expires_at", "auth_tokens")
+    op.drop_index("ix_auth_tokens_user_id_is_valid", "auth_tokens")
+    op.execute("DELETE FROM auth_tokens")
+    
+    with op.batch_alter_table("auth_tokens") as batch_op:
+        batch_op.drop_index("ix_auth_tokens_token_hash")
+        batch_op.drop_index("ix_auth_tokens_revoked_at")
+        batch_op.drop_index("ix_auth_tokens_jti")
+        batch_op.drop_column("token_hash")
+        batch_op.drop_column("revoked_at")
+        batch_op.drop_column("jti")
+        batch_op.add_column(sa.Column("token", sa.String(500), nullable=False))
+        batch_op.create_index("ix_auth_tokens_token", ["token"], unique=True)
+
+
+def _backfill_token_hashes():
+    if context.is_offline_mode():
+        #Sto SQL script (MySQL) to digest ypologizetai apo ton server
+        op.execute("UPDATE auth_tokens SET token_hash = UNHEX(SHA2(token, 256)) WHERE token_hash IS NULL")
+        return
+    
+    #Backfill se batches, gia na min fortonontai ola ta tokens sti mnimi
+    select_batch = sa.text(
+        "SELECT id, token FROM auth_tokens WHERE token_hash IS NULL ORDER BY id LIMIT :limit"
+    )
+    update_row = sa.text("UPDATE auth_tokens SET token_hash = :token_hash WHERE id = :token_id")
+    
+    connection = op.get_bind()
+    migrated = 0
+    
+    while True:
+        rows = connection.execute(select_batch, {"limit": BACKFILL_BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        
+        connection.execute(update_row, [
+            {"token_hash": hashlib.sha256(token.encode("utf-8")).digest(), "token_id": token_id}
+            for token_id, token in rows
+        ])
+        
+        migrated += len(rows)
+        print(f"  Backfilled {migrated} tokens...")
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""screenings: composite indexes gia ta queries ana program
+
+- (program_id, state, film_genre, film_title): to public search (SCHEDULED
+  screenings enos program) vriskei ta rows taksinomimena, xoris filesort.
+  To prefix (program_id, state) kalyptei kai ta queries ana state
+  (p.x. auto-reject).
+- (program_id, film_genre, film_title): to search tou PROGRAMMER (ola ta
+  screenings tou program) me tin idia taksinomisi.
+- (program_id, submitter_id) kai (program_id, handler_id): ta screenings
+  enos SUBMITTER i STAFF mesa se ena program.
+
+To ix_screenings_program_id afaireitai, giati to kalyptoun ta composite
+indexes (kai gia to foreign key).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+COMPOSITE_INDEXES = {
+    "ix_screenings_program_id_state_genre_title": ["program_id", "state", "film_genre", "film_title"],
+    "ix_screenings_program_id_genre_title": ["program_id", "film_genre", "film_title"],
+    "ix_screenings_program_id_submitter_id": ["program_id", "submitter_id"],
+    "ix_screenings_program_id_handler_id": ["program_id", "handler_id"]
+}
+
+
+def upgrade():
+    if context.is_offline_mode():
+        indexes = {"ix_screenings_program_id"}
+    else:
+        indexes = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("screenings")}
+    
+    for name, columns in COMPOSITE_INDEXES.items():
+        if name not in indexes:
+            op.create_index(name, "screenings", columns)
+    
+    #Meta ta composite, gia na yparxei panta index gia to foreign key (MySQL)
+    if "ix_screenings_program_id" in indexes:
+        op.drop_index("ix_screenings_program_id", "screenings")
+
+
+def downgrade():
+    op.create_index("ix_screenings_program_id", "screenings", ["program_id"])
+    
+    for name in COMPOSITE_INDEXES:
+        op.drop_index(name, "screenings")
\ No newline at end of file
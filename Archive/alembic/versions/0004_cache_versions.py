@@ -0,0 +1,41 @@
+"""cache_versions: version counters gia ta in-process caches
+
+To program_access row allazei se kathe allagi roles i program state,
+gia na adeiazoun to program cache kai oi ypoloipoi workers.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from datetime import datetime
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+CACHE_NAMES = ("program_access",)
+
+
+def upgrade():
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table("cache_versions"):
+        return
+    
+    cache_versions = op.create_table(
+        "cache_versions",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    
+    now = datetime.utcnow()
+    op.bulk_insert(cache_versions, [
+        {"name": name, "version": 0, "updated_at": now} for name in CACHE_NAMES
+    ])
+
+
+def downgrade():
+    op.drop_table("cache_versions")
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""programs.cache_version: version tou program cache ana program
+
+Antikathista to koino row program_access tou cache_versions: kathe allagi
+roles i state auksanei mono to version tou diko tou program, opote ta
+writes se diaforetika programs den perimenoun to idio row lock kai den
+adeiazoun to cache ton allon programs.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from datetime import datetime
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if context.is_offline_mode():
+        columns, has_cache_versions = set(), True
+    else:
+        inspector = sa.inspect(op.get_bind())
+        columns = {column["name"] for column in inspector.get_columns("programs")}
+        has_cache_versions = inspector.has_table("cache_versions")
+    
+    if "cache_version" not in columns:
+        op.add_column(
+            "programs",
+            sa.Column("cache_version", sa.Integer(), nullable=False, server_default="0")
+        )
+    
+    if has_cache_versions:
+        op.drop_table("cache_versions")
+
+
+def downgrade():
+    cache_versions = op.create_table(
+        "cache_versions",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+    op.bulk_insert(cache_versions, [
+        {"name": "program_access", "version": 0, "updated_at": datetime.utcnow()}
+    ])
+    
+    with op.batch_alter_table("programs") as batch_op:
+        batch_op.drop_column("cache_version")
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Command line entgoles gia to deployment
+
+    python -m app.cli create-admin
+    python -m app.cli create-admin --username admin2 --password "Admin@456"
+"""
+import argparse
+import getpass
+import sys
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.user import User, UserRole
+from app.utils.validators import validate_username, validate_password
+
+DEFAULT_ADMIN_USERNAME = "admin"
+DEFAULT_ADMIN_PASSWORD = "Admin@123"
+
+
+def ensure_admin_user(
+    db: Session,
+    username: str = DEFAULT_ADMIN_USERNAME,
+    password: str = DEFAULT_ADMIN_PASSWORD,
+    full_name: str = "System Administrator",
+    email: Optional[str] = "admin@cinema.com"
+) -> Optional[User]:
+    """
+    Dimiourgia ADMIN user AN den yparxei idi to username
+    
+    Returns:
+        O neos user, i None an to username yparxei idi
+    """
+    from app.utils.security import get_password_hash
+    
+    if db.query(User.id).filter(User.username == username).first():
+        return None
+    
+    admin_user = User(
+        username=username,
+        password_hash=get_password_hash(password),
+        full_name=full_name,
+        email=email,
+        role=UserRole.ADMIN,
+        is_active=True
+    )
+    
+    db.add(admin_user)
+    db.commit()
+    db.refresh(admin_user)
+    
+    return admin_user
+
+
+def create_admin(args) -> int:
+    password = args.password
+    if password is None:
+        password = getpass.getpass("Password: ")
+        if password != getpass.getpass("Repeat password: "):
+            print("Passwords do not match")
+            return 1
+    
+    for is_valid, error in (validate_username(args.username), validate_password(password)):
+        if not is_valid:
+            print(error)
+            return 1
+    
+    db = SessionLocal()
+    try:
+        admin_user = ensure_admin_user(db, args.username, password, args.full_name, args.email)
+    finally:
+        db.close()
+    
+    if admin_user is None:
+        print(f"User '{args.username}' already exists.")
+        return 0
+    
+    print(f"Admin user '{admin_user.username}' created (id={admin_user.id}).")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Cinema Management System commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    admin_parser = commands.add_parser("create-admin", help="Create an ADMIN user if it does not exist")
+    admin_parser.add_argument("--username", default=DEFAULT_ADMIN_USERNAME)
+    admin_parser.add_argument("--password", help="Prompted for if omitted")
+    admin_parser.add_argument("--full-name", default="System Administrator")
+    admin_parser.add_argument("--email", default="admin@cinema.com")
+    admin_parser.set_defaults(handler=create_admin)
+    
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,28 +1,127 @@
+import os
+import tempfile
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import List
+
+#I "in-memory" vasi (SQLITE_PATH=":memory:") einai arxeio WAL sto tmpfs, ena ana process:
+#oi writers perimenoun to lock (busy_timeout) kai ta reads vlepoun mono ta commits
+MEMORY_DATABASE = os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+    f"cinema_memory_{os.getpid()}.db"
+)
 
 
 class Settings(BaseSettings):
-    #Database
+    #Database backend: mysql i sqlite (xoris server, gia benchmarks kai tests)
+    DB_BACKEND: str = "mysql"
+    
+    #SQLite (mono me DB_BACKEND=sqlite)
+    SQLITE_PATH: str = "cinema.db"  #":memory:" = in-memory vasi, xanetai sto restart
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  #Anamoni gia to write lock prin to "database is locked"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  #FULL = fsync se kathe commit
+    SQLITE_CACHE_SIZE_MB: int = 64
+    SQLITE_MMAP_SIZE_MB: int = 256
+    
+    #Database (MySQL)
     DB_HOST: str = "localhost"
     DB_PORT: int = 3306
     DB_USER: str = "root"
     DB_PASSWORD: str = ""
     DB_NAME: str = "cinema_user"
     
+    #Connection pool (to FastAPI threadpool trexei mexri 40 sync handlers)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0  #Anamoni gia connection prin to error
+    DB_POOL_RECYCLE_SECONDS: int = 3600
+    DB_POOL_PRE_PING: bool = True  #Elegxos tou connection se kathe checkout
+    
+    #Read replicas gia ta GET routes (URLs me komma, keno = mono to primary)
+    DB_REPLICA_URLS: str = ""
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0  #0 = xoris orio lag
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: int = 10
+    DB_REPLICA_FALLBACK_TO_PRIMARY: bool = True  #False = lagging replica anti gia primary
+    
+    #SQL logging (to DB_ECHO typonei OLA ta statements, mono gia debugging)
+    DB_ECHO: bool = False
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN: bool = False  #EXPLAIN gia ta slow SELECT (extra query)
+    SLOW_QUERY_BUFFER_SIZE: int = 200
+    
+    #Metrisi queries ana request (headers X-DB-* mono me DEBUG)
+    QUERY_COUNTER_ENABLED: bool = True
+    N_PLUS_ONE_THRESHOLD: int = 5  #Idio statement toses fores se ena request = N+1
+    
     #Security
     SECRET_KEY: str = "lqh+!-etvy0(=2-0bdb$vsfa3i@f%0v!c@h_zy#8vzfqh@*#x="
     ALGORITHM: str = "HS256"
+    JWT_BACKEND: str = "jose"  #jose i native (grigoroteri ylopoiisi gia HS256/384/512)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    #Stateless JWT mode: to token elegxetai mono apo tin ypografi kai to
+    #in-memory revocation list, xoris lookup ston pinaka auth_tokens
+    AUTH_STATELESS_JWT: bool = False
+    REVOCATION_REFRESH_SECONDS: int = 5
+    
+    #Sweeper gia ta expired tokens tou pinaka auth_tokens
+    TOKEN_SWEEPER_ENABLED: bool = True
+    TOKEN_SWEEPER_INTERVAL_SECONDS: int = 300
+    TOKEN_SWEEPER_BATCH_SIZE: int = 1000
+    TOKEN_RETENTION_HOURS: int = 24  #Poso krataei ena token meta to expiration
+    
+    #Token cache (in-process, ana worker)
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 60  #Anwtato orio staleness metaksi workers
+    
+    #Program cache: roles (user, program) kai program state (in-process, ana worker)
+    PROGRAM_CACHE_ENABLED: bool = True
+    PROGRAM_CACHE_MAX_SIZE: int = 10000
+    PROGRAM_CACHE_TTL_SECONDS: int = 60  #Safety net an xathei kapoio invalidation
+    PROGRAM_CACHE_VERSION_CHECK_SECONDS: float = 1.0  #Elegxos tou version sti vasi (0 = se kathe request)
+    
+    #Auto-rejection: screenings ana UPDATE (0 = ena UPDATE gia olo to program)
+    AUTO_REJECT_BATCH_SIZE: int = 0
+    AUTO_REJECT_ON_DECISION: bool = True  #Background job sto transition se DECISION
+    AUTO_REJECT_JOB_BATCH_SIZE: int = 1000  #To job kanei panta chunks (commit ana chunk)
+    AUTO_REJECT_JOB_HISTORY: int = 100  #Posa jobs krataei to status endpoint
+    
+    #Password hashing (scheme: bcrypt, scrypt i argon2)
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    PASSWORD_HASH_ROUNDS: int = 12  #0 = calibration sto startup
+    PASSWORD_HASH_TARGET_MS: int = 250  #Stoxos latency ana hash gia tin calibration
+    PASSWORD_HASH_MIN_ROUNDS: int = 10
+    
+    #Password hashing worker pool
+    PASSWORD_POOL_SIZE: int = 2  #0 = hashing mesa sto request thread
+    PASSWORD_POOL_QUEUE_DEPTH: int = 16  #Jobs pou perimenoun prin to 503
+    PASSWORD_POOL_TIMEOUT_SECONDS: float = 10.0
+    
     #Application
     DEBUG: bool = True
+    #full: elegxos schema kai default admin sto startup
+    #fast: to schema einai idi migrated, o admin ftiaxnetai me python -m app.cli create-admin
+    STARTUP_MODE: str = "full"
     API_VERSION: str = "v1"
     
     @property
     def database_url(self) -> str:
+        if self.DB_BACKEND == "sqlite":
+            if self.SQLITE_PATH == ":memory:":
+                return f"sqlite:///{MEMORY_DATABASE}"
+            return f"sqlite:///{self.SQLITE_PATH}"
+        
+        if self.DB_BACKEND != "mysql":
+            raise ValueError(f"Unsupported DB_BACKEND: {self.DB_BACKEND} (mysql or sqlite)")
+        
         return f"mysql+pymysql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
+    @property
+    def replica_urls(self) -> List[str]:
+        return [url.strip() for url in self.DB_REPLICA_URLS.split(",") if url.strip()]
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,22 +1,122 @@
+from functools import lru_cache
+from typing import List
 from sqlalchemy import create_engine, MetaData
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 from app.config import get_settings
+from app.utils.db_pool import InstrumentedQueuePool
+from app.utils.replicas import ReplicaSet, RoutingSession
+from app.utils.slow_query_log import slow_query_log
+from app.utils import query_counter, sqlite_backend
 
 #automata diavazoume tis plirofories pou uparxoun sto arxeio .env
 settings = get_settings()
 
+#Async driver gia kathe sync driver (idia vasi, allo DBAPI)
+ASYNC_DRIVERS = {
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite"
+}
+
+
+def build_engine(url: str) -> Engine:
+    #Idio pool configuration gia to primary kai ta replicas
+    url = make_url(url)
+    memory = sqlite_backend.is_memory(url)
+    
+    if sqlite_backend.is_single_connection(url):
+        #Ena connection gia ola ta threads: i in-memory vasi zei oso zei to connection
+        pool_options = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+    else:
+        pool_options = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS
+        }
+    
+    if sqlite_backend.is_memory_file(url):
+        sqlite_backend.reset_memory_file(url)
+    
+    new_engine = create_engine(url, echo=settings.DB_ECHO, **pool_options)
+    
+    if sqlite_backend.is_sqlite(url):
+        sqlite_backend.install(new_engine, memory)
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        slow_query_log.install(new_engine)
+    if settings.QUERY_COUNTER_ENABLED:
+        query_counter.install(new_engine)
+    return new_engine
+
+
+def build_async_engine(url: str) -> AsyncEngine:
+    #To async engine xrisimopoiei ton async driver tis idias vasis
+    url = make_url(url)
+    url = url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+    
+    memory = sqlite_backend.is_memory(url)
+    
+    if sqlite_backend.is_single_connection(url):
+        pool_options = {"poolclass": StaticPool}
+    else:
+        #To aiosqlite xrisimopoiei NullPool by default (neo connection kai thread ana session)
+        pool_options = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS
+        }
+    
+    if sqlite_backend.is_memory_file(url):
+        sqlite_backend.reset_memory_file(url)
+    
+    new_engine = create_async_engine(url, echo=settings.DB_ECHO, **pool_options)
+    
+    if sqlite_backend.is_sqlite(url):
+        sqlite_backend.install(new_engine.sync_engine, memory)
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        slow_query_log.install(new_engine.sync_engine)
+    if settings.QUERY_COUNTER_ENABLED:
+        query_counter.install(new_engine.sync_engine)
+    return new_engine
+
+
 #Dimiourgia engine
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    echo=settings.DEBUG
-)
+engine = build_engine(settings.database_url)
 
 #Dimiourgia session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+#Read replicas (adeia lista = ola ta reads sto primary)
+replica_set = ReplicaSet(
+    engines=[build_engine(url) for url in settings.replica_urls],
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DB_REPLICA_CHECK_INTERVAL_SECONDS,
+    fallback_to_primary=settings.DB_REPLICA_FALLBACK_TO_PRIMARY
+)
+
+#Session factory gia ta read-only routes (SELECT sta replicas)
+if replica_set.engines:
+    ReadSessionLocal = sessionmaker(
+        class_=RoutingSession,
+        autocommit=False,
+        autoflush=False,
+        bind=engine,
+        replica_set=replica_set,
+        replica_engines=replica_set.engines
+    )
+else:
+    ReadSessionLocal = SessionLocal
+
 #Base class gia models
 Base = declarative_base()
 
@@ -30,14 +130,81 @@ def get_db():
         db.close()
 
 
-#Function gia na dimiourgithoun oi pinakes me swsti seira
-def create_tables():
-    #Import ola ta models gia na ta "dei" to Base
-    from app.models import user, program, screening
+#Dependency gia ta GET routes (replica an yparxei, alliws primary)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """
+    Async engine gia ta read routes (dimiourgeitai mono otan xreiastei,
+    opote to aiomysql fortonetai mono an yparxoun async requests)
+    """
+    return build_async_engine(settings.database_url)
+
+
+@lru_cache()
+def get_async_replica_engines() -> List[AsyncEngine]:
+    #Me tin idia seira me to replica_set.engines (idio index)
+    return [build_async_engine(url) for url in settings.replica_urls]
+
+
+@lru_cache()
+def get_async_session_factory() -> async_sessionmaker:
+    #expire_on_commit=False: ta objects diavazontai meta to commit xoris lazy load
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+@lru_cache()
+def get_async_read_session_factory() -> async_sessionmaker:
+    if not replica_set.engines:
+        return get_async_session_factory()
     
-    #Drop ola kai ksanadimiourgia (mono gia development!)
-    if settings.DEBUG:
-        Base.metadata.drop_all(bind=engine)
+    #To AsyncSession trexei to RoutingSession me ta sync_engine ton async replicas
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replica_set=replica_set,
+        replica_engines=[replica.sync_engine for replica in get_async_replica_engines()]
+    )
+
+
+#Async dependency gia FastAPI routes (async def, trexoun sto event loop)
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+#Async dependency gia ta GET routes (replica an yparxei, alliws primary)
+async def get_async_read_db():
+    async with get_async_read_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    #Kleinei ta async connections an xrisimopoiithike to async engine
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
     
-    #Dimiourgia me swsti seira
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    if get_async_replica_engines.cache_info().currsize:
+        for replica in get_async_replica_engines():
+            await replica.dispose()
+
+
+#Function gia na dimiourgithoun oi pinakes me swsti seira
+def create_tables():
+    #To schema dimiourgeitai kai enimeronetai MONO apo ta migrations
+    #(oxi drop_all/create_all, gia na min xathoun dedomena se upgrade)
+    from app.db_migrations import upgrade_database
+    upgrade_database()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Helpers gia ta Alembic migrations (xrisi apo to startup kai to init_db)
+
+Apo to command line (mesa sto Archive/):
+    alembic upgrade head
+"""
+import os
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from app.database import engine
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+
+def get_alembic_config() -> Config:
+    config = Config(ALEMBIC_INI)
+    #To logging tou app den allazei otan ta migrations trexoun apo to startup
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+
+def current_revision() -> Optional[str]:
+    """
+    To revision tou database (None = den exei perasei apo ta migrations)
+    """
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def upgrade_database(revision: str = "head") -> None:
+    """
+    Efarmogi ton migrations (ta revisions elegxoun to yparxon schema,
+    opote trexoun kai se vaseis pou dimiourgithikan me to create_all)
+    """
+    command.upgrade(get_alembic_config(), revision)
\ No newline at end of file
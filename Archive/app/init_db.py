@@ -1,62 +1,80 @@
 """
 Script gia na dimiourgithoun oi pinakes kai na mpei o default ADMIN user
+
+    python -m app.init_db           #migrations + admin (ta dedomena menoun)
+    python -m app.init_db --reset   #DROP olon ton pinakon prota (mono development!)
 """
+import argparse
 from sqlalchemy import text
 from app.database import engine, Base, SessionLocal
+from app.db_migrations import upgrade_database
+from app.cli import ensure_admin_user, DEFAULT_ADMIN_USERNAME, DEFAULT_ADMIN_PASSWORD
 
 #Import ola ta models
 from app.models.user import User, UserRole, AuthToken
 from app.models.program import Program, ProgramRole
 from app.models.screening import Screening
-from app.utils.security import get_password_hash
+from app.utils import sqlite_backend
+
+#Entoles gia na ginei drop xoris elegxo ton foreign keys, ana dialect
+FOREIGN_KEY_CHECKS = {
+    "mysql": ("SET FOREIGN_KEY_CHECKS = 0", "SET FOREIGN_KEY_CHECKS = 1"),
+    "sqlite": ("PRAGMA foreign_keys = OFF", "PRAGMA foreign_keys = ON")
+}
 
 
-def init_database():
+def drop_tables():
     """
-    Dimiourgia database tables kai default admin user
+    Diagrafi OLON ton pinakon (kai tou alembic_version)
     """
     print("Dropping existing tables...")
     
     #Drop ola ta tables me swsti seira (antistrofi apo tin dimiourgia)
     with engine.connect() as conn:
-        conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+        disable_checks, enable_checks = FOREIGN_KEY_CHECKS[conn.dialect.name]
+        conn.execute(text(disable_checks))
         conn.execute(text("DROP TABLE IF EXISTS screenings"))
         conn.execute(text("DROP TABLE IF EXISTS program_roles"))
         conn.execute(text("DROP TABLE IF EXISTS auth_tokens"))
         conn.execute(text("DROP TABLE IF EXISTS programs"))
         conn.execute(text("DROP TABLE IF EXISTS users"))
-        conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+        conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+        conn.execute(text(enable_checks))
         conn.commit()
+
+
+def init_database(reset: bool = False):
+    """
+    Dimiourgia/enimerosi database tables kai default admin user
     
-    print("Creating database tables...")
+    Args:
+        reset: Diagrafi olon ton dedomenon prin ti dimiourgia
+    """
+    if sqlite_backend.is_memory(engine.url):
+        #I in-memory vasi zei mono mesa sto process tou API
+        print("In-memory SQLite database: the schema and the admin user are created on every startup.")
+        return
+    
+    if reset:
+        drop_tables()
     
-    #Dimiourgia tables
-    Base.metadata.create_all(bind=engine)
+    print("Applying database migrations...")
     
-    print("Database tables created!")
+    #Dimiourgia i upgrade ton tables (xoris drop)
+    upgrade_database()
+    
+    print("Database tables are up to date!")
     
     #Dimiourgia default admin user
     db = SessionLocal()
     
     try:
-        #Elegxos an yparxei idi admin
-        existing_admin = db.query(User).filter(User.username == "admin").first()
+        admin_user = ensure_admin_user(db)
         
-        if not existing_admin:
-            admin_user = User(
-                username="admin",
-                password_hash=get_password_hash("Admin@123"),
-                full_name="System Administrator",
-                email="admin@cinema.com",
-                role=UserRole.ADMIN,
-                is_active=True
-            )
-            
-            db.add(admin_user)
-            db.commit()
+        if admin_user is not None:
             print("Default admin user created!")
-            print("Username: admin")
-            print("Password: Admin@123")
+            print(f"Username: {DEFAULT_ADMIN_USERNAME}")
+            print(f"Password: {DEFAULT_ADMIN_PASSWORD}")
         else:
             print("Admin user already exists!")
     
@@ -68,4 +86,8 @@ def init_database():
 
 
 if __name__ == "__main__":
-    init_database()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Database initialization")
+    parser.add_argument("--reset", action="store_true", help="Drop all tables first (development only)")
+    args = parser.parse_args()
+    
+    init_database(reset=args.reset)
\ No newline at end of file
@@ -1,13 +1,21 @@
+import time
+
+#Xronos fortosis ton modules (fainetai sto startup log)
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text, inspect
-import time
 
-from app.database import engine, Base, SessionLocal
+from app.database import engine, SessionLocal
 from app.config import get_settings
-from app.routes import auth_router, users_router, programs_router, screenings_router
+from app.routes import auth_router, users_router, programs_router, screenings_router, admin_router
+from app.utils.slow_query_log import current_route
+from app.utils.query_counter import QueryStats, current_query_stats
+from app.utils.startup_timer import StartupTimer
+from app.utils import sqlite_backend
 
 settings = get_settings()
 
@@ -34,14 +42,31 @@ app.add_middleware(
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """
-    Middleware gia na metraei to response time
+    Middleware gia na metraei to response time kai ta queries tou request
     """
     start_time = time.time()
     
+    #To route fainetai sto slow query log gia ta queries autou tou request
+    route = f"{request.method} {request.url.path}"
+    route_token = current_route.set(route)
+    query_stats = QueryStats()
+    stats_token = current_query_stats.set(query_stats)
+    
     try:
         response = await call_next(request)
         process_time = time.time() - start_time
         response.headers["X-Process-Time"] = str(process_time)
+        
+        #Pithano N+1: to idio statement ksana kai ksana sto idio request
+        repeated = query_stats.repeated(settings.N_PLUS_ONE_THRESHOLD)
+        for statement, times in repeated:
+            print(f"Possible N+1 in {route}: {times}x {statement[:200]}")
+        
+        if settings.DEBUG:
+            response.headers["X-DB-Query-Count"] = str(query_stats.count)
+            response.headers["X-DB-Time-Ms"] = f"{query_stats.duration_ms:.2f}"
+            response.headers["X-DB-Repeated-Queries"] = str(sum(times for _, times in repeated))
+        
         return response
     except Exception as e:
         return JSONResponse(
@@ -51,6 +76,9 @@ async def add_process_time_header(request: Request, call_next):
                 "error": str(e) if settings.DEBUG else "An error occurred"
             }
         )
+    finally:
+        current_query_stats.reset(stats_token)
+        current_route.reset(route_token)
 
 
 #Exception handlers
@@ -73,61 +101,64 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
 async def startup_event():
     """
     Dimiourgia ton database tables MONO an den yparxoun
+    
+    Me STARTUP_MODE=fast to schema theoreitai idi migrated (alembic upgrade head)
+    kai o admin dimiourgeitai me to python -m app.cli create-admin, opote kathe
+    worker ksekinaei xoris inspection tou database kai xoris password hashing.
     """
-    print("Initializing database...")
+    timer = StartupTimer()
+    timer.add("imports", _import_time_ms)
+    fast_startup = settings.STARTUP_MODE == "fast"
     
-    #Import ola ta models gia na ta "dei" to Base
-    from app.models.user import User, UserRole, AuthToken
-    from app.models.program import Program, ProgramRole
-    from app.models.screening import Screening
-    from app.utils.security import get_password_hash
+    #I in-memory SQLite vasi einai adeia se kathe startup
+    if fast_startup and sqlite_backend.is_memory(engine.url):
+        print("In-memory SQLite database: STARTUP_MODE=fast ignored.")
+        fast_startup = False
+    
+    print(f"Initializing database ({engine.dialect.name}, {'fast' if fast_startup else 'full'} startup)...")
     
     try:
-        #Elegxos an yparxoun idi tables
-        inspector = inspect(engine)
-        existing_tables = inspector.get_table_names()
+        if not fast_startup:
+            with timer.phase("schema"):
+                _initialize_schema()
+            
+            with timer.phase("admin"):
+                _create_default_admin()
         
-        if existing_tables:
-            print(f"Database already initialized. Existing tables: {', '.join(existing_tables)}")
-        else:
-            print("No tables found. Creating database tables...")
-            Base.metadata.create_all(bind=engine)
-            print("Database tables created successfully!")
+        #Fortosi revocation list gia to stateless JWT mode
+        if settings.AUTH_STATELESS_JWT:
+            from app.utils.revocation import revocation_list
             
-            #Elegxos poioi pinakes dimiourgithikan
-            inspector = inspect(engine)
-            tables = inspector.get_table_names()
-            print(f"Created tables: {', '.join(tables)}")
+            with timer.phase("revocation list"):
+                db = SessionLocal()
+                try:
+                    revocation_list.load(db)
+                    print(f"Revocation list loaded: {revocation_list.stats()['revoked']} revoked tokens")
+                finally:
+                    db.close()
         
-        #Dimiourgia default admin user AN den yparxei
-        db = SessionLocal()
-        try:
-            existing_admin = db.query(User).filter(User.username == "admin").first()
+        #Password hashing settings (kanei calibration an xreiazetai).
+        #Sto fast startup to context ftiaxnetai sto proto hash, ektos an xreiazetai calibration
+        if not fast_startup or settings.PASSWORD_HASH_ROUNDS <= 0:
+            from app.utils.security import get_password_context_settings
             
-            if not existing_admin:
-                print("Creating default admin user...")
-                admin_user = User(
-                    username="admin",
-                    password_hash=get_password_hash("Admin@123"),
-                    full_name="System Administrator",
-                    email="admin@cinema.com",
-                    role=UserRole.ADMIN,
-                    is_active=True
-                )
-                
-                db.add(admin_user)
-                db.commit()
-                print("Default admin user created!")
-                print("  Username: admin")
-                print("  Password: Admin@123")
-            else:
-                print("Admin user already exists.")
+            with timer.phase("password hashing"):
+                scheme, rounds = get_password_context_settings()
+            print(f"Password hashing: {scheme} rounds={rounds}")
         
-        except Exception as e:
-            print(f"Error creating admin user: {e}")
-            db.rollback()
-        finally:
-            db.close()
+        #Background sweeper gia ta expired tokens
+        if settings.TOKEN_SWEEPER_ENABLED:
+            from app.utils.token_sweeper import token_sweeper
+            token_sweeper.start()
+        
+        #Elegxos lag ton read replicas
+        from app.database import replica_set
+        if replica_set.engines:
+            with timer.phase("replicas"):
+                replica_set.start()
+            print(f"Read replicas: {len(replica_set.engines)}")
+        
+        print(timer.summary())
             
     except Exception as e:
         print(f"Error initializing database: {e}")
@@ -136,6 +167,58 @@ async def startup_event():
         raise
 
 
+def _initialize_schema():
+    #Import ola ta models gia na ta "dei" to Base
+    from app.models.user import User, UserRole, AuthToken
+    from app.models.program import Program, ProgramRole
+    from app.models.screening import Screening
+    from app.db_migrations import current_revision, head_revision, upgrade_database
+    
+    #Elegxos an yparxoun idi tables
+    inspector = inspect(engine)
+    existing_tables = inspector.get_table_names()
+    
+    if existing_tables:
+        print(f"Database already initialized. Existing tables: {', '.join(existing_tables)}")
+        
+        #Ta upgrades den ginontai automata sto startup (ALTER se megalous pinakes)
+        revision, head = current_revision(), head_revision()
+        if revision != head:
+            print(f"WARNING: database schema is at revision {revision or 'unversioned'}, latest is {head}.")
+            print("  Run: alembic upgrade head")
+    else:
+        print("No tables found. Creating database tables...")
+        upgrade_database()
+        print("Database tables created successfully!")
+        
+        #Elegxos poioi pinakes dimiourgithikan
+        inspector = inspect(engine)
+        tables = inspector.get_table_names()
+        print(f"Created tables: {', '.join(tables)}")
+
+
+def _create_default_admin():
+    #Dimiourgia default admin user AN den yparxei
+    from app.cli import ensure_admin_user, DEFAULT_ADMIN_USERNAME, DEFAULT_ADMIN_PASSWORD
+    
+    db = SessionLocal()
+    try:
+        admin_user = ensure_admin_user(db)
+        
+        if admin_user is not None:
+            print("Default admin user created!")
+            print(f"  Username: {DEFAULT_ADMIN_USERNAME}")
+            print(f"  Password: {DEFAULT_ADMIN_PASSWORD}")
+        else:
+            print("Admin user already exists.")
+    
+    except Exception as e:
+        print(f"Error creating admin user: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
 #Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -143,6 +226,19 @@ async def shutdown_event():
     Cleanup otan kleinei to app
     """
     print("Shutting down application...")
+    
+    from app.utils.password_pool import password_pool
+    password_pool.shutdown()
+    
+    from app.utils.token_sweeper import token_sweeper
+    token_sweeper.stop()
+    
+    from app.utils.auto_reject_jobs import auto_reject_jobs
+    auto_reject_jobs.shutdown()
+    
+    from app.database import replica_set, dispose_async_engine
+    replica_set.stop()
+    await dispose_async_engine()
 
 
 #Health check endpoint
@@ -159,7 +255,7 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+def health_check():
     """
     Detailed health check
     """
@@ -190,6 +286,10 @@ app.include_router(auth_router)
 app.include_router(users_router)
 app.include_router(programs_router)
 app.include_router(screenings_router)
+app.include_router(admin_router)
+
+#Fortosi modules kai routers (i proti fasi tou startup)
+_import_time_ms = (time.perf_counter() - _import_started) * 1000
 
 
 #Gia na trexei to app directly (optional)
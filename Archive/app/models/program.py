@@ -31,6 +31,7 @@ class Program(Base):
     start_date = Column(Date, nullable=False, index=True)
     end_date = Column(Date, nullable=False, index=True)
     state = Column(Enum(ProgramState), default=ProgramState.CREATED, nullable=False, index=True)
+    cache_version = Column(Integer, default=0, server_default="0", nullable=False)  #+1 se kathe allagi roles i state (program cache)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Boolean, Numeric
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Boolean, Numeric, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -18,7 +18,7 @@ class Screening(Base):
     __tablename__ = "screenings"
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    program_id = Column(Integer, ForeignKey("programs.id", ondelete="CASCADE"), nullable=False, index=True)
+    program_id = Column(Integer, ForeignKey("programs.id", ondelete="CASCADE"), nullable=False)
     submitter_id = Column(Integer, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     handler_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), index=True)
     
@@ -46,6 +46,14 @@ class Screening(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    #Composite indexes gia ta queries ana program (vl. alembic revision 0003)
+    __table_args__ = (
+        Index('ix_screenings_program_id_state_genre_title', 'program_id', 'state', 'film_genre', 'film_title'),
+        Index('ix_screenings_program_id_genre_title', 'program_id', 'film_genre', 'film_title'),
+        Index('ix_screenings_program_id_submitter_id', 'program_id', 'submitter_id'),
+        Index('ix_screenings_program_id_handler_id', 'program_id', 'handler_id'),
+    )
+    
     #Relationships
     program = relationship("Program", back_populates="screenings")
     submitter = relationship("User", foreign_keys=[submitter_id], back_populates="submitted_screenings")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime, ForeignKey, BINARY, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -36,10 +36,18 @@ class AuthToken(Base):
     
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    token = Column(String(500), unique=True, nullable=False, index=True)
-    expires_at = Column(DateTime, nullable=False)
+    token_hash = Column(BINARY(32), unique=True, nullable=False, index=True)  #SHA-256 tou JWT
+    jti = Column(String(32), unique=True, index=True)  #JWT ID claim
+    expires_at = Column(DateTime, nullable=False, index=True)  #Gia to token sweeper
     is_valid = Column(Boolean, default=True, nullable=False)
+    revoked_at = Column(DateTime, index=True)  #Gia incremental refresh tou revocation list
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
+    #Constraints
+    __table_args__ = (
+        #Gia to invalidation UPDATE ... WHERE user_id AND is_valid sto login
+        Index('ix_auth_tokens_user_id_is_valid', 'user_id', 'is_valid'),
+    )
+    
     #Relationships
     user = relationship("User", back_populates="tokens")
\ No newline at end of file
@@ -2,5 +2,6 @@ from app.routes.auth import router as auth_router
 from app.routes.users import router as users_router
 from app.routes.programs import router as programs_router
 from app.routes.screenings import router as screenings_router
+from app.routes.admin import router as admin_router
 
-__all__ = ['auth_router', 'users_router', 'programs_router', 'screenings_router']
\ No newline at end of file
+__all__ = ['auth_router', 'users_router', 'programs_router', 'screenings_router', 'admin_router']
\ No newline at end of file
@@ -0,0 +1,104 @@
+from fastapi import APIRouter, Depends, status
+
+from app.utils.dependencies import get_admin_user
+from app.utils.token_cache import token_cache
+from app.utils.program_cache import program_cache
+from app.utils.password_pool import password_pool
+from app.utils.revocation import revocation_list
+from app.utils.token_sweeper import token_sweeper
+from app.utils.auto_reject_jobs import auto_reject_jobs
+from app.database import engine, replica_set
+from app.utils.slow_query_log import slow_query_log
+from app.models.user import User
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/metrics/token-cache")
+def get_token_cache_metrics(admin_user: User = Depends(get_admin_user)):
+    """
+    Statistika tou token cache (hits, misses, evictions) gia ton current worker
+    """
+    return token_cache.stats()
+
+
+@router.get("/metrics/program-cache")
+def get_program_cache_metrics(admin_user: User = Depends(get_admin_user)):
+    """
+    Statistika tou program cache (roles kai program state) gia ton current worker
+    """
+    return program_cache.stats()
+
+
+@router.get("/metrics/password-pool")
+def get_password_pool_metrics(admin_user: User = Depends(get_admin_user)):
+    """
+    Statistika tou password hashing pool (queue wait kai hash time)
+    """
+    return password_pool.stats()
+
+
+@router.get("/metrics/revocation-list")
+def get_revocation_list_metrics(admin_user: User = Depends(get_admin_user)):
+    """
+    Megethos kai teleutaio refresh tou revocation list (stateless JWT mode)
+    """
+    return revocation_list.stats()
+
+
+@router.get("/metrics/token-sweeper")
+def get_token_sweeper_metrics(admin_user: User = Depends(get_admin_user)):
+    """
+    Statistika tou sweeper gia ta expired tokens
+    """
+    return token_sweeper.stats()
+
+
+@router.get("/jobs/auto-reject")
+def get_auto_reject_jobs(admin_user: User = Depends(get_admin_user)):
+    """
+    Ta auto-rejection jobs tou current worker (ta pio prosfata prota)
+    """
+    return {**auto_reject_jobs.stats(), "recent": auto_reject_jobs.jobs()}
+
+
+@router.get("/db/pool")
+def get_db_pool_metrics(admin_user: User = Depends(get_admin_user)):
+    """
+    Katastasi tou connection pool (checked out, overflow) kai checkout wait times
+    """
+    #To sqlite:// (":memory:") exei ena mono connection (StaticPool, xoris metrics)
+    if not hasattr(engine.pool, "stats"):
+        return {"pool": engine.pool.status()}
+    return engine.pool.stats()
+
+
+@router.get("/db/replicas")
+def get_db_replica_metrics(admin_user: User = Depends(get_admin_user)):
+    """
+    Katastasi ton read replicas (lag, usable, sessions ana replica)
+    """
+    return replica_set.stats()
+
+
+@router.get("/db/slow-queries")
+def get_slow_queries(
+    limit: int = 50,
+    admin_user: User = Depends(get_admin_user)
+):
+    """
+    Ta teleutaia slow queries (normalized SQL, route, duration, EXPLAIN plan)
+    """
+    return {
+        **slow_query_log.stats(),
+        "entries": slow_query_log.entries()[:limit]
+    }
+
+
+@router.delete("/db/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(admin_user: User = Depends(get_admin_user)):
+    """
+    Adeiasma tou slow query buffer
+    """
+    slow_query_log.clear()
+    return None
\ No newline at end of file
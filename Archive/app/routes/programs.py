@@ -1,15 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_async_read_db
 from app.schemas.program import (
     ProgramCreate, ProgramUpdate, ProgramResponse,
     ProgramStateUpdate, ProgramRoleAdd, ProgramSearchParams,
     ProgramRoleResponse
 )
 from app.services.program_service import ProgramService
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_current_user, get_current_user_async
 from app.models.user import User
 from app.models.program import ProgramState
 
@@ -31,14 +32,14 @@ def create_program(
 
 
 @router.get("/search", response_model=List[ProgramResponse])
-def search_programs(
+async def search_programs(
     name: Optional[str] = Query(None),
     description: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     film_title: Optional[str] = Query(None),
     auditorium: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Anazitisi programs (xoris authentication)
@@ -55,20 +56,20 @@ def search_programs(
         auditorium=auditorium
     )
     
-    programs = ProgramService.search_programs(db, search_params, None)
+    programs = await ProgramService.search_programs_async(db, search_params, None)
     return programs
 
 
 @router.get("/search/authenticated", response_model=List[ProgramResponse])
-def search_programs_authenticated(
+async def search_programs_authenticated(
     name: Optional[str] = Query(None),
     description: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     film_title: Optional[str] = Query(None),
     auditorium: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Anazitisi programs (authenticated)
@@ -85,34 +86,34 @@ def search_programs_authenticated(
         auditorium=auditorium
     )
     
-    programs = ProgramService.search_programs(db, search_params, current_user)
+    programs = await ProgramService.search_programs_async(db, search_params, current_user)
     return programs
 
 
 @router.get("/{program_id}", response_model=ProgramResponse)
-def get_program(
+async def get_program(
     program_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Pairnei details enos program (xoris authentication)
     VISITOR vlepei mono ANNOUNCED programs
     """
-    program = ProgramService.get_program_details(db, program_id, None)
+    program = await ProgramService.get_program_details_async(db, program_id, None)
     return program
 
 
 @router.get("/{program_id}/authenticated", response_model=ProgramResponse)
-def get_program_authenticated(
+async def get_program_authenticated(
     program_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Pairnei details enos program (authenticated)
     Vlepei analoga me to role tou
     """
-    program = ProgramService.get_program_details(db, program_id, current_user)
+    program = await ProgramService.get_program_details_async(db, program_id, current_user)
     return program
 
 
@@ -1,15 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_async_read_db
 from app.schemas.screening import (
     ScreeningCreate, ScreeningUpdate, ScreeningResponse,
     ScreeningReview, ScreeningApproval, ScreeningRejection,
-    HandlerAssignment, ScreeningSearchParams
+    HandlerAssignment, ScreeningSearchParams, BulkScreeningReview,
+    BulkScreeningApproval, BulkScreeningRejection, BulkScreeningAccept,
+    BulkScreeningResult
 )
 from app.services.screening_service import ScreeningService
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_current_user, get_current_user_async
 from app.models.user import User
 
 router = APIRouter(prefix="/screenings", tags=["Screenings"])
@@ -30,14 +33,14 @@ def create_screening(
 
 
 @router.get("/program/{program_id}/search", response_model=List[ScreeningResponse])
-def search_screenings(
+async def search_screenings(
     program_id: int,
     film_title: Optional[str] = Query(None),
     film_cast: Optional[str] = Query(None),
     film_genre: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Anazitisi screenings mesa se ena program (xoris authentication)
@@ -53,20 +56,20 @@ def search_screenings(
         end_date=datetime.fromisoformat(end_date) if end_date else None
     )
     
-    screenings = ScreeningService.search_screenings(db, program_id, search_params, None)
+    screenings = await ScreeningService.search_screenings_async(db, program_id, search_params, None)
     return screenings
 
 
 @router.get("/program/{program_id}/search/authenticated", response_model=List[ScreeningResponse])
-def search_screenings_authenticated(
+async def search_screenings_authenticated(
     program_id: int,
     film_title: Optional[str] = Query(None),
     film_cast: Optional[str] = Query(None),
     film_genre: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Anazitisi screenings mesa se ena program (authenticated)
@@ -82,34 +85,34 @@ def search_screenings_authenticated(
         end_date=datetime.fromisoformat(end_date) if end_date else None
     )
     
-    screenings = ScreeningService.search_screenings(db, program_id, search_params, current_user)
+    screenings = await ScreeningService.search_screenings_async(db, program_id, search_params, current_user)
     return screenings
 
 
 @router.get("/{screening_id}", response_model=ScreeningResponse)
-def get_screening(
+async def get_screening(
     screening_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Pairnei details enos screening (xoris authentication)
     VISITOR vlepei mono SCHEDULED se ANNOUNCED programs
     """
-    screening = ScreeningService.get_screening_details(db, screening_id, None)
+    screening = await ScreeningService.get_screening_details_async(db, screening_id, None)
     return screening
 
 
 @router.get("/{screening_id}/authenticated", response_model=ScreeningResponse)
-def get_screening_authenticated(
+async def get_screening_authenticated(
     screening_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Pairnei details enos screening (authenticated)
     Access control analoga me role
     """
-    screening = ScreeningService.get_screening_details(db, screening_id, current_user)
+    screening = await ScreeningService.get_screening_details_async(db, screening_id, current_user)
     return screening
 
 
@@ -245,6 +248,62 @@ def accept_screening(
     return screening
 
 
+@router.post("/program/{program_id}/bulk/review", response_model=BulkScreeningResult)
+def bulk_review_screenings(
+    program_id: int,
+    bulk_data: BulkScreeningReview,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Review polla screenings tou program (ena transaction, apotelesma ana item)
+    Mono o assigned STAFF handler kathe screening kai mono se REVIEW state
+    """
+    return ScreeningService.bulk_review_screenings(db, program_id, bulk_data, current_user)
+
+
+@router.post("/program/{program_id}/bulk/approve", response_model=BulkScreeningResult)
+def bulk_approve_screenings(
+    program_id: int,
+    bulk_data: BulkScreeningApproval,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Approval polla screenings tou program (ena transaction, apotelesma ana item)
+    Mono o SUBMITTER kathe screening kai mono se SCHEDULING state
+    """
+    return ScreeningService.bulk_approve_screenings(db, program_id, bulk_data, current_user)
+
+
+@router.post("/program/{program_id}/bulk/reject", response_model=BulkScreeningResult)
+def bulk_reject_screenings(
+    program_id: int,
+    bulk_data: BulkScreeningRejection,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Rejection polla screenings tou program (ena transaction, apotelesma ana item)
+    Mono PROGRAMMER se SCHEDULING i DECISION state
+    """
+    return ScreeningService.bulk_reject_screenings(db, program_id, bulk_data, current_user)
+
+
+@router.post("/program/{program_id}/bulk/accept", response_model=BulkScreeningResult)
+def bulk_accept_screenings(
+    program_id: int,
+    bulk_data: BulkScreeningAccept,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Teliki apodoxi pollon screenings tou program (ena transaction, apotelesma ana item)
+    Mono PROGRAMMER kai mono se DECISION state
+    """
+    return ScreeningService.bulk_accept_screenings(db, program_id, bulk_data, current_user)
+
+
 @router.post("/program/{program_id}/auto-reject", status_code=status.HTTP_200_OK)
 def auto_reject_non_submitted(
     program_id: int,
@@ -253,7 +312,8 @@ def auto_reject_non_submitted(
 ):
     """
     Auto-rejection gia approved screenings pou den kanane final submit
-    Kaleitai otan to program paei se DECISION state
+    To transition se DECISION to kanei idi sto background (auto-reject/job),
+    to endpoint to ektelei amesws (p.x. an to job diakopike)
     Mono PROGRAMMER mporei na to kalei
     """
     from app.utils.dependencies import get_user_program_role
@@ -272,4 +332,35 @@ def auto_reject_non_submitted(
     return {
         "message": f"Auto-rejected {count} screenings",
         "count": count
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/program/{program_id}/auto-reject/job")
+def get_auto_reject_job(
+    program_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Status tou teleutaiou auto-rejection job tou program (progress, rejected)
+    Mono PROGRAMMER
+    """
+    from app.utils.dependencies import get_user_program_role
+    from app.utils.auto_reject_jobs import auto_reject_jobs
+    from app.models.program import ProgramRoleType
+    
+    #Elegxos permissions
+    user_role = get_user_program_role(current_user.id, program_id, db)
+    if user_role != ProgramRoleType.PROGRAMMER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only programmers can view auto-rejection jobs"
+        )
+    
+    job = auto_reject_jobs.latest(program_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No auto-rejection job for this program"
+        )
+    return job
\ No newline at end of file
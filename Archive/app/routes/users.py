@@ -2,17 +2,17 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.user import UserResponse, UserUpdate, PasswordUpdate
 from app.services.user_service import UserService
-from app.utils.dependencies import get_current_user, get_admin_user
+from app.utils.dependencies import get_current_user, get_current_user_async, get_admin_user
 from app.models.user import User
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: User = Depends(get_current_user_async)):
     """
     Pairnei ta stoixeia tou current user
     """
@@ -24,7 +24,7 @@ def get_all_users(
     skip: int = 0,
     limit: int = 100,
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Pairnei ola ta users (mono gia ADMIN)
@@ -37,7 +37,7 @@ def get_all_users(
 def get_user(
     user_id: int,
     admin_user: User = Depends(get_admin_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Pairnei user me vasi to id (mono gia ADMIN)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 from app.models.screening import ScreeningState
@@ -51,6 +51,53 @@ class HandlerAssignment(BaseModel):
     handler_id: int
 
 
+#Bulk endpoints: to poli toses screenings ana request
+MAX_BULK_ITEMS = 500
+
+
+class BulkReviewItem(ScreeningReview):
+    screening_id: int
+
+
+class BulkApprovalItem(ScreeningApproval):
+    screening_id: int
+
+
+class BulkRejectionItem(ScreeningRejection):
+    screening_id: int
+
+
+class BulkScreeningReview(BaseModel):
+    items: List[BulkReviewItem] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkScreeningApproval(BaseModel):
+    items: List[BulkApprovalItem] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkScreeningRejection(BaseModel):
+    items: List[BulkRejectionItem] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkScreeningAccept(BaseModel):
+    screening_ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    screening_id: int
+    success: bool
+    status_code: int  #To status pou tha epestrefe to antistoixo single endpoint
+    detail: Optional[str] = None
+    state: Optional[str] = None  #To neo state (mono gia success)
+
+
+class BulkScreeningResult(BaseModel):
+    program_id: int
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+
 class ScreeningResponse(BaseModel):
     id: int
     program_id: int
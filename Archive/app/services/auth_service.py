@@ -1,12 +1,19 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import update, case
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 
 from app.models.user import User, AuthToken, UserRole
 from app.schemas.user import UserCreate, UserLogin
-from app.utils.security import verify_password, get_password_hash, generate_token_for_user
+from app.utils.security import generate_token_for_user, generate_token_id, token_digest, decode_access_token
+from app.utils.password_pool import verify_and_update_password_pooled, get_password_hash_pooled
+from app.utils.revocation import revoke_on_commit
+from app.config import get_settings
 from app.utils.validators import validate_username, validate_password
 
+settings = get_settings()
+
 
 class AuthService:
     
@@ -39,7 +46,7 @@ class AuthService:
             )
         
         #Hash password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = get_password_hash_pooled(user_data.password)
         
         #Dimiourgia user (inactive by default)
         new_user = User(
@@ -63,6 +70,9 @@ class AuthService:
         """
         Authentication tou user kai dimiourgia token
         
+        Round trips: SELECT user, UPDATE user (mono an xreiazetai),
+        UPDATE palia tokens, INSERT neo token, COMMIT
+        
         Returns:
             Tuple (user, token)
         """
@@ -76,20 +86,37 @@ class AuthService:
             )
         
         #Elegxos password
-        if not verify_password(login_data.password, user.password_hash):
-            #Auxisi failed attempts
-            user.failed_login_attempts += 1
+        is_valid_password, new_password_hash = verify_and_update_password_pooled(
+            login_data.password, user.password_hash
+        )
+        
+        if not is_valid_password:
+            failed_attempts = user.failed_login_attempts + 1
+            
+            #Atomiki auxisi failed attempts kai deactivate stis 3, se ena UPDATE
+            #To is_active prepei na einai proto: to MySQL ypologizei ta SET apo
+            #aristera pros ta deksia me tis nees times
+            db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .ordered_values(
+                    (User.is_active, case(
+                        (User.failed_login_attempts + 1 >= 3, False),
+                        else_=User.is_active
+                    )),
+                    (User.failed_login_attempts, User.failed_login_attempts + 1)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
             
             #An exei 3 failed attempts, deactivate
-            if user.failed_login_attempts >= 3:
-                user.is_active = False
-                db.commit()
+            if failed_attempts >= 3:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Account deactivated due to multiple failed login attempts"
                 )
             
-            db.commit()
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
@@ -102,29 +129,46 @@ class AuthService:
                 detail="Account is not active"
             )
         
-        #Reset failed attempts
-        user.failed_login_attempts = 0
+        #Reset failed attempts kai transparent rehash (an to hash exei palio
+        #cost i scheme) se ena UPDATE, mono an allazei kati
+        user_updates = {}
+        if user.failed_login_attempts:
+            user_updates["failed_login_attempts"] = 0
+        if new_password_hash:
+            user_updates["password_hash"] = new_password_hash
+        
+        if user_updates:
+            db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(**user_updates)
+                .execution_options(synchronize_session=False)
+            )
+            for key, value in user_updates.items():
+                set_committed_value(user, key, value)
         
         #Invalidate ola ta palia tokens
-        db.query(AuthToken).filter(
-            AuthToken.user_id == user.id,
-            AuthToken.is_valid == True
-        ).update({"is_valid": False})
+        AuthService.invalidate_user_tokens(db, user.id)
         
         #Dimiourgia neou token
-        token, expire_time = generate_token_for_user(user.id, user.username)
+        jti = generate_token_id()
+        token, expire_time = generate_token_for_user(user.id, user.username, jti)
         
         #Apothikeusi token sti vasi
         new_token = AuthToken(
             user_id=user.id,
-            token=token,
+            token_hash=token_digest(token),
+            jti=jti,
             expires_at=expire_time,
             is_valid=True
         )
         
         db.add(new_token)
+        
+        #O user vgainei apo to session prin to commit, gia na min ginei expire
+        #kai na min xreiazetai refresh gia to response
+        db.expunge(user)
         db.commit()
-        db.refresh(user)
         
         return user, token
     
@@ -135,10 +179,7 @@ class AuthService:
         Logout user kai invalidate token
         """
         #Invalidate to token
-        db.query(AuthToken).filter(
-            AuthToken.token == token,
-            AuthToken.user_id == user.id
-        ).update({"is_valid": False})
+        AuthService.invalidate_token(db, token, user.id)
         
         db.commit()
     
@@ -171,10 +212,7 @@ class AuthService:
             )
         
         #Invalidate ola ta tokens tou target user
-        db.query(AuthToken).filter(
-            AuthToken.user_id == target_user_id,
-            AuthToken.is_valid == True
-        ).update({"is_valid": False})
+        AuthService.invalidate_user_tokens(db, target_user_id)
         
         db.commit()
     
@@ -183,7 +221,7 @@ class AuthService:
     def validate_token(db: Session, token: str) -> bool:
         #Elegxos an to token einai valid
         db_token = db.query(AuthToken).filter(
-            AuthToken.token == token,
+            AuthToken.token_hash == token_digest(token),
             AuthToken.is_valid == True
         ).first()
         
@@ -196,4 +234,46 @@ class AuthService:
             db.commit()
             return False
         
-        return True
\ No newline at end of file
+        return True
+    
+    
+    @staticmethod
+    def invalidate_user_tokens(db: Session, user_id: int) -> None:
+        """
+        Invalidate ola ta valid tokens enos user (xoris commit)
+        To token cache kai to revocation list enimeronontai meta to commit
+        """
+        revoked_tokens = []
+        if settings.AUTH_STATELESS_JWT:
+            revoked_tokens = db.query(AuthToken.jti, AuthToken.expires_at).filter(
+                AuthToken.user_id == user_id,
+                AuthToken.is_valid == True,
+                AuthToken.jti != None
+            ).all()
+        
+        db.query(AuthToken).filter(
+            AuthToken.user_id == user_id,
+            AuthToken.is_valid == True
+        ).update({"is_valid": False, "revoked_at": datetime.utcnow()})
+        
+        revoke_on_commit(db, user_id, revoked_tokens=revoked_tokens)
+    
+    
+    @staticmethod
+    def invalidate_token(db: Session, token: str, user_id: int) -> None:
+        """
+        Invalidate enos sygkekrimenou token (xoris commit)
+        """
+        digest = token_digest(token)
+        
+        db.query(AuthToken).filter(
+            AuthToken.token_hash == digest,
+            AuthToken.user_id == user_id
+        ).update({"is_valid": False, "revoked_at": datetime.utcnow()})
+        
+        revoked_tokens = []
+        payload = decode_access_token(token)
+        if payload and payload.get("jti"):
+            revoked_tokens.append((payload["jti"], datetime.utcfromtimestamp(payload["exp"])))
+        
+        revoke_on_commit(db, user_id, digest=digest, revoked_tokens=revoked_tokens)
\ No newline at end of file
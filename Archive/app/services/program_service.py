@@ -1,5 +1,7 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import or_, and_, select
+from sqlalchemy.sql import Select
 from fastapi import HTTPException, status
 from typing import List, Optional
 from datetime import date
@@ -7,7 +9,13 @@ from datetime import date
 from app.models.user import User, UserRole
 from app.models.program import Program, ProgramRole, ProgramState, ProgramRoleType
 from app.schemas.program import ProgramCreate, ProgramUpdate, ProgramSearchParams
-from app.utils.dependencies import get_user_program_role
+from app.utils.dependencies import get_user_program_role, get_user_program_roles, get_user_program_role_async
+from app.utils import statements
+from app.utils.request_memo import get_request_memo
+from app.utils.program_cache import program_cache, invalidate_on_commit
+from app.config import get_settings
+
+settings = get_settings()
 
 
 class ProgramService:
@@ -53,6 +61,8 @@ class ProgramService:
         )
         
         db.add(creator_role)
+        #To id mporei na ksanadothei (SQLite meta apo delete): kanena cached role
+        invalidate_on_commit(db, new_program.id)
         db.commit()
         db.refresh(new_program)
         
@@ -62,17 +72,53 @@ class ProgramService:
     @staticmethod
     def get_program_by_id(db: Session, program_id: int) -> Program:
         """
-        Pairnei program me vasi to id
+        Pairnei program me vasi to id (mia fora ana request, meta apo to memo)
         """
-        program = db.query(Program).filter(Program.id == program_id).first()
+        memo = get_request_memo(db)
+        program = memo.programs.get(program_id)
+        if program is not None:
+            return program
+        
+        generation = program_cache.generation
+        program = db.scalars(statements.program_by_id(program_id)).first()
         if not program:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Program not found"
             )
+        
+        memo.programs[program_id] = program
+        program_cache.set_state(db, program_id, program.state, generation)
         return program
     
     
+    @staticmethod
+    def get_program_state(db: Session, program_id: int) -> ProgramState:
+        """
+        Pairnei mono to state enos program (404 an den yparxei)
+        Gia tous elegxous pou den xreiazontai olo to Program: apo to memo,
+        to program cache i me SELECT mono tou state
+        """
+        program = get_request_memo(db).programs.get(program_id)
+        if program is not None:
+            return program.state
+        
+        state = program_cache.get_state(db, program_id)
+        if state is not None:
+            return state
+        
+        generation = program_cache.generation
+        state = db.scalars(statements.program_state(program_id)).first()
+        if state is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Program not found"
+            )
+        
+        program_cache.set_state(db, program_id, state, generation)
+        return state
+    
+    
     @staticmethod
     def update_program(
         db: Session,
@@ -161,6 +207,8 @@ class ProgramService:
             )
         
         db.delete(program)
+        get_request_memo(db).forget_program(program_id)
+        invalidate_on_commit(db, program_id)
         db.commit()
     
     
@@ -205,7 +253,16 @@ class ProgramService:
             )
         
         program.state = new_state
+        get_request_memo(db).forget_program(program_id)
+        invalidate_on_commit(db, program_id)
         db.commit()
+        
+        #Auto-rejection ton screenings xoris final submit sto background
+        #(to request den perimenei, to status sto .../auto-reject/job)
+        if new_state == ProgramState.DECISION and settings.AUTO_REJECT_ON_DECISION:
+            from app.utils.auto_reject_jobs import auto_reject_jobs
+            auto_reject_jobs.enqueue(program_id)
+        
         db.refresh(program)
         
         return program
@@ -222,7 +279,8 @@ class ProgramService:
         Prosthiki PROGRAMMER se program
         Mono PROGRAMMER mporei na prosthesei allous
         """
-        program = ProgramService.get_program_by_id(db, program_id)
+        #Elegxos an yparxei to program
+        ProgramService.get_program_state(db, program_id)
         
         #Elegxos permissions
         user_role = get_user_program_role(current_user.id, program_id, db)
@@ -237,13 +295,7 @@ class ProgramService:
         target_user = UserService.get_user_by_id(db, user_id)
         
         #Elegxos an einai idi PROGRAMMER
-        existing_role = db.query(ProgramRole).filter(
-            ProgramRole.user_id == user_id,
-            ProgramRole.program_id == program_id,
-            ProgramRole.role == ProgramRoleType.PROGRAMMER
-        ).first()
-        
-        if existing_role:
+        if ProgramRoleType.PROGRAMMER in get_user_program_roles(user_id, program_id, db):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User is already a programmer for this program"
@@ -257,6 +309,8 @@ class ProgramService:
         )
         
         db.add(new_role)
+        get_request_memo(db).forget_roles(user_id, program_id)
+        invalidate_on_commit(db, program_id, user_id)
         db.commit()
         db.refresh(new_role)
         
@@ -275,7 +329,7 @@ class ProgramService:
         Mono PROGRAMMER mporei na prosthesei STAFF
         Meta to SUBMISSION state, to STAFF set einai frozen
         """
-        program = ProgramService.get_program_by_id(db, program_id)
+        program_state = ProgramService.get_program_state(db, program_id)
         
         #Elegxos permissions
         user_role = get_user_program_role(current_user.id, program_id, db)
@@ -286,7 +340,7 @@ class ProgramService:
             )
         
         #Meta to SUBMISSION, to STAFF set einai frozen
-        if program.state not in [ProgramState.CREATED, ProgramState.SUBMISSION]:
+        if program_state not in [ProgramState.CREATED, ProgramState.SUBMISSION]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot add staff after SUBMISSION state"
@@ -297,13 +351,7 @@ class ProgramService:
         target_user = UserService.get_user_by_id(db, user_id)
         
         #Elegxos an einai idi STAFF
-        existing_role = db.query(ProgramRole).filter(
-            ProgramRole.user_id == user_id,
-            ProgramRole.program_id == program_id,
-            ProgramRole.role == ProgramRoleType.STAFF
-        ).first()
-        
-        if existing_role:
+        if ProgramRoleType.STAFF in get_user_program_roles(user_id, program_id, db):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User is already staff for this program"
@@ -317,6 +365,8 @@ class ProgramService:
         )
         
         db.add(new_role)
+        get_request_memo(db).forget_roles(user_id, program_id)
+        invalidate_on_commit(db, program_id, user_id)
         db.commit()
         db.refresh(new_role)
         
@@ -333,50 +383,78 @@ class ProgramService:
         Anazitisi programs me filters
         Ta results filtraronte analoga me to user role
         """
-        query = db.query(Program)
+        #Ta program_roles tou ProgramResponse me ena SELECT ... IN (oxi ena ana program)
+        statement = ProgramService._search_statement(search_params, current_user)
+        results = db.execute(statement.options(selectinload(Program.program_roles))).scalars().all()
+        
+        return results
+    
+    
+    @staticmethod
+    async def search_programs_async(
+        db: AsyncSession,
+        search_params: ProgramSearchParams,
+        current_user: Optional[User] = None
+    ) -> List[Program]:
+        """
+        Async ekdosi tou search_programs
+        Ta program_roles fortonontai me ena SELECT ... IN (selectinload)
+        """
+        statement = ProgramService._search_statement(search_params, current_user)
+        result = await db.execute(statement.options(selectinload(Program.program_roles)))
+        
+        return result.scalars().all()
+    
+    
+    @staticmethod
+    def _search_statement(
+        search_params: ProgramSearchParams,
+        current_user: Optional[User] = None
+    ) -> Select:
+        #Koino SELECT gia to sync kai to async search
+        query = select(Program)
         
         #Filters
         if search_params.name:
-            query = query.filter(Program.name.ilike(f"%{search_params.name}%"))
+            query = query.where(Program.name.ilike(f"%{search_params.name}%"))
         
         if search_params.description:
-            query = query.filter(Program.description.ilike(f"%{search_params.description}%"))
+            query = query.where(Program.description.ilike(f"%{search_params.description}%"))
         
         if search_params.start_date:
-            query = query.filter(Program.start_date >= search_params.start_date)
+            query = query.where(Program.start_date >= search_params.start_date)
         
         if search_params.end_date:
-            query = query.filter(Program.end_date <= search_params.end_date)
+            query = query.where(Program.end_date <= search_params.end_date)
         
         #Film title filter (prepei na psaxei sta screenings)
         if search_params.film_title:
             from app.models.screening import Screening
-            query = query.join(Screening).filter(
+            query = query.join(Screening).where(
                 Screening.film_title.ilike(f"%{search_params.film_title}%")
             ).distinct()
         
         #Auditorium filter
         if search_params.auditorium:
             from app.models.screening import Screening
-            query = query.join(Screening).filter(
+            query = query.join(Screening).where(
                 Screening.auditorium_name.ilike(f"%{search_params.auditorium}%")
             ).distinct()
         
         #Role-based filtering
         if not current_user:
             #VISITOR: mono ANNOUNCED programs
-            query = query.filter(Program.state == ProgramState.ANNOUNCED)
+            query = query.where(Program.state == ProgramState.ANNOUNCED)
         else:
             #Authenticated users: vlepoun programs analoga me to role tous
             if current_user.role != UserRole.ADMIN:
-                #Pairnei ta program IDs pou exei role o user
-                user_program_ids = db.query(ProgramRole.program_id).filter(
+                #Ta program IDs pou exei role o user (subquery, oxi ksexoristo query)
+                user_program_ids = select(ProgramRole.program_id).where(
                     ProgramRole.user_id == current_user.id
-                ).all()
-                user_program_ids = [pid[0] for pid in user_program_ids]
+                )
                 
                 #Vlepei: (a) ANNOUNCED programs KAI (b) programs pou exei role
-                query = query.filter(
+                query = query.where(
                     or_(
                         Program.state == ProgramState.ANNOUNCED,
                         Program.id.in_(user_program_ids)
@@ -384,9 +462,7 @@ class ProgramService:
                 )
         
         #Sorting: prota me date, meta me name
-        results = query.order_by(Program.start_date, Program.name).all()
-        
-        return results
+        return query.order_by(Program.start_date, Program.name)
     
     
     @staticmethod
@@ -401,6 +477,63 @@ class ProgramService:
         """
         program = ProgramService.get_program_by_id(db, program_id)
         
+        #O role xreiazetai mono gia authenticated, oxi ADMIN users
+        user_role = None
+        if current_user and current_user.role != UserRole.ADMIN:
+            user_role = get_user_program_role(current_user.id, program_id, db)
+        
+        ProgramService._check_program_access(program, user_role, current_user)
+        return program
+    
+    
+    @staticmethod
+    async def get_program_by_id_async(
+        db: AsyncSession,
+        program_id: int,
+        load_roles: bool = False
+    ) -> Program:
+        """
+        Async ekdosi tou get_program_by_id
+        
+        Args:
+            load_roles: Fortosi kai ton program_roles (gia to ProgramResponse,
+                        den ginetai lazy load se AsyncSession)
+        """
+        options = [selectinload(Program.program_roles)] if load_roles else []
+        program = await db.get(Program, program_id, options=options)
+        if not program:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Program not found"
+            )
+        return program
+    
+    
+    @staticmethod
+    async def get_program_details_async(
+        db: AsyncSession,
+        program_id: int,
+        current_user: Optional[User] = None
+    ) -> Program:
+        """
+        Async ekdosi tou get_program_details
+        """
+        program = await ProgramService.get_program_by_id_async(db, program_id, load_roles=True)
+        
+        user_role = None
+        if current_user and current_user.role != UserRole.ADMIN:
+            user_role = await get_user_program_role_async(current_user.id, program_id, db)
+        
+        ProgramService._check_program_access(program, user_role, current_user)
+        return program
+    
+    
+    @staticmethod
+    def _check_program_access(
+        program: Program,
+        user_role: Optional[ProgramRoleType],
+        current_user: Optional[User]
+    ) -> None:
         #Elegxos access rights
         if not current_user:
             #VISITOR: mono ANNOUNCED programs
@@ -410,15 +543,11 @@ class ProgramService:
                     detail="Program not accessible"
                 )
         else:
-            #Authenticated users
+            #Authenticated users (o ADMIN vlepei ola)
             if current_user.role != UserRole.ADMIN:
-                user_role = get_user_program_role(current_user.id, program_id, db)
-                
                 #An den einai ANNOUNCED kai den exei role, den to vlepei
                 if program.state != ProgramState.ANNOUNCED and not user_role:
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
                         detail="Program not accessible"
-                    )
-        
-        return program
\ No newline at end of file
+                    )
\ No newline at end of file
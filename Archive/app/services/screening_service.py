@@ -1,21 +1,30 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, delete, select, update
+from sqlalchemy.sql import Select
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
 
+from app.config import get_settings
 from app.models.user import User, UserRole
 from app.models.program import Program, ProgramRole, ProgramState, ProgramRoleType
 from app.models.screening import Screening, ScreeningState
 from app.schemas.screening import (
     ScreeningCreate, ScreeningUpdate, ScreeningReview,
     ScreeningApproval, ScreeningRejection, HandlerAssignment,
-    ScreeningSearchParams
+    ScreeningSearchParams, BulkScreeningReview, BulkScreeningApproval,
+    BulkScreeningRejection, BulkScreeningAccept
 )
-from app.utils.dependencies import get_user_program_role
+from app.utils.dependencies import get_user_program_role, get_user_program_roles, get_user_program_role_async
+from app.utils import statements
+from app.utils.request_memo import get_request_memo
+from app.utils.program_cache import invalidate_on_commit
 from app.services.program_service import ProgramService
 
+settings = get_settings()
+
 
 class ScreeningService:
     
@@ -26,11 +35,11 @@ class ScreeningService:
         O dimiourgos ginete automatically SUBMITTER
         """
         #Elegxos an yparxei to program
-        program = ProgramService.get_program_by_id(db, screening_data.program_id)
+        ProgramService.get_program_state(db, screening_data.program_id)
         
         #Elegxos an o creator einai PROGRAMMER tou idiou program
-        user_role = get_user_program_role(creator.id, screening_data.program_id, db)
-        if user_role == ProgramRoleType.PROGRAMMER:
+        creator_roles = get_user_program_roles(creator.id, screening_data.program_id, db)
+        if ProgramRoleType.PROGRAMMER in creator_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Programmers cannot submit screenings in their own program"
@@ -54,19 +63,15 @@ class ScreeningService:
         db.flush()
         
         #Prosthiki tou creator os SUBMITTER sto program (an den einai idi)
-        existing_submitter_role = db.query(ProgramRole).filter(
-            ProgramRole.user_id == creator.id,
-            ProgramRole.program_id == screening_data.program_id,
-            ProgramRole.role == ProgramRoleType.SUBMITTER
-        ).first()
-        
-        if not existing_submitter_role:
+        if ProgramRoleType.SUBMITTER not in creator_roles:
             submitter_role = ProgramRole(
                 user_id=creator.id,
                 program_id=screening_data.program_id,
                 role=ProgramRoleType.SUBMITTER
             )
             db.add(submitter_role)
+            get_request_memo(db).forget_roles(creator.id, screening_data.program_id)
+            invalidate_on_commit(db, screening_data.program_id, creator.id)
         
         db.commit()
         db.refresh(new_screening)
@@ -79,7 +84,7 @@ class ScreeningService:
         """
         Pairnei screening me vasi to id
         """
-        screening = db.query(Screening).filter(Screening.id == screening_id).first()
+        screening = db.scalars(statements.screening_by_id(screening_id)).first()
         if not screening:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -166,8 +171,27 @@ class ScreeningService:
         Prepei na einai complete (film, auditorium, times)
         To program prepei na einai se SUBMISSION state
         """
-        screening = ScreeningService.get_screening_by_id(db, screening_id)
-        
+        return ScreeningService._transition(
+            db,
+            screening_id,
+            guards=[
+                Screening.submitter_id == current_user.id,
+                Screening.state == ScreeningState.CREATED,
+                ScreeningService._program_in_state(ProgramState.SUBMISSION),
+                #Complete: ta idia pedia me ton elegxo sto _check_submit
+                Screening.film_title != "",
+                Screening.film_duration != 0,
+                Screening.auditorium_name != "",
+                Screening.start_time.isnot(None),
+                Screening.end_time.isnot(None)
+            ],
+            values={"state": ScreeningState.SUBMITTED},
+            check=lambda screening: ScreeningService._check_submit(db, screening, current_user)
+        )
+    
+    
+    @staticmethod
+    def _check_submit(db: Session, screening: Screening, current_user: User) -> None:
         #Elegxos an einai o submitter
         if screening.submitter_id != current_user.id:
             raise HTTPException(
@@ -183,8 +207,8 @@ class ScreeningService:
             )
         
         #Elegxos program state
-        program = ProgramService.get_program_by_id(db, screening.program_id)
-        if program.state != ProgramState.SUBMISSION:
+        program_state = ScreeningService._committed_program_state(db, screening.program_id)
+        if program_state != ProgramState.SUBMISSION:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Program must be in SUBMISSION state"
@@ -202,13 +226,6 @@ class ScreeningService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Screening must be complete (film, auditorium, times required)"
             )
-        
-        #Allagi state
-        screening.state = ScreeningState.SUBMITTED
-        
-        db.commit()
-        db.refresh(screening)
-        return screening
     
     
     @staticmethod
@@ -217,6 +234,19 @@ class ScreeningService:
         Withdraw kai diagrafi screening
         Mono otan einai se CREATED state
         """
+        #DELETE me tous elegxous sto WHERE (opos sto _transition)
+        result = db.execute(
+            delete(Screening).where(
+                Screening.id == screening_id,
+                Screening.submitter_id == current_user.id,
+                Screening.state == ScreeningState.CREATED
+            ).execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            db.commit()
+            return
+        
+        db.rollback()
         screening = ScreeningService.get_screening_by_id(db, screening_id)
         
         #Elegxos an einai o submitter
@@ -233,8 +263,7 @@ class ScreeningService:
                 detail="Can only withdraw screenings in CREATED state"
             )
         
-        db.delete(screening)
-        db.commit()
+        ScreeningService._raise_conflict()
     
     
     @staticmethod
@@ -249,8 +278,26 @@ class ScreeningService:
         Mono PROGRAMMER mporei na kanei assign
         To program prepei na einai se ASSIGNMENT state
         """
-        screening = ScreeningService.get_screening_by_id(db, screening_id)
-        
+        return ScreeningService._transition(
+            db,
+            screening_id,
+            guards=[
+                ScreeningService._has_program_role(current_user.id, ProgramRoleType.PROGRAMMER),
+                ScreeningService._program_in_state(ProgramState.ASSIGNMENT),
+                ScreeningService._has_program_role(handler_data.handler_id, ProgramRoleType.STAFF)
+            ],
+            values={"handler_id": handler_data.handler_id},
+            check=lambda screening: ScreeningService._check_assign_handler(db, screening, handler_data, current_user)
+        )
+    
+    
+    @staticmethod
+    def _check_assign_handler(
+        db: Session,
+        screening: Screening,
+        handler_data: HandlerAssignment,
+        current_user: User
+    ) -> None:
         #Elegxos permissions (prepei na einai PROGRAMMER)
         user_role = get_user_program_role(current_user.id, screening.program_id, db)
         if user_role != ProgramRoleType.PROGRAMMER:
@@ -260,8 +307,8 @@ class ScreeningService:
             )
         
         #Elegxos program state
-        program = ProgramService.get_program_by_id(db, screening.program_id)
-        if program.state != ProgramState.ASSIGNMENT:
+        program_state = ScreeningService._committed_program_state(db, screening.program_id)
+        if program_state != ProgramState.ASSIGNMENT:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Program must be in ASSIGNMENT state"
@@ -274,13 +321,6 @@ class ScreeningService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Handler must be staff member of this program"
             )
-        
-        #Assignment handler
-        screening.handler_id = handler_data.handler_id
-        
-        db.commit()
-        db.refresh(screening)
-        return screening
     
     
     @staticmethod
@@ -294,8 +334,24 @@ class ScreeningService:
         Review screening apo ton assigned STAFF handler
         To program prepei na einai se REVIEW state
         """
-        screening = ScreeningService.get_screening_by_id(db, screening_id)
-        
+        return ScreeningService._transition(
+            db,
+            screening_id,
+            guards=[
+                Screening.handler_id == current_user.id,
+                ScreeningService._program_in_state(ProgramState.REVIEW)
+            ],
+            values={
+                "review_score": review_data.review_score,
+                "review_comments": review_data.review_comments,
+                "state": ScreeningState.REVIEWED
+            },
+            check=lambda screening: ScreeningService._check_review(db, screening, current_user)
+        )
+    
+    
+    @staticmethod
+    def _check_review(db: Session, screening: Screening, current_user: User) -> None:
         #Elegxos an einai o assigned handler
         if screening.handler_id != current_user.id:
             raise HTTPException(
@@ -304,21 +360,12 @@ class ScreeningService:
             )
         
         #Elegxos program state
-        program = ProgramService.get_program_by_id(db, screening.program_id)
-        if program.state != ProgramState.REVIEW:
+        program_state = ScreeningService._committed_program_state(db, screening.program_id)
+        if program_state != ProgramState.REVIEW:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Program must be in REVIEW state"
             )
-        
-        #Prosthiki review
-        screening.review_score = review_data.review_score
-        screening.review_comments = review_data.review_comments
-        screening.state = ScreeningState.REVIEWED
-        
-        db.commit()
-        db.refresh(screening)
-        return screening
     
     
     @staticmethod
@@ -333,8 +380,23 @@ class ScreeningService:
         Mono SUBMITTER mporei na kanei approve
         To program prepei na einai se SCHEDULING state
         """
-        screening = ScreeningService.get_screening_by_id(db, screening_id)
-        
+        return ScreeningService._transition(
+            db,
+            screening_id,
+            guards=[
+                Screening.submitter_id == current_user.id,
+                ScreeningService._program_in_state(ProgramState.SCHEDULING)
+            ],
+            values={
+                "approval_notes": approval_data.approval_notes,
+                "state": ScreeningState.APPROVED
+            },
+            check=lambda screening: ScreeningService._check_approve(db, screening, current_user)
+        )
+    
+    
+    @staticmethod
+    def _check_approve(db: Session, screening: Screening, current_user: User) -> None:
         #Elegxos an einai o submitter
         if screening.submitter_id != current_user.id:
             raise HTTPException(
@@ -343,20 +405,12 @@ class ScreeningService:
             )
         
         #Elegxos program state
-        program = ProgramService.get_program_by_id(db, screening.program_id)
-        if program.state != ProgramState.SCHEDULING:
+        program_state = ScreeningService._committed_program_state(db, screening.program_id)
+        if program_state != ProgramState.SCHEDULING:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Program must be in SCHEDULING state"
             )
-        
-        #Approval
-        screening.approval_notes = approval_data.approval_notes
-        screening.state = ScreeningState.APPROVED
-        
-        db.commit()
-        db.refresh(screening)
-        return screening
     
     
     @staticmethod
@@ -370,8 +424,23 @@ class ScreeningService:
         Rejection screening apo PROGRAMMER
         Mporei na ginei se SCHEDULING i DECISION state
         """
-        screening = ScreeningService.get_screening_by_id(db, screening_id)
-        
+        return ScreeningService._transition(
+            db,
+            screening_id,
+            guards=[
+                ScreeningService._has_program_role(current_user.id, ProgramRoleType.PROGRAMMER),
+                ScreeningService._program_in_state(ProgramState.SCHEDULING, ProgramState.DECISION)
+            ],
+            values={
+                "rejection_reason": rejection_data.rejection_reason,
+                "state": ScreeningState.REJECTED
+            },
+            check=lambda screening: ScreeningService._check_reject(db, screening, current_user)
+        )
+    
+    
+    @staticmethod
+    def _check_reject(db: Session, screening: Screening, current_user: User) -> None:
         #Elegxos permissions (prepei na einai PROGRAMMER)
         user_role = get_user_program_role(current_user.id, screening.program_id, db)
         if user_role != ProgramRoleType.PROGRAMMER:
@@ -381,20 +450,12 @@ class ScreeningService:
             )
         
         #Elegxos program state
-        program = ProgramService.get_program_by_id(db, screening.program_id)
-        if program.state not in [ProgramState.SCHEDULING, ProgramState.DECISION]:
+        program_state = ScreeningService._committed_program_state(db, screening.program_id)
+        if program_state not in [ProgramState.SCHEDULING, ProgramState.DECISION]:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Program must be in SCHEDULING or DECISION state"
             )
-        
-        #Rejection
-        screening.rejection_reason = rejection_data.rejection_reason
-        screening.state = ScreeningState.REJECTED
-        
-        db.commit()
-        db.refresh(screening)
-        return screening
     
     
     @staticmethod
@@ -408,8 +469,21 @@ class ScreeningService:
         Mono SUBMITTER mporei
         To program prepei na einai se FINAL_PUBLICATION state
         """
-        screening = ScreeningService.get_screening_by_id(db, screening_id)
-        
+        return ScreeningService._transition(
+            db,
+            screening_id,
+            guards=[
+                Screening.submitter_id == current_user.id,
+                Screening.state == ScreeningState.APPROVED,
+                ScreeningService._program_in_state(ProgramState.FINAL_PUBLICATION)
+            ],
+            values={"is_finally_submitted": True},
+            check=lambda screening: ScreeningService._check_final_submit(db, screening, current_user)
+        )
+    
+    
+    @staticmethod
+    def _check_final_submit(db: Session, screening: Screening, current_user: User) -> None:
         #Elegxos an einai o submitter
         if screening.submitter_id != current_user.id:
             raise HTTPException(
@@ -425,19 +499,12 @@ class ScreeningService:
             )
         
         #Elegxos program state
-        program = ProgramService.get_program_by_id(db, screening.program_id)
-        if program.state != ProgramState.FINAL_PUBLICATION:
+        program_state = ScreeningService._committed_program_state(db, screening.program_id)
+        if program_state != ProgramState.FINAL_PUBLICATION:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Program must be in FINAL_PUBLICATION state"
             )
-        
-        #Final submission
-        screening.is_finally_submitted = True
-        
-        db.commit()
-        db.refresh(screening)
-        return screening
     
     
     @staticmethod
@@ -452,8 +519,22 @@ class ScreeningService:
         To program prepei na einai se DECISION state
         To screening prepei na einai APPROVED kai finally submitted
         """
-        screening = ScreeningService.get_screening_by_id(db, screening_id)
-        
+        return ScreeningService._transition(
+            db,
+            screening_id,
+            guards=[
+                ScreeningService._has_program_role(current_user.id, ProgramRoleType.PROGRAMMER),
+                ScreeningService._program_in_state(ProgramState.DECISION),
+                Screening.state == ScreeningState.APPROVED,
+                Screening.is_finally_submitted == True
+            ],
+            values={"state": ScreeningState.SCHEDULED},
+            check=lambda screening: ScreeningService._check_accept(db, screening, current_user)
+        )
+    
+    
+    @staticmethod
+    def _check_accept(db: Session, screening: Screening, current_user: User) -> None:
         #Elegxos permissions (prepei na einai PROGRAMMER)
         user_role = get_user_program_role(current_user.id, screening.program_id, db)
         if user_role != ProgramRoleType.PROGRAMMER:
@@ -463,8 +544,8 @@ class ScreeningService:
             )
         
         #Elegxos program state
-        program = ProgramService.get_program_by_id(db, screening.program_id)
-        if program.state != ProgramState.DECISION:
+        program_state = ScreeningService._committed_program_state(db, screening.program_id)
+        if program_state != ProgramState.DECISION:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Program must be in DECISION state"
@@ -476,38 +557,438 @@ class ScreeningService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Screening must be approved and finally submitted"
             )
+    
+    
+    @staticmethod
+    def _transition(
+        db: Session,
+        screening_id: int,
+        guards: list,
+        values: dict,
+        check: Callable[[Screening], None]
+    ) -> Screening:
+        """
+        Atomiki allagi enos screening: ena UPDATE me olous tous elegxous
+        (actor, screening state, program state, roles) sto WHERE
+        
+        Dyo taftoxrona requests den mporoun na perasoun kai ta dyo ton idio
+        elegxo. An to UPDATE den allaksei kanena row, to screening
+        diavazetai ksana kai to check vriskei to swsto error (404/403/400).
+        An to check den vrei tipota, to screening allakse metaksi UPDATE
+        kai read apo allo request: 409.
+        """
+        result = db.execute(
+            update(Screening)
+            .where(Screening.id == screening_id, *guards)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        
+        if result.rowcount == 1:
+            db.commit()
+            return ScreeningService.get_screening_by_id(db, screening_id)
+        
+        #Neo transaction: to read vlepei ta teleutaia committed dedomena
+        db.rollback()
+        screening = ScreeningService.get_screening_by_id(db, screening_id)
+        check(screening)
+        ScreeningService._raise_conflict()
+    
+    
+    @staticmethod
+    def _program_in_state(*states: ProgramState):
+        #Correlated EXISTS: to program tou screening einai se ena apo ta states
+        return select(Program.id).where(
+            Program.id == Screening.program_id,
+            Program.state.in_(states)
+        ).exists()
+    
+    
+    @staticmethod
+    def _has_program_role(user_id: int, role: ProgramRoleType):
+        #To proto role tou user sto program tou screening (opos to get_user_program_role)
+        first_role = select(ProgramRole.role).where(
+            ProgramRole.user_id == user_id,
+            ProgramRole.program_id == Screening.program_id
+        ).order_by(ProgramRole.id).limit(1).scalar_subquery()
+        return first_role == role
+    
+    
+    @staticmethod
+    def _committed_program_state(db: Session, program_id: int) -> Optional[ProgramState]:
+        #Gia ta errors meta apo apotyximeno UPDATE: apo ti vasi, oxi apo to program
+        #cache (allagi apo allon worker fainetai mono meta to version check)
+        return db.scalars(statements.program_state(program_id)).first()
+    
+    
+    @staticmethod
+    def _require_program_state(program_state: ProgramState, program_states: Tuple[ProgramState, ...]) -> None:
+        if program_state not in program_states:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Program must be in {' or '.join(state.value for state in program_states)} state"
+            )
+    
+    
+    @staticmethod
+    def _raise_conflict() -> None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Screening was modified by another request, please retry"
+        )
+    
+    
+    @staticmethod
+    def bulk_review_screenings(
+        db: Session,
+        program_id: int,
+        bulk_data: BulkScreeningReview,
+        current_user: User
+    ) -> dict:
+        """
+        Review polla screenings enos program se ena transaction
+        Idioi kanones me to review_screening, to program state elegxetai mia fora
+        """
+        #Elegxos program state
+        program_states = (ProgramState.REVIEW,)
+        ScreeningService._require_program_state(ProgramService.get_program_state(db, program_id), program_states)
+        
+        def check(screening: Screening, item) -> None:
+            if screening.handler_id != current_user.id:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Only assigned handler can review screening"
+                )
+        
+        items = [(item.screening_id, item) for item in bulk_data.items]
+        return ScreeningService._bulk_apply(
+            db,
+            program_id,
+            items,
+            check,
+            program_states=program_states,
+            guards=[
+                Screening.handler_id == current_user.id,
+                ScreeningService._program_in_state(*program_states)
+            ],
+            values=lambda item: {
+                "review_score": item.review_score,
+                "review_comments": item.review_comments,
+                "state": ScreeningState.REVIEWED
+            }
+        )
+    
+    
+    @staticmethod
+    def bulk_approve_screenings(
+        db: Session,
+        program_id: int,
+        bulk_data: BulkScreeningApproval,
+        current_user: User
+    ) -> dict:
+        """
+        Approval polla screenings enos program se ena transaction
+        Idioi kanones me to approve_screening
+        """
+        #Elegxos program state
+        program_states = (ProgramState.SCHEDULING,)
+        ScreeningService._require_program_state(ProgramService.get_program_state(db, program_id), program_states)
+        
+        def check(screening: Screening, item) -> None:
+            if screening.submitter_id != current_user.id:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Only submitter can approve screening"
+                )
+        
+        items = [(item.screening_id, item) for item in bulk_data.items]
+        return ScreeningService._bulk_apply(
+            db,
+            program_id,
+            items,
+            check,
+            program_states=program_states,
+            guards=[
+                Screening.submitter_id == current_user.id,
+                ScreeningService._program_in_state(*program_states)
+            ],
+            values=lambda item: {
+                "approval_notes": item.approval_notes,
+                "state": ScreeningState.APPROVED
+            }
+        )
+    
+    
+    @staticmethod
+    def bulk_reject_screenings(
+        db: Session,
+        program_id: int,
+        bulk_data: BulkScreeningRejection,
+        current_user: User
+    ) -> dict:
+        """
+        Rejection polla screenings enos program se ena transaction
+        Idioi kanones me to reject_screening, permissions kai state mia fora
+        """
+        #Elegxos permissions (prepei na einai PROGRAMMER)
+        user_role = get_user_program_role(current_user.id, program_id, db)
+        if user_role != ProgramRoleType.PROGRAMMER:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only programmers can reject screenings"
+            )
         
-        #Accept
-        screening.state = ScreeningState.SCHEDULED
+        #Elegxos program state
+        program_states = (ProgramState.SCHEDULING, ProgramState.DECISION)
+        ScreeningService._require_program_state(ProgramService.get_program_state(db, program_id), program_states)
+        
+        items = [(item.screening_id, item) for item in bulk_data.items]
+        return ScreeningService._bulk_apply(
+            db,
+            program_id,
+            items,
+            lambda screening, item: None,
+            program_states=program_states,
+            guards=[
+                ScreeningService._has_program_role(current_user.id, ProgramRoleType.PROGRAMMER),
+                ScreeningService._program_in_state(*program_states)
+            ],
+            values=lambda item: {
+                "rejection_reason": item.rejection_reason,
+                "state": ScreeningState.REJECTED
+            }
+        )
+    
+    
+    @staticmethod
+    def bulk_accept_screenings(
+        db: Session,
+        program_id: int,
+        bulk_data: BulkScreeningAccept,
+        current_user: User
+    ) -> dict:
+        """
+        Teliki apodoxi pollon screenings enos program se ena transaction
+        Idioi kanones me to accept_screening, permissions kai state mia fora
+        """
+        #Elegxos permissions (prepei na einai PROGRAMMER)
+        user_role = get_user_program_role(current_user.id, program_id, db)
+        if user_role != ProgramRoleType.PROGRAMMER:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only programmers can accept screenings"
+            )
+        
+        #Elegxos program state
+        program_states = (ProgramState.DECISION,)
+        ScreeningService._require_program_state(ProgramService.get_program_state(db, program_id), program_states)
+        
+        def check(screening: Screening, item) -> None:
+            if screening.state != ScreeningState.APPROVED or not screening.is_finally_submitted:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Screening must be approved and finally submitted"
+                )
+        
+        items = [(screening_id, None) for screening_id in bulk_data.screening_ids]
+        return ScreeningService._bulk_apply(
+            db,
+            program_id,
+            items,
+            check,
+            program_states=program_states,
+            guards=[
+                ScreeningService._has_program_role(current_user.id, ProgramRoleType.PROGRAMMER),
+                ScreeningService._program_in_state(*program_states),
+                Screening.state == ScreeningState.APPROVED,
+                Screening.is_finally_submitted == True
+            ],
+            values=lambda item: {"state": ScreeningState.SCHEDULED}
+        )
+    
+    
+    @staticmethod
+    def _bulk_apply(
+        db: Session,
+        program_id: int,
+        items: List[Tuple[int, object]],
+        check: Callable[[Screening, object], None],
+        program_states: Tuple[ProgramState, ...],
+        guards: list,
+        values: Callable[[object], dict]
+    ) -> dict:
+        """
+        Koino kommati ton bulk endpoints
+        
+        Fortonei ola ta screenings me ena SELECT ... IN ... FOR UPDATE kai
+        kalei to check se kathe item. Ena item pou apotygxanei (HTTPException
+        apo to check) den allazei kai fainetai sta results.
+        
+        Ta ypoloipa allazoun me ena guarded UPDATE ana diaforetiko payload,
+        me tous idious elegxous sto WHERE opos sto _transition. An ta UPDATE
+        allaksoun ligotera rows apo osa perasan to check, kapoio screening
+        allakse apo allo request: rollback olou tou request kai 409 (i 400 an
+        to program den einai pia se ena apo ta program_states).
+        """
+        screening_ids = {screening_id for screening_id, _ in items}
+        screenings = {
+            screening.id: screening
+            for screening in db.scalars(
+                select(Screening).where(
+                    Screening.program_id == program_id,
+                    Screening.id.in_(screening_ids)
+                ).with_for_update()
+            )
+        }
+        
+        results = []
+        groups = {}  #Payload -> (values, screening ids)
+        seen = set()
+        for screening_id, item in items:
+            try:
+                if screening_id in seen:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Duplicate screening id in request"
+                    )
+                seen.add(screening_id)
+                
+                screening = screenings.get(screening_id)
+                if screening is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Screening not found in this program"
+                    )
+                
+                check(screening, item)
+            except HTTPException as e:
+                results.append({
+                    "screening_id": screening_id,
+                    "success": False,
+                    "status_code": e.status_code,
+                    "detail": e.detail
+                })
+                continue
+            
+            item_values = values(item)
+            key = tuple(sorted(item_values.items()))
+            groups.setdefault(key, (item_values, []))[1].append(screening_id)
+            
+            results.append({
+                "screening_id": screening_id,
+                "success": True,
+                "status_code": status.HTTP_200_OK,
+                "state": item_values.get("state", screening.state).value
+            })
+        
+        updated = 0
+        for item_values, group_ids in groups.values():
+            result = db.execute(
+                update(Screening)
+                .where(
+                    Screening.id.in_(group_ids),
+                    Screening.program_id == program_id,
+                    *guards
+                )
+                .values(**item_values)
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount
+        
+        if updated != sum(len(group_ids) for _, group_ids in groups.values()):
+            db.rollback()
+            program_state = ScreeningService._committed_program_state(db, program_id)
+            ScreeningService._require_program_state(program_state, program_states)
+            ScreeningService._raise_conflict()
         
         db.commit()
-        db.refresh(screening)
-        return screening
+        
+        succeeded = sum(1 for result in results if result["success"])
+        return {
+            "program_id": program_id,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        }
     
     
     @staticmethod
-    def auto_reject_non_submitted(db: Session, program_id: int) -> int:
+    def auto_reject_conditions(program_id: int) -> tuple:
+        """
+        Ta WHERE conditions ton screenings pou aporriptontai automata:
+        ola ta APPROVED screenings pou DEN einai finally submitted
+        """
+        return (
+            Screening.program_id == program_id,
+            Screening.state == ScreeningState.APPROVED,
+            Screening.is_finally_submitted == False
+        )
+    
+    
+    @staticmethod
+    def auto_reject_non_submitted(
+        db: Session,
+        program_id: int,
+        batch_size: Optional[int] = None,
+        on_batch: Optional[Callable[[int], None]] = None
+    ) -> int:
         """
         Auto-rejection gia approved screenings pou den kanane final submit
         Kaleitai otan to program paei se DECISION state
         
+        Ginetai me UPDATE ... WHERE, xoris fortosi ton screenings. Me
+        batch_size > 0 to UPDATE ginetai se chunks me vasi to id (commit
+        ana chunk), gia na kratiountai ligotero ta row locks.
+        
+        Args:
+            on_batch: Kaleitai meta to commit kathe chunk me ta rejected
+                      screenings tou chunk (progress tou background job)
+        
         Returns:
             Arithmos rejected screenings
         """
-        #Pairnei ola ta APPROVED screenings pou DEN einai finally submitted
-        screenings = db.query(Screening).filter(
-            Screening.program_id == program_id,
-            Screening.state == ScreeningState.APPROVED,
-            Screening.is_finally_submitted == False
-        ).all()
+        if batch_size is None:
+            batch_size = settings.AUTO_REJECT_BATCH_SIZE
+        
+        conditions = ScreeningService.auto_reject_conditions(program_id)
+        reject = update(Screening).values(
+            state=ScreeningState.REJECTED,
+            rejection_reason="Automatic rejection - not finally submitted"
+        ).execution_options(synchronize_session=False)
+        
+        if batch_size <= 0:
+            count = db.execute(reject.where(*conditions)).rowcount
+            db.commit()
+            if on_batch is not None:
+                on_batch(count)
+            return count
         
         count = 0
-        for screening in screenings:
-            screening.state = ScreeningState.REJECTED
-            screening.rejection_reason = "Automatic rejection - not finally submitted"
-            count += 1
+        last_id = 0
+        while True:
+            #Prota ta ids, giati to MySQL den dexetai LIMIT se UPDATE ... IN (subquery)
+            screening_ids = db.scalars(
+                select(Screening.id)
+                .where(*conditions, Screening.id > last_id)
+                .order_by(Screening.id)
+                .limit(batch_size)
+            ).all()
+            
+            if not screening_ids:
+                break
+            
+            #Ta conditions ksana: ena screening mporei na allakse metaksi SELECT kai UPDATE
+            rejected = db.execute(reject.where(Screening.id.in_(screening_ids), *conditions)).rowcount
+            db.commit()
+            
+            count += rejected
+            if on_batch is not None:
+                on_batch(rejected)
+            
+            if len(screening_ids) < batch_size:
+                break
+            last_id = screening_ids[-1]
         
-        db.commit()
         return count
     
     
@@ -522,61 +1003,106 @@ class ScreeningService:
         Anazitisi screenings mesa se ena program
         Filtering analoga me role
         """
-        query = db.query(Screening).filter(Screening.program_id == program_id)
+        #Role-based filtering
+        program = ProgramService.get_program_by_id(db, program_id)
+        
+        user_role = None
+        if current_user:
+            user_role = get_user_program_role(current_user.id, program_id, db)
+        
+        statement = ScreeningService._search_statement(
+            program, search_params, user_role, current_user
+        )
+        if statement is None:
+            return []
+        
+        results = db.execute(statement).scalars().all()
+        
+        return results
+    
+    
+    @staticmethod
+    async def search_screenings_async(
+        db: AsyncSession,
+        program_id: int,
+        search_params: ScreeningSearchParams,
+        current_user: Optional[User] = None
+    ) -> List[Screening]:
+        """
+        Async ekdosi tou search_screenings
+        """
+        program = await ProgramService.get_program_by_id_async(db, program_id)
+        
+        user_role = None
+        if current_user:
+            user_role = await get_user_program_role_async(current_user.id, program_id, db)
+        
+        statement = ScreeningService._search_statement(
+            program, search_params, user_role, current_user
+        )
+        if statement is None:
+            return []
+        
+        result = await db.execute(statement)
+        return result.scalars().all()
+    
+    
+    @staticmethod
+    def _search_statement(
+        program: Program,
+        search_params: ScreeningSearchParams,
+        user_role: Optional[ProgramRoleType],
+        current_user: Optional[User]
+    ) -> Optional[Select]:
+        #Koino SELECT gia to sync kai to async search (None = kanena result)
+        query = select(Screening).where(Screening.program_id == program.id)
         
         #Filters
         if search_params.film_title:
             #AND semantics: ola ta words prepei na yparxoun
             words = search_params.film_title.lower().split()
             for word in words:
-                query = query.filter(Screening.film_title.ilike(f"%{word}%"))
+                query = query.where(Screening.film_title.ilike(f"%{word}%"))
         
         if search_params.film_cast:
             words = search_params.film_cast.lower().split()
             for word in words:
-                query = query.filter(Screening.film_cast.ilike(f"%{word}%"))
+                query = query.where(Screening.film_cast.ilike(f"%{word}%"))
         
         if search_params.film_genre:
             words = search_params.film_genre.lower().split()
             for word in words:
-                query = query.filter(Screening.film_genre.ilike(f"%{word}%"))
+                query = query.where(Screening.film_genre.ilike(f"%{word}%"))
         
         if search_params.start_date:
-            query = query.filter(Screening.start_time >= search_params.start_date)
+            query = query.where(Screening.start_time >= search_params.start_date)
         
         if search_params.end_date:
-            query = query.filter(Screening.start_time <= search_params.end_date)
-        
-        #Role-based filtering
-        program = ProgramService.get_program_by_id(db, program_id)
+            query = query.where(Screening.start_time <= search_params.end_date)
         
         if not current_user:
             #VISITOR: mono SCHEDULED screenings se ANNOUNCED programs
             if program.state != ProgramState.ANNOUNCED:
-                return []
-            query = query.filter(Screening.state == ScreeningState.SCHEDULED)
+                return None
+            query = query.where(Screening.state == ScreeningState.SCHEDULED)
         else:
-            user_role = get_user_program_role(current_user.id, program_id, db)
-            
             if user_role == ProgramRoleType.PROGRAMMER:
                 #PROGRAMMER vlepei ola
                 pass
             elif user_role == ProgramRoleType.STAFF:
                 #STAFF vlepei mono osa einai assigned se auton
-                query = query.filter(Screening.handler_id == current_user.id)
+                query = query.where(Screening.handler_id == current_user.id)
             elif user_role == ProgramRoleType.SUBMITTER:
                 #SUBMITTER vlepei mono ta dika tou
-                query = query.filter(Screening.submitter_id == current_user.id)
+                query = query.where(Screening.submitter_id == current_user.id)
             else:
                 #Simple USER: mono SCHEDULED se ANNOUNCED programs
                 if program.state != ProgramState.ANNOUNCED:
-                    return []
-                query = query.filter(Screening.state == ScreeningState.SCHEDULED)
+                    return None
+                query = query.where(Screening.state == ScreeningState.SCHEDULED)
         
         #Sorting: film_genre, meta film_title
-        results = query.order_by(Screening.film_genre, Screening.film_title).all()
-        
-        return results
+        return query.order_by(Screening.film_genre, Screening.film_title)
     
     
     @staticmethod
@@ -592,6 +1118,47 @@ class ScreeningService:
         screening = ScreeningService.get_screening_by_id(db, screening_id)
         program = ProgramService.get_program_by_id(db, screening.program_id)
         
+        user_role = None
+        if current_user:
+            user_role = get_user_program_role(current_user.id, screening.program_id, db)
+        
+        ScreeningService._check_screening_access(screening, program, user_role, current_user)
+        return screening
+    
+    
+    @staticmethod
+    async def get_screening_details_async(
+        db: AsyncSession,
+        screening_id: int,
+        current_user: Optional[User] = None
+    ) -> Screening:
+        """
+        Async ekdosi tou get_screening_details
+        """
+        screening = await db.get(Screening, screening_id)
+        if not screening:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Screening not found"
+            )
+        
+        program = await ProgramService.get_program_by_id_async(db, screening.program_id)
+        
+        user_role = None
+        if current_user:
+            user_role = await get_user_program_role_async(current_user.id, screening.program_id, db)
+        
+        ScreeningService._check_screening_access(screening, program, user_role, current_user)
+        return screening
+    
+    
+    @staticmethod
+    def _check_screening_access(
+        screening: Screening,
+        program: Program,
+        user_role: Optional[ProgramRoleType],
+        current_user: Optional[User]
+    ) -> None:
         #Access control
         if not current_user:
             #VISITOR: mono SCHEDULED se ANNOUNCED programs
@@ -601,8 +1168,6 @@ class ScreeningService:
                     detail="Screening not accessible"
                 )
         else:
-            user_role = get_user_program_role(current_user.id, screening.program_id, db)
-            
             if user_role == ProgramRoleType.PROGRAMMER:
                 #PROGRAMMER vlepei ola
                 pass
@@ -626,6 +1191,4 @@ class ScreeningService:
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
                         detail="Screening not accessible"
-                    )
-        
-        return screening
\ No newline at end of file
+                    )
\ No newline at end of file
@@ -4,8 +4,12 @@ from typing import List, Optional
 
 from app.models.user import User, AuthToken, UserRole
 from app.schemas.user import UserUpdate, PasswordUpdate
-from app.utils.security import verify_password, get_password_hash
+from app.utils.password_pool import verify_password_pooled, get_password_hash_pooled
 from app.utils.validators import validate_username, validate_password
+from app.utils.revocation import revoke_on_commit
+from app.utils.program_cache import invalidate_on_commit
+from app.utils import statements
+from app.services.auth_service import AuthService
 
 
 class UserService:
@@ -15,7 +19,7 @@ class UserService:
         """
         Pairnei user me vasi to id
         """
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.scalars(statements.user_by_id(user_id)).first()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -90,10 +94,7 @@ class UserService:
             user.username = user_data.username
             
             #Invalidate current token
-            db.query(AuthToken).filter(
-                AuthToken.user_id == user.id,
-                AuthToken.is_valid == True
-            ).update({"is_valid": False})
+            AuthService.invalidate_user_tokens(db, user.id)
         
         db.commit()
         db.refresh(user)
@@ -129,7 +130,7 @@ class UserService:
             )
         
         #Elegxos tou paliou password
-        if not verify_password(password_data.old_password, user.password_hash):
+        if not verify_password_pooled(password_data.old_password, user.password_hash):
             #Auxisi failed attempts
             user.failed_login_attempts += 1
             
@@ -138,10 +139,7 @@ class UserService:
                 user.is_active = False
                 
                 #Invalidate ola ta tokens
-                db.query(AuthToken).filter(
-                    AuthToken.user_id == user.id,
-                    AuthToken.is_valid == True
-                ).update({"is_valid": False})
+                AuthService.invalidate_user_tokens(db, user.id)
                 
                 db.commit()
                 raise HTTPException(
@@ -164,14 +162,11 @@ class UserService:
             )
         
         #Update password
-        user.password_hash = get_password_hash(password_data.new_password)
+        user.password_hash = get_password_hash_pooled(password_data.new_password)
         user.failed_login_attempts = 0
         
         #Invalidate ola ta tokens
-        db.query(AuthToken).filter(
-            AuthToken.user_id == user.id,
-            AuthToken.is_valid == True
-        ).update({"is_valid": False})
+        AuthService.invalidate_user_tokens(db, user.id)
         
         db.commit()
     
@@ -201,10 +196,10 @@ class UserService:
         
         #An deactivate, invalidate ola ta tokens
         if not is_active:
-            db.query(AuthToken).filter(
-                AuthToken.user_id == user.id,
-                AuthToken.is_valid == True
-            ).update({"is_valid": False})
+            AuthService.invalidate_user_tokens(db, user.id)
+        
+        #To cached is_active den isxyei pia
+        revoke_on_commit(db, user.id)
         
         db.commit()
         db.refresh(user)
@@ -241,4 +236,6 @@ class UserService:
         
         #Diagrafi (ta tokens tha diagrafoun automatically logo cascade)
         db.delete(user)
+        revoke_on_commit(db, user_id)
+        invalidate_on_commit(db, user_id=user_id)  #Ta roles diagrafontai me cascade
         db.commit()
\ No newline at end of file
@@ -0,0 +1,221 @@
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import func, select
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.screening import Screening
+
+settings = get_settings()
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+INTERRUPTED = "interrupted"
+
+
+class JobInterrupted(Exception):
+    """
+    To job stamatise sto shutdown (ta chunks pou egine commit menoun)
+    """
+    pass
+
+
+class AutoRejectJob:
+    """
+    Ena auto-rejection job kai to progress tou
+    """
+    
+    def __init__(self, job_id: int, program_id: int):
+        self.id = job_id
+        self.program_id = program_id
+        self.status = QUEUED
+        self.total: Optional[int] = None  #Ypopsifia screenings stin arxi tou job
+        self.rejected = 0
+        self.batches = 0
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+    
+    
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+    
+    
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "program_id": self.program_id,
+            "status": self.status,
+            "total": self.total,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "progress": min(self.rejected / self.total, 1.0) if self.total else (1.0 if self.status == COMPLETED else 0.0),
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class AutoRejectJobs:
+    """
+    In-process background jobs gia to auto-rejection ton screenings
+    
+    To transition se DECISION kanei mono enqueue, opote to request
+    epistrefei amesws. Ena thread ektelei ta jobs me ti seira, me chunked
+    UPDATE (commit ana chunk). Ta jobs zoun sti mnimi tou worker: an o
+    worker stamatisei, ta screenings pou emeinan aporriptontai me to
+    /screenings/program/{id}/auto-reject.
+    """
+    
+    def __init__(self, batch_size: int, history_size: int):
+        self.batch_size = batch_size
+        self.history_size = history_size
+        self._jobs: "OrderedDict[int, AutoRejectJob]" = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stop_event = threading.Event()
+    
+    
+    def enqueue(self, program_id: int) -> dict:
+        """
+        Neo job gia ena program (an yparxei idi queued/running job gia to
+        idio program, epistrefetai auto)
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.program_id == program_id and job.active:
+                    return job.to_dict()
+            
+            job = AutoRejectJob(next(self._ids), program_id)
+            self._jobs[job.id] = job
+            self._prune()
+            
+            if self._executor is None:
+                self._stop_event.clear()
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auto-reject")
+            self._executor.submit(self._run, job)
+            return job.to_dict()
+    
+    
+    def get(self, job_id: int) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+    
+    
+    def latest(self, program_id: int) -> Optional[dict]:
+        """
+        To teleutaio job enos program (None an den exei trexei kanena)
+        """
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if job.program_id == program_id:
+                    return job.to_dict()
+            return None
+    
+    
+    def jobs(self) -> List[dict]:
+        with self._lock:
+            return [job.to_dict() for job in reversed(self._jobs.values())]
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+            return {
+                "batch_size": self.batch_size,
+                "jobs": len(statuses),
+                "queued": statuses.count(QUEUED),
+                "running": statuses.count(RUNNING),
+                "completed": statuses.count(COMPLETED),
+                "failed": statuses.count(FAILED),
+                "interrupted": statuses.count(INTERRUPTED)
+            }
+    
+    
+    def shutdown(self) -> None:
+        #To trexon job stamataei meta to chunk pou ektelei
+        self._stop_event.set()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        with self._lock:
+            for job in self._jobs.values():
+                if job.active:
+                    job.status = INTERRUPTED
+                    job.finished_at = datetime.utcnow()
+    
+    
+    def _run(self, job: AutoRejectJob) -> None:
+        from app.services.screening_service import ScreeningService
+        
+        started = time.perf_counter()
+        with self._lock:
+            job.status = RUNNING
+            job.started_at = datetime.utcnow()
+        
+        def progress(rejected: int) -> None:
+            with self._lock:
+                job.rejected += rejected
+                job.batches += 1
+            if self._stop_event.is_set():
+                raise JobInterrupted()
+        
+        db = SessionLocal()
+        try:
+            total = db.scalar(
+                select(func.count()).select_from(Screening)
+                .where(*ScreeningService.auto_reject_conditions(job.program_id))
+            )
+            with self._lock:
+                job.total = total
+            
+            ScreeningService.auto_reject_non_submitted(
+                db, job.program_id, batch_size=max(self.batch_size, 1), on_batch=progress
+            )
+            status, error = COMPLETED, None
+        except JobInterrupted:
+            status, error = INTERRUPTED, None
+        except Exception as e:
+            db.rollback()
+            status, error = FAILED, str(e)
+        finally:
+            db.close()
+        
+        with self._lock:
+            job.status = status
+            job.error = error
+            job.finished_at = datetime.utcnow()
+        
+        duration_ms = (time.perf_counter() - started) * 1000
+        print(f"Auto-reject job {job.id} (program {job.program_id}) {status}: "
+              f"{job.rejected} screenings rejected in {duration_ms:.0f}ms")
+    
+    
+    def _prune(self) -> None:
+        #Prepei na kaleitai me to lock. Ta active jobs den afairountai
+        for job_id in [job_id for job_id, job in self._jobs.items() if not job.active]:
+            if len(self._jobs) <= self.history_size:
+                break
+            del self._jobs[job_id]
+
+
+#Ena instance ana process
+auto_reject_jobs = AutoRejectJobs(
+    batch_size=settings.AUTO_REJECT_JOB_BATCH_SIZE,
+    history_size=settings.AUTO_REJECT_JOB_HISTORY
+)
\ No newline at end of file
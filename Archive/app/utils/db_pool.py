@@ -0,0 +1,93 @@
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+#Oria (ms) gia to histogram tou checkout wait, to teleutaio bucket einai "+Inf"
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """
+    Metrics gia to checkout ton connections apo to pool
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+    
+    
+    def record_checkout(self, wait: float) -> None:
+        wait_ms = wait * 1000
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            self.wait_buckets[bisect_left(CHECKOUT_WAIT_BUCKETS_MS, wait_ms)] += 1
+    
+    
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            labels = [f"<={bound}ms" for bound in CHECKOUT_WAIT_BUCKETS_MS] + ["+Inf"]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": (self.wait_total / self.checkouts * 1000) if self.checkouts else 0.0,
+                "wait_max_ms": self.wait_max * 1000,
+                "wait_histogram": dict(zip(labels, self.wait_buckets))
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool pou metraei poso perimenei kathe request gia connection
+    
+    To _do_get kaleitai se kathe checkout, opote o xronos tou periexei tin
+    anamoni stin oura (otan ola ta connections einai checked out) kai ti
+    dimiourgia neou connection (overflow).
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+    
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - started)
+        return connection
+    
+    
+    def recreate(self):
+        #To neo pool (meta apo dispose/invalidate) krataei ta idia metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+    
+    
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout_seconds": self._timeout,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow_in_use": max(self.overflow(), 0),
+            **self.metrics.stats()
+        }
@@ -1,19 +1,49 @@
 from fastapi import Depends, HTTPException, status, Header
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.models.user import User, AuthToken
-from app.models.program import ProgramRole, ProgramRoleType
-from app.utils.security import decode_access_token
+from app.models.program import ProgramRoleType
+from app.utils.security import decode_access_token, token_digest
+from app.utils.token_cache import token_cache, CachedToken
+from app.utils.revocation import revocation_list
+from app.utils import statements
+from app.utils.request_memo import get_request_memo
+from app.utils.program_cache import program_cache
+from app.config import get_settings
 
+settings = get_settings()
 
-async def get_current_user(
+
+def get_current_user(
     authorization: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ) -> User:
     #Pairnei ton current authenticated user apo to token
+    #Sync def: to FastAPI to trexei sto threadpool, opote ta blocking
+    #queries den stamatane to event loop
+    return resolve_current_user(db, authorization)
+
+
+async def get_current_user_async(
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    #Idios elegxos me to get_current_user gia ta async routes: to run_sync
+    #ektelei ti sync logiki me to async connection (xoris thread)
+    return await db.run_sync(resolve_current_user, authorization)
+
+
+def resolve_current_user(db: Session, authorization: Optional[str]) -> User:
+    """
+    Elegxos tou bearer token kai fortosi tou owner tou
+    
+    Raises:
+        HTTPException 401 gia invalid/expired token, 403 gia inactive user
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -45,18 +75,62 @@ async def get_current_user(
     if username is None or user_id is None:
         raise credentials_exception
     
-    #Elegxos sto database gia to token
-    db_token = db.query(AuthToken).filter(
-        AuthToken.token == token,
+    #Stateless mode: i ypografi kai to revocation list arkoun gia to token
+    jti = payload.get("jti")
+    if settings.AUTH_STATELESS_JWT and jti:
+        revocation_list.maybe_refresh(db)
+        if revocation_list.is_revoked(jti):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token"
+            )
+        
+        user = db.get(User, user_id)
+        if user is None:
+            raise credentials_exception
+        
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user account"
+            )
+        
+        return user
+    
+    #Elegxos sto token cache prin apo ti vasi
+    digest = token_digest(token)
+    cached = token_cache.get(digest)
+    
+    if cached is not None and cached.user_id == user_id and cached.expires_at >= datetime.utcnow():
+        if not cached.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user account"
+            )
+        
+        user = db.get(User, user_id)
+        if user is not None and user.is_active:
+            return user
+        
+        #To cache einai stale, synexeia me to kanoniko path
+        token_cache.invalidate(digest)
+    
+    #Elegxos sto database gia to token, mazi me ton owner tou se ena SELECT
+    row = db.query(AuthToken, User).join(
+        User, User.id == AuthToken.user_id
+    ).filter(
+        AuthToken.token_hash == digest,
         AuthToken.is_valid == True
     ).first()
     
-    if not db_token:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
     
+    db_token, token_owner = row
+    
     #Elegxos an exei lixei to token
     if db_token.expires_at < datetime.utcnow():
         db_token.is_valid = False
@@ -69,26 +143,26 @@ async def get_current_user(
     #Elegxos an to token anikei ston swsto user
     if db_token.user_id != user_id:
         #KRITIΚΟ: Deactivate kai tous 2 logariasmos
-        user = db.query(User).filter(User.id == user_id).first()
-        token_owner = db.query(User).filter(User.id == db_token.user_id).first()
+        #(spanio path, mono edo xreiazetai extra query gia ton allo user)
+        token_owner_id = token_owner.id
+        user = db.get(User, user_id)
         
         if user:
             user.is_active = False
-        if token_owner:
-            token_owner.is_active = False
+        token_owner.is_active = False
         
         db.commit()
         
+        token_cache.invalidate_user(user_id)
+        token_cache.invalidate_user(token_owner_id)
+        
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Token ownership violation - both accounts deactivated"
         )
     
-    #Pairnei ton user
-    user = db.query(User).filter(User.id == user_id).first()
-    
-    if user is None:
-        raise credentials_exception
+    #O user einai o owner tou token (idi fortomenos apo to join)
+    user = token_owner
     
     if not user.is_active:
         raise HTTPException(
@@ -96,6 +170,14 @@ async def get_current_user(
             detail="Inactive user account"
         )
     
+    #Apothikeusi sto cache gia ta epomena requests
+    token_cache.set(digest, CachedToken(
+        user_id=user.id,
+        role=user.role,
+        is_active=user.is_active,
+        expires_at=db_token.expires_at
+    ))
+    
     return user
 
 
@@ -125,6 +207,30 @@ async def get_admin_user(
     return current_user
 
 
+def get_user_program_roles(
+    user_id: int,
+    program_id: int,
+    db: Session
+) -> Tuple[ProgramRoleType, ...]:
+    """
+    Pairnei ola ta roles enos user se ena program (me ti seira pou dothikan)
+    To apotelesma menei sto request memo gia tous epomenous elegxous kai
+    sto program cache gia ta epomena requests
+    """
+    memo = get_request_memo(db)
+    roles = memo.roles.get((user_id, program_id))
+    
+    if roles is None:
+        roles = program_cache.get_roles(db, user_id, program_id)
+        if roles is None:
+            generation = program_cache.generation
+            roles = tuple(db.scalars(statements.program_roles(user_id, program_id)))
+            program_cache.set_roles(db, user_id, program_id, roles, generation)
+        memo.roles[(user_id, program_id)] = roles
+    
+    return roles
+
+
 def get_user_program_role(
     user_id: int,
     program_id: int,
@@ -136,12 +242,20 @@ def get_user_program_role(
     Returns:
         To ProgramRoleType an yparxei, alliws None
     """
-    role = db.query(ProgramRole).filter(
-        ProgramRole.user_id == user_id,
-        ProgramRole.program_id == program_id
-    ).first()
-    
-    return role.role if role else None
+    roles = get_user_program_roles(user_id, program_id, db)
+    return roles[0] if roles else None
+
+
+async def get_user_program_role_async(
+    user_id: int,
+    program_id: int,
+    db: AsyncSession
+) -> Optional[ProgramRoleType]:
+    """
+    Async ekdosi tou get_user_program_role
+    """
+    result = await db.execute(statements.program_roles(user_id, program_id))
+    return result.scalars().first()
 
 
 def check_program_permission(
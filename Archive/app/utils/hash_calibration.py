@@ -0,0 +1,94 @@
+import math
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+#Schemes opou to rounds einai log2 (kathe +1 diplasiazei to kostos)
+LOG_ROUNDS_SCHEMES = {"bcrypt", "scrypt"}
+
+#Epitrepta oria rounds ana scheme
+ROUNDS_LIMITS = {
+    "bcrypt": (4, 31),
+    "scrypt": (1, 31),
+    "argon2": (1, 64)
+}
+
+#Rounds gia to metrima tis calibration (ftino alla metrisimo)
+CALIBRATION_ROUNDS = {
+    "bcrypt": 8,
+    "scrypt": 12,
+    "argon2": 1
+}
+
+CALIBRATION_PASSWORD = "Calibration@123"
+
+
+def build_password_context(scheme: str, rounds: int) -> "CryptContext":
+    """
+    Dimiourgia CryptContext gia to scheme kai to cost
+    
+    To min_desired_rounds kanei ta hashes me mikrotero cost "stale", opote to
+    verify_and_update ta ksanakanei hash sto login. An to scheme den einai
+    bcrypt, ta palia bcrypt hashes ginontai verify kai meta rehash.
+    """
+    from passlib.context import CryptContext
+    
+    if scheme not in ROUNDS_LIMITS:
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+    
+    schemes = [scheme] if scheme == "bcrypt" else [scheme, "bcrypt"]
+    options = {
+        f"{scheme}__default_rounds": rounds,
+        f"{scheme}__min_desired_rounds": rounds
+    }
+    
+    if scheme == "bcrypt":
+        options["bcrypt__ident"] = "2b"  #Xrisi tis pio kainourias ekdosis bcrypt
+    
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+def measure_hash_time(scheme: str, rounds: int, samples: int = 3) -> float:
+    """
+    Median xronos (se seconds) gia ena hash me to sygkekrimeno cost
+    """
+    context = build_password_context(scheme, rounds)
+    context.hash(CALIBRATION_PASSWORD)  #Warm-up (fortosi backend)
+    
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.hash(CALIBRATION_PASSWORD)
+        timings.append(time.perf_counter() - started)
+    
+    return statistics.median(timings)
+
+
+def calibrate_rounds(scheme: str, target_ms: float, min_rounds: int) -> int:
+    """
+    Vriskei to megalytero cost pou menei kato apo to target latency ana hash
+    sto trexon host
+    
+    Metraei ena ftino cost kai kanei extrapolation: ta log-rounds schemes
+    diplasiazoun to kostos ana round, to argon2 auksanei grammika.
+    """
+    lowest, highest = ROUNDS_LIMITS[scheme]
+    base_rounds = CALIBRATION_ROUNDS[scheme]
+    base_time = measure_hash_time(scheme, base_rounds)
+    target = target_ms / 1000.0
+    
+    if scheme in LOG_ROUNDS_SCHEMES:
+        rounds = base_rounds + math.floor(math.log2(target / base_time))
+    else:
+        rounds = math.floor(target / base_time * base_rounds)
+    
+    rounds = max(min(rounds, highest), lowest, min_rounds)
+    
+    #Elegxos tou extrapolation me ena pragmatiko metrima
+    if rounds > max(lowest, min_rounds) and measure_hash_time(scheme, rounds, samples=1) > target:
+        rounds -= 1
+    
+    return rounds
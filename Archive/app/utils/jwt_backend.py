@@ -0,0 +1,185 @@
+from abc import ABC, abstractmethod
+import base64
+import hashlib
+import hmac
+import json
+import time
+from calendar import timegm
+from datetime import datetime
+from typing import Any, Dict
+
+
+class TokenDecodeError(Exception):
+    """
+    To token den einai valid (ypografi, format i expiration)
+    """
+
+
+class JWTBackend(ABC):
+    """
+    Interface gia to encode/decode ton JWT tokens
+    
+    Ola ta backends vgazoun tokens me to idio format kai ta idia claims,
+    opote ena token apo ena backend ginetai decode apo ola ta alla.
+    """
+    
+    name = "base"
+    
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        ...
+    
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        ...
+
+
+class JoseBackend(JWTBackend):
+    """
+    To arxiko backend me to python-jose
+    """
+    
+    name = "jose"
+    
+    def __init__(self, secret_key: str, algorithm: str):
+        from jose import jwt
+        self._jwt = jwt
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+    
+    
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return self._jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+    
+    
+    def decode(self, token: str) -> Dict[str, Any]:
+        from jose import JWTError
+        
+        try:
+            return self._jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except JWTError as e:
+            raise TokenDecodeError(str(e))
+
+
+class NativeHMACBackend(JWTBackend):
+    """
+    Grigoro backend gia HS256/HS384/HS512 mono me to standard library
+    
+    To HMAC key schedule kai to encoded header ypologizontai mia fora sto
+    __init__, opote kathe sign/verify kanei mono ena copy() kai to hash.
+    """
+    
+    name = "native"
+    
+    DIGESTS = {
+        "HS256": hashlib.sha256,
+        "HS384": hashlib.sha384,
+        "HS512": hashlib.sha512
+    }
+    
+    def __init__(self, secret_key: str, algorithm: str):
+        if algorithm not in self.DIGESTS:
+            raise ValueError(f"Native JWT backend supports only {', '.join(self.DIGESTS)}")
+        
+        self.algorithm = algorithm
+        self._mac = hmac.new(secret_key.encode("utf-8"), digestmod=self.DIGESTS[algorithm])
+        
+        #Idio header me to python-jose (sorted keys, xoris kena)
+        header = json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True)
+        self._header_segment = _b64encode(header.encode("utf-8"))
+    
+    
+    def encode(self, claims: Dict[str, Any]) -> str:
+        claims = dict(claims)
+        for time_claim in ("exp", "iat", "nbf"):
+            if isinstance(claims.get(time_claim), datetime):
+                claims[time_claim] = timegm(claims[time_claim].utctimetuple())
+        
+        payload_segment = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        signing_input = self._header_segment + b"." + payload_segment
+        
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode("ascii")
+    
+    
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            signing_input, signature_segment = token.encode("ascii").rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".", 1)
+            signature = _b64decode(signature_segment)
+        except (ValueError, UnicodeEncodeError):
+            raise TokenDecodeError("Invalid token format")
+        
+        if not hmac.compare_digest(self._sign(signing_input), signature):
+            raise TokenDecodeError("Signature verification failed")
+        
+        #To header elegxetai meta tin ypografi (idio alg me to configured)
+        if header_segment != self._header_segment:
+            try:
+                header = json.loads(_b64decode(header_segment))
+            except ValueError:
+                raise TokenDecodeError("Invalid header")
+            if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+                raise TokenDecodeError("The specified alg value is not allowed")
+        
+        try:
+            claims = json.loads(_b64decode(payload_segment))
+        except ValueError:
+            raise TokenDecodeError("Invalid payload")
+        
+        if not isinstance(claims, dict):
+            raise TokenDecodeError("Invalid payload")
+        
+        _validate_claims(claims)
+        return claims
+    
+    
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+
+#Diathesima backends (to onoma xrisimopoieitai sto Settings.JWT_BACKEND)
+JWT_BACKENDS = {
+    JoseBackend.name: JoseBackend,
+    NativeHMACBackend.name: NativeHMACBackend
+}
+
+
+def build_jwt_backend(name: str, secret_key: str, algorithm: str) -> JWTBackend:
+    """
+    Dimiourgia tou JWT backend apo to onoma tou
+    """
+    if name not in JWT_BACKENDS:
+        raise ValueError(f"Unknown JWT backend: {name}")
+    return JWT_BACKENDS[name](secret_key, algorithm)
+
+
+def _validate_claims(claims: Dict[str, Any]) -> None:
+    #Idioi elegxoi me to python-jose gia ta claims pou xrisimopoiei to app
+    now = timegm(time.gmtime())
+    
+    for time_claim in ("exp", "iat", "nbf"):
+        if time_claim in claims and not isinstance(claims[time_claim], int):
+            raise TokenDecodeError(f"Invalid {time_claim} claim")
+    
+    if "exp" in claims and claims["exp"] < now:
+        raise TokenDecodeError("Signature has expired.")
+    
+    if "nbf" in claims and claims["nbf"] > now:
+        raise TokenDecodeError("The token is not yet valid (nbf)")
+    
+    for string_claim in ("sub", "jti"):
+        if string_claim in claims and not isinstance(claims[string_claim], str):
+            raise TokenDecodeError(f"Invalid {string_claim} claim")
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+    except (ValueError, TypeError):
+        raise TokenDecodeError("Invalid base64 segment")
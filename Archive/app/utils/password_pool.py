@@ -0,0 +1,190 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+from app.utils.security import (
+    verify_password, verify_and_update_password, get_password_hash,
+    configure_password_context, get_password_context_settings
+)
+
+settings = get_settings()
+
+
+def _timed_call(func: Callable, args: tuple, submitted_at: float) -> tuple[Any, float, float]:
+    #Trexei mesa sto worker process
+    started_at = time.time()
+    result = func(*args)
+    return result, max(started_at - submitted_at, 0.0), time.time() - started_at
+
+
+class PasswordHashPool:
+    """
+    Bounded process pool gia ta bcrypt hash/verify
+    
+    To bcrypt kanei CPU-bound douleia ~250ms, opote trexei se ksexoristo
+    process gia na min kratane ta request threads kai to GIL. An oloi oi
+    workers kai i oura einai gematoi, to request aporriptetai amesos me 503.
+    """
+    
+    def __init__(self, max_workers: int, queue_depth: int, timeout: float):
+        self.max_workers = max_workers
+        self.queue_depth = queue_depth
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(max_workers, 1) + max(queue_depth, 0))
+        self._metrics_lock = threading.Lock()
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.hash_time_total = 0.0
+        self.hash_time_max = 0.0
+    
+    
+    def run(self, func: Callable, *args) -> Any:
+        """
+        Ektelesi tou func sto pool kai anamoni gia to apotelesma
+        
+        Raises:
+            HTTPException 503 an to pool einai gemato i den apantise egkaira
+        """
+        if self.max_workers <= 0:
+            with self._metrics_lock:
+                self.submitted += 1
+            result, _, hash_time = _timed_call(func, args, time.time())
+            self._record(0.0, hash_time)
+            return result
+        
+        if not self._slots.acquire(blocking=False):
+            with self._metrics_lock:
+                self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again",
+                headers={"Retry-After": "1"}
+            )
+        
+        with self._metrics_lock:
+            self.submitted += 1
+            self.in_flight += 1
+        
+        try:
+            future = self._get_executor().submit(_timed_call, func, args, time.time())
+        except Exception:
+            self._release(None)
+            raise
+        
+        #To slot eleutheronetai otan teleiosei to job, oxi otan kanei timeout o caller
+        future.add_done_callback(self._release)
+        
+        try:
+            result, queue_wait, hash_time = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            with self._metrics_lock:
+                self.timed_out += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please try again",
+                headers={"Retry-After": "1"}
+            )
+        except Exception:
+            with self._metrics_lock:
+                self.failed += 1
+            raise
+        
+        self._record(queue_wait, hash_time)
+        return result
+    
+    
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+    
+    
+    def stats(self) -> dict:
+        with self._metrics_lock:
+            completed = self.completed
+            return {
+                "max_workers": self.max_workers,
+                "queue_depth": self.queue_depth,
+                "in_flight": self.in_flight,
+                "submitted": self.submitted,
+                "completed": completed,
+                "rejected": self.rejected,
+                "failed": self.failed,
+                "timed_out": self.timed_out,
+                "queue_wait_avg_ms": (self.queue_wait_total / completed * 1000) if completed else 0.0,
+                "queue_wait_max_ms": self.queue_wait_max * 1000,
+                "hash_time_avg_ms": (self.hash_time_total / completed * 1000) if completed else 0.0,
+                "hash_time_max_ms": self.hash_time_max * 1000
+            }
+    
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        #Lazy dimiourgia, spawn gia na min ginei fork apo multithreaded process
+        with self._executor_lock:
+            if self._executor is None:
+                #Ta workers xrisimopoioun to idio (isws calibrated) cost me ton parent
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=configure_password_context,
+                    initargs=get_password_context_settings()
+                )
+            return self._executor
+    
+    
+    def _release(self, future: Optional[Future]) -> None:
+        with self._metrics_lock:
+            self.in_flight -= 1
+        self._slots.release()
+    
+    
+    def _record(self, queue_wait: float, hash_time: float) -> None:
+        with self._metrics_lock:
+            self.completed += 1
+            self.queue_wait_total += queue_wait
+            self.queue_wait_max = max(self.queue_wait_max, queue_wait)
+            self.hash_time_total += hash_time
+            self.hash_time_max = max(self.hash_time_max, hash_time)
+
+
+#Ena pool ana process
+password_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_POOL_SIZE,
+    queue_depth=settings.PASSWORD_POOL_QUEUE_DEPTH,
+    timeout=settings.PASSWORD_POOL_TIMEOUT_SECONDS
+)
+
+
+def verify_password_pooled(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password mesa sto password pool
+    """
+    return password_pool.run(verify_password, plain_password, hashed_password)
+
+
+def verify_and_update_password_pooled(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    verify_and_update_password mesa sto password pool
+    """
+    return password_pool.run(verify_and_update_password, plain_password, hashed_password)
+
+
+def get_password_hash_pooled(password: str) -> str:
+    """
+    get_password_hash mesa sto password pool
+    """
+    return password_pool.run(get_password_hash, password)
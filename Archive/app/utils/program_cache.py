@@ -0,0 +1,332 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.program import Program, ProgramRole, ProgramRoleType, ProgramState
+from app.utils.replicas import reads_from_replica
+
+settings = get_settings()
+
+#Posa programs elegxontai se kathe SELECT tou sync
+SYNC_BATCH_SIZE = 500
+
+PENDING_KEY = "pending_program_cache_invalidations"
+SYNCED_KEY = "program_cache_synced"
+
+
+class ProgramCache:
+    """
+    Cache ana process gia ta roles (user_id, program_id) kai to state ton programs
+    
+    Ta roles kai to state allazoun mono apo to add_programmer, add_staff,
+    create_screening, update_program_state, delete_program kai delete_user.
+    Auta kanoun +1 sto programs.cache_version ton programs pou allaxan, sto
+    idio transaction, kai invalidation sto cache tou worker meta to commit.
+    Oi alloi workers elegxoun ta versions ton cached programs kathe
+    PROGRAM_CACHE_VERSION_CHECK_SECONDS kai afairoun mono ta programs pou
+    allaxan. To TTL einai safety net gia allages pou den pernane apo tis
+    services (p.x. apeutheias SQL).
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: int, version_check_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self._roles: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()
+        self._states: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        #To cache_version pou eide to teleutaio sync ana cached program
+        self._versions: Dict[int, int] = {}
+        self._next_check = 0.0
+        #+1 se kathe invalidation: ena fill pou diavase ti vasi prin apo
+        #to invalidation den apothikeuetai (tha itan idi stale)
+        self.generation = 0
+        self.role_hits = 0
+        self.role_misses = 0
+        self.state_hits = 0
+        self.state_misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.version_checks = 0
+        self.flushes = 0
+    
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+    
+    
+    def get_roles(self, db: Session, user_id: int, program_id: int) -> Optional[Tuple[ProgramRoleType, ...]]:
+        """
+        Ta roles enos user se ena program (None an den einai sto cache)
+        """
+        if not self._usable(db):
+            return None
+        
+        self.sync(db)
+        with self._lock:
+            roles = self._get(self._roles, (user_id, program_id))
+            if roles is None:
+                self.role_misses += 1
+            else:
+                self.role_hits += 1
+            return roles
+    
+    
+    def set_roles(
+        self,
+        db: Session,
+        user_id: int,
+        program_id: int,
+        roles: Tuple[ProgramRoleType, ...],
+        generation: int
+    ) -> None:
+        if self._usable(db) and not reads_from_replica(db):
+            self._set(self._roles, (user_id, program_id), roles, generation)
+    
+    
+    def get_state(self, db: Session, program_id: int) -> Optional[ProgramState]:
+        """
+        To state enos program (None an den einai sto cache)
+        """
+        if not self._usable(db):
+            return None
+        
+        self.sync(db)
+        with self._lock:
+            state = self._get(self._states, program_id)
+            if state is None:
+                self.state_misses += 1
+            else:
+                self.state_hits += 1
+            return state
+    
+    
+    def set_state(self, db: Session, program_id: int, state: ProgramState, generation: int) -> None:
+        if self._usable(db) and not reads_from_replica(db):
+            self._set(self._states, program_id, state, generation)
+    
+    
+    def sync(self, db: Session) -> None:
+        """
+        Elegxos ton versions ton cached programs sti vasi (to poli mia fora
+        ana interval kai ana session). Ta programs pou allaxan apo allon
+        worker (i diagraftikan) afairountai apo to cache.
+        """
+        if db.info.get(SYNCED_KEY) or time.monotonic() < self._next_check:
+            return
+        
+        db.info[SYNCED_KEY] = True
+        with self._lock:
+            self._next_check = time.monotonic() + self.version_check_seconds
+            program_ids = sorted({program_id for _, program_id in self._roles} | set(self._states))
+        
+        if not program_ids:
+            return
+        
+        versions = {}
+        for start in range(0, len(program_ids), SYNC_BATCH_SIZE):
+            batch = program_ids[start:start + SYNC_BATCH_SIZE]
+            versions.update(db.execute(
+                select(Program.id, Program.cache_version).where(Program.id.in_(batch))
+            ).all())
+        
+        with self._lock:
+            self.version_checks += 1
+            
+            for program_id in program_ids:
+                version = versions.get(program_id)
+                #Program pou den eixe elegxthei akoma: den kseroume me poio
+                #version gemise to cache, opote afaireitai mia fora
+                if version is None or self._versions.get(program_id) != version:
+                    self.generation += 1
+                    if self._remove_program(program_id):
+                        self.flushes += 1
+                
+                if version is None:
+                    self._versions.pop(program_id, None)
+                else:
+                    self._versions[program_id] = version
+    
+    
+    def invalidate(self, program_id: Optional[int] = None, user_id: Optional[int] = None) -> None:
+        """
+        Afairesi ton roles enos user se ena program. Me user_id None: olo to
+        program (state kai roles olon ton users), me program_id None: ola ta
+        roles tou user.
+        """
+        with self._lock:
+            self.generation += 1
+            
+            if program_id is not None and user_id is not None:
+                keys = [(user_id, program_id)] if (user_id, program_id) in self._roles else []
+            elif user_id is not None:
+                keys = [key for key in self._roles if key[0] == user_id]
+            else:
+                self.invalidations += self._remove_program(program_id)
+                return
+            
+            for key in keys:
+                del self._roles[key]
+            self.invalidations += len(keys)
+    
+    
+    def advance_versions(self, versions: Dict[int, int]) -> None:
+        """
+        Ta versions pou ekane bump o idios o worker: exei idi kanei ta
+        invalidations tous, opote to epomeno sync den xreiazetai na ta afairesei.
+        Mono an to version einai to amesws epomeno (xoris bump apo allon worker).
+        """
+        with self._lock:
+            for program_id, version in versions.items():
+                if version is not None and self._versions.get(program_id) == version - 1:
+                    self._versions[program_id] = version
+    
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.role_hits + self.state_hits
+            lookups = hits + self.role_misses + self.state_misses
+            role_lookups = self.role_hits + self.role_misses
+            state_lookups = self.state_hits + self.state_misses
+            return {
+                "enabled": self.enabled,
+                "roles": len(self._roles),
+                "states": len(self._states),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "tracked_programs": len(self._versions),
+                "version_check_seconds": self.version_check_seconds,
+                "hits": hits,
+                "misses": lookups - hits,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "role_hit_rate": self.role_hits / role_lookups if role_lookups else 0.0,
+                "state_hit_rate": self.state_hits / state_lookups if state_lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "version_checks": self.version_checks,
+                "flushes": self.flushes
+            }
+    
+    
+    def _usable(self, db: Session) -> bool:
+        #Se session me invalidations pou den exoun ginei commit, ta dedomena
+        #tis vasis (mesa sto transaction) den isxyoun akoma gia tous allous
+        return self.enabled and not db.info.get(PENDING_KEY)
+    
+    
+    def _get(self, entries: OrderedDict, key):
+        #Prepei na kaleitai me to lock
+        item = entries.get(key)
+        if item is None:
+            return None
+        
+        value, deadline = item
+        if deadline <= time.monotonic():
+            del entries[key]
+            return None
+        
+        entries.move_to_end(key)
+        return value
+    
+    
+    def _set(self, entries: OrderedDict, key, value, generation: int) -> None:
+        with self._lock:
+            if generation != self.generation:
+                return
+            
+            entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            entries.move_to_end(key)
+            
+            #LRU eviction
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+                self.evictions += 1
+    
+    
+    def _remove_program(self, program_id: int) -> int:
+        #Prepei na kaleitai me to lock. Epistrefei posa entries afairethikan
+        keys = [key for key in self._roles if key[1] == program_id]
+        for key in keys:
+            del self._roles[key]
+        
+        removed = len(keys)
+        if self._states.pop(program_id, None) is not None:
+            removed += 1
+        return removed
+    
+    
+    def _clear(self) -> None:
+        #Prepei na kaleitai me to lock
+        self._roles.clear()
+        self._states.clear()
+        self._versions.clear()
+        self.generation += 1
+
+
+#Ena instance ana process
+program_cache = ProgramCache(
+    max_size=settings.PROGRAM_CACHE_MAX_SIZE if settings.PROGRAM_CACHE_ENABLED else 0,
+    ttl_seconds=settings.PROGRAM_CACHE_TTL_SECONDS,
+    version_check_seconds=settings.PROGRAM_CACHE_VERSION_CHECK_SECONDS
+)
+
+
+def invalidate_on_commit(db: Session, program_id: Optional[int] = None, user_id: Optional[int] = None) -> None:
+    """
+    Kataxorei invalidation tou program cache gia ena write path
+    
+    To cache_version tou program (i ton programs tou user) auksanei sto idio
+    transaction (oi alloi workers to vlepoun meta to commit). Ta ypoloipa
+    programs den allazoun. To topiko invalidation ginetai MONO afou ginei
+    commit. Kaleitai prin apo to db.commit().
+    
+    Args:
+        program_id: To program pou allakse (None = ola ta programs tou user)
+        user_id: O user pou allakse role (None = olo to program, p.x. state)
+    """
+    if program_id is not None:
+        condition = Program.id == program_id
+    else:
+        #Prin to flush tou delete: ta roles tou user yparxoun akoma
+        condition = Program.id.in_(select(ProgramRole.program_id).where(ProgramRole.user_id == user_id))
+    
+    #To updated_at den allazei: to program to idio den allakse
+    db.execute(
+        update(Program)
+        .where(condition)
+        .values(cache_version=Program.cache_version + 1, updated_at=Program.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    
+    version = None
+    if program_id is not None:
+        version = db.scalar(select(Program.cache_version).where(Program.id == program_id))
+    db.info.setdefault(PENDING_KEY, []).append((program_id, user_id, version))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    pending = session.info.pop(PENDING_KEY, ())
+    for program_id, user_id, _ in pending:
+        program_cache.invalidate(program_id, user_id)
+    
+    if pending:
+        program_cache.advance_versions({
+            program_id: version for program_id, _, version in pending if program_id is not None
+        })
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
\ No newline at end of file
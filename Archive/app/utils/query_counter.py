@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.slow_query_log import normalize_sql
+
+START_KEY = "query_counter_start"
+
+
+class QueryStats:
+    """
+    Statements kai DB time enos request (i enos block sta tests)
+    
+    Ta statements omadopoiountai me to normalized SQL: to idio shape polles
+    fores mesa sto idio request einai sinithos N+1 (p.x. lazy load ana row).
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.duration_ms = 0.0
+        self.shapes = Counter()
+    
+    
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.duration_ms += duration_ms
+        self.shapes[statement] += 1
+    
+    
+    def repeated(self, threshold: int) -> List[tuple]:
+        """
+        Ta statement shapes pou ektelestikan toulaxiston threshold fores
+        
+        Returns:
+            Lista apo (normalized SQL, fores), apo to pio syxno
+        """
+        if threshold <= 0 or not self.shapes:
+            return []
+        
+        #To normalization ginetai edo (mia fora ana diaforetiko statement)
+        shapes = Counter()
+        for statement, times in self.shapes.items():
+            shapes[normalize_sql(statement)] += times
+        
+        return [(shape, times) for shape, times in shapes.most_common() if times >= threshold]
+
+
+#Ta stats tou trexontos request (ta orizei to middleware)
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+#Stats pou metrane OLA ta statements tou process (assert_max_queries)
+_watchers: List[QueryStats] = []
+_watchers_lock = threading.Lock()
+
+
+def install(engine: Engine) -> None:
+    """
+    Syndesi me ta cursor events enos engine (gia async engine: to sync_engine)
+    """
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    event.listen(engine, "after_cursor_execute", _after_execute)
+    event.listen(engine, "handle_error", _on_error)
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(START_KEY, []).append(time.perf_counter())
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    duration_ms = (time.perf_counter() - conn.info[START_KEY].pop()) * 1000
+    
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration_ms)
+    
+    if _watchers:
+        with _watchers_lock:
+            for watcher in _watchers:
+                watcher.record(statement, duration_ms)
+
+
+def _on_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(START_KEY):
+        conn.info[START_KEY].pop()
+
+
+@contextmanager
+def count_queries():
+    """
+    Metraei ola ta statements pou ektelountai mesa sto block
+    (apo opoiodipote thread, p.x. mesa apo to TestClient)
+    """
+    stats = QueryStats()
+    with _watchers_lock:
+        _watchers.append(stats)
+    try:
+        yield stats
+    finally:
+        with _watchers_lock:
+            _watchers.remove(stats)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int):
+    """
+    Gia ta tests: apotygxanei an to block ektelese perissotera statements
+    
+    Paradeigma:
+        with assert_max_queries(3):
+            client.get("/programs/search")
+    """
+    with count_queries() as stats:
+        yield stats
+    
+    if stats.count > max_queries:
+        shapes = "\n".join(f"  {times}x {statement}" for statement, times in stats.repeated(1))
+        raise AssertionError(f"Expected at most {max_queries} queries, got {stats.count}:\n{shapes}")
\ No newline at end of file
@@ -0,0 +1,211 @@
+import itertools
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+#Kleidia sto session.info: to session egrapse (menei sto primary) kai
+#to replica pou dialextike gia to session
+PRIMARY_KEY = "use_primary"
+REPLICA_KEY = "replica_index"
+
+
+class ReplicaSet:
+    """
+    Ta read replicas kai i katastasi tous (reachable, replication lag)
+    
+    Ena background thread elegxei to lag kathe interval, opote to routing
+    sto request path diavazei mono ti lista ton usable replicas. Mexri ton
+    proto elegxo ola ta replicas theorountai usable.
+    """
+    
+    def __init__(
+        self,
+        engines: List[Engine],
+        max_lag_seconds: float,
+        check_interval_seconds: int,
+        fallback_to_primary: bool
+    ):
+        self.engines = engines
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.fallback_to_primary = fallback_to_primary
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._usable = list(range(len(engines)))  #Reachable kai lag <= max
+        self._reachable = list(range(len(engines)))
+        self._lag: List[Optional[float]] = [None] * len(engines)
+        self._errors: List[Optional[str]] = [None] * len(engines)
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.sessions = [0] * len(engines)
+        self.primary_fallbacks = 0
+        self.last_check_at: Optional[datetime] = None
+    
+    
+    def choose(self) -> Optional[int]:
+        """
+        Round-robin epilogi replica gia ena session
+        
+        Returns:
+            To index tou replica i None gia to primary
+        """
+        with self._lock:
+            candidates = self._usable
+            if not candidates and not self.fallback_to_primary:
+                #Kalytera palio apotelesma apo fortomeno primary
+                candidates = self._reachable
+            
+            if not candidates:
+                self.primary_fallbacks += 1
+                return None
+            
+            index = candidates[next(self._counter) % len(candidates)]
+            self.sessions[index] += 1
+            return index
+    
+    
+    def check(self) -> None:
+        """
+        Elegxos olon ton replicas (lag kai connectivity)
+        """
+        usable, reachable = [], []
+        
+        for index, engine in enumerate(self.engines):
+            try:
+                lag = replica_lag(engine)
+                error = None
+            except Exception as e:
+                lag, error = None, str(e)
+            
+            if error is None:
+                reachable.append(index)
+                if lag is not None and (self.max_lag_seconds <= 0 or lag <= self.max_lag_seconds):
+                    usable.append(index)
+            
+            with self._lock:
+                self._lag[index] = lag
+                self._errors[index] = error
+        
+        with self._lock:
+            self._usable = usable
+            self._reachable = reachable
+            self.last_check_at = datetime.utcnow()
+    
+    
+    def start(self) -> None:
+        if not self.engines or (self._thread is not None and self._thread.is_alive()):
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="replica-monitor", daemon=True)
+        self._thread.start()
+    
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_lag_seconds": self.max_lag_seconds,
+                "fallback_to_primary": self.fallback_to_primary,
+                "primary_fallbacks": self.primary_fallbacks,
+                "last_check_at": self.last_check_at.isoformat() if self.last_check_at else None,
+                "replicas": [
+                    {
+                        "url": engine.url.render_as_string(hide_password=True),
+                        "usable": index in self._usable,
+                        "lag_seconds": self._lag[index],
+                        "error": self._errors[index],
+                        "sessions": self.sessions[index],
+                        "pool": engine.pool.stats() if hasattr(engine.pool, "stats") else None
+                    }
+                    for index, engine in enumerate(self.engines)
+                ]
+            }
+    
+    
+    def _loop(self) -> None:
+        self.check()
+        while not self._stop_event.wait(self.check_interval_seconds):
+            self.check()
+
+
+def replica_lag(engine: Engine) -> Optional[float]:
+    """
+    Replication lag enos replica se seconds
+    
+    Returns:
+        To lag, i None an to replication exei stamatisei
+    """
+    with engine.connect() as connection:
+        if engine.dialect.name != "mysql":
+            #Xoris replication status (p.x. SQLite arxeia gia local testing)
+            connection.exec_driver_sql("SELECT 1")
+            return 0.0
+        
+        #MySQL 8.0.22+: SHOW REPLICA STATUS, palioteres: SHOW SLAVE STATUS
+        try:
+            row = connection.exec_driver_sql("SHOW REPLICA STATUS").mappings().first()
+        except Exception:
+            row = connection.exec_driver_sql("SHOW SLAVE STATUS").mappings().first()
+        
+        if row is None:
+            #Den einai replica (p.x. to idio to primary)
+            return 0.0
+        
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return None if lag is None else float(lag)
+
+
+class RoutingSession(Session):
+    """
+    Session pou stelnei ta SELECT sta replicas kai ola ta alla sto primary
+    
+    Kathe session diavazei apo ena replica (idio connection kai snapshot
+    gia olo to request). Meta apo to proto write (flush, UPDATE/DELETE/
+    INSERT, raw SQL) menei sto primary, gia na vlepei ta dika tou writes.
+    """
+    
+    def __init__(self, replica_set: ReplicaSet, replica_engines: List[Engine], **kwargs):
+        super().__init__(**kwargs)
+        self.replica_set = replica_set
+        self.replica_engines = replica_engines
+    
+    
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self.info.get(PRIMARY_KEY) or self._flushing or not _is_read(clause):
+            self.info[PRIMARY_KEY] = True
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        
+        if REPLICA_KEY not in self.info:
+            self.info[REPLICA_KEY] = self.replica_set.choose()
+        
+        index = self.info[REPLICA_KEY]
+        if index is None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        
+        return self.replica_engines[index]
+
+
+def reads_from_replica(db: Session) -> bool:
+    """
+    True an ta SELECT tou session pigan se replica (mporei na einai stale)
+    """
+    return db.info.get(REPLICA_KEY) is not None and not db.info.get(PRIMARY_KEY)
+
+
+def _is_read(clause) -> bool:
+    #Mono ORM/Core SELECT xoris FOR UPDATE pane sta replicas
+    #(clause None = db.connection() xoris statement, paei sto primary)
+    #Ta lambda_stmt (app.utils.statements) ginontai unwrap sto Select tous
+    clause = getattr(clause, "_resolved", clause)
+    return isinstance(clause, Select) and clause._for_update_arg is None
\ No newline at end of file
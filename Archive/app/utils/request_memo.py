@@ -0,0 +1,47 @@
+from typing import Dict, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.program import Program, ProgramRoleType
+
+MEMO_KEY = "request_memo"
+
+
+class RequestMemo:
+    """
+    Lookups pou epanalamvanontai mesa sto idio request (idio session)
+    
+    Krataei ta programs ana id kai ta roles ana (user_id, program_id), opote
+    oi elegxoi permissions kai state enos service call kanoun to kathe query
+    mia fora. Zei sto db.info: kathe request exei to diko tou memo.
+    
+    Oi services kanoun forget otan allazoun roles i programs. Se rollback
+    to memo adeiazei olo (ta objects kai ta roles mporei na min isxyoun pia).
+    """
+    
+    def __init__(self):
+        self.programs: Dict[int, Program] = {}
+        self.roles: Dict[Tuple[int, int], Tuple[ProgramRoleType, ...]] = {}
+    
+    
+    def forget_program(self, program_id: int) -> None:
+        self.programs.pop(program_id, None)
+        for key in [key for key in self.roles if key[1] == program_id]:
+            del self.roles[key]
+    
+    
+    def forget_roles(self, user_id: int, program_id: int) -> None:
+        self.roles.pop((user_id, program_id), None)
+
+
+def get_request_memo(db: Session) -> RequestMemo:
+    memo = db.info.get(MEMO_KEY)
+    if memo is None:
+        memo = db.info[MEMO_KEY] = RequestMemo()
+    return memo
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_request_memo(session: Session) -> None:
+    session.info.pop(MEMO_KEY, None)
\ No newline at end of file
@@ -0,0 +1,171 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.user import AuthToken
+from app.utils.token_cache import token_cache
+
+settings = get_settings()
+
+#Epikalypsi sto incremental refresh gia clock skew metaksi workers
+REFRESH_OVERLAP = timedelta(seconds=2)
+
+PENDING_KEY = "pending_token_revocations"
+
+
+class RevocationList:
+    """
+    In-memory set apo revoked JWT IDs
+    
+    Xrisimopoieitai sto stateless JWT mode: ena token einai valid an i
+    ypografi tou einai swsti kai to jti tou den einai se auto to set.
+    Kathe jti krataei mono mexri na liksei to idio to token.
+    """
+    
+    def __init__(self):
+        self._revoked: Dict[bytes, float] = {}  #jti (16 bytes) -> expiration timestamp
+        self._lock = threading.Lock()
+        self._watermark: Optional[datetime] = None
+        self._next_refresh = 0.0
+        self.refreshes = 0
+    
+    
+    def revoke(self, jti: str, expires_at: datetime) -> None:
+        """
+        Prosthiki jti sto revocation list
+        """
+        key = self._key(jti)
+        if key is None:
+            return
+        
+        with self._lock:
+            self._revoked[key] = expires_at.replace(tzinfo=timezone.utc).timestamp()
+    
+    
+    def is_revoked(self, jti: str) -> bool:
+        key = self._key(jti)
+        if key is None:
+            return True
+        
+        with self._lock:
+            return key in self._revoked
+    
+    
+    def load(self, db: Session) -> None:
+        """
+        Plires fortosi apo ton pinaka auth_tokens (sto startup)
+        """
+        now = datetime.utcnow()
+        rows = db.query(AuthToken.jti, AuthToken.expires_at).filter(
+            AuthToken.jti != None,
+            AuthToken.is_valid == False,
+            AuthToken.expires_at > now
+        ).all()
+        
+        with self._lock:
+            self._revoked.clear()
+        
+        for jti, expires_at in rows:
+            self.revoke(jti, expires_at)
+        
+        self._watermark = now
+        self._next_refresh = time.monotonic() + settings.REVOCATION_REFRESH_SECONDS
+        self.refreshes += 1
+    
+    
+    def maybe_refresh(self, db: Session) -> None:
+        """
+        Incremental refresh: fortonei mono ta tokens pou egine revoke meta
+        to teleutaio refresh (gia revocations apo allous workers)
+        """
+        if time.monotonic() < self._next_refresh:
+            return
+        
+        if self._watermark is None:
+            self.load(db)
+            return
+        
+        now = datetime.utcnow()
+        rows = db.query(AuthToken.jti, AuthToken.expires_at).filter(
+            AuthToken.jti != None,
+            AuthToken.revoked_at >= self._watermark - REFRESH_OVERLAP,
+            AuthToken.expires_at > now
+        ).all()
+        
+        for jti, expires_at in rows:
+            self.revoke(jti, expires_at)
+        
+        self._prune()
+        self._watermark = now
+        self._next_refresh = time.monotonic() + settings.REVOCATION_REFRESH_SECONDS
+        self.refreshes += 1
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "revoked": len(self._revoked),
+                "refreshes": self.refreshes,
+                "watermark": self._watermark.isoformat() if self._watermark else None
+            }
+    
+    
+    def _prune(self) -> None:
+        #Ta tokens pou exoun liksei aporriptontai idi apo to JWT decode
+        now = time.time()
+        with self._lock:
+            expired = [key for key, expires in self._revoked.items() if expires <= now]
+            for key in expired:
+                del self._revoked[key]
+    
+    
+    @staticmethod
+    def _key(jti: str) -> Optional[bytes]:
+        try:
+            return bytes.fromhex(jti)
+        except (TypeError, ValueError):
+            return None
+
+
+#Ena instance ana process
+revocation_list = RevocationList()
+
+
+def revoke_on_commit(
+    db: Session,
+    user_id: int,
+    digest: Optional[bytes] = None,
+    revoked_tokens: Iterable[tuple[str, datetime]] = ()
+) -> None:
+    """
+    Kataxorei token invalidation pou efarmozetai sto token cache kai sto
+    revocation list MONO afou ginei commit to transaction
+    
+    Args:
+        user_id: O user ton tokens
+        digest: Digest enos sygkekrimenou token (None = ola ta tokens tou user)
+        revoked_tokens: Zeugi (jti, expires_at) gia to revocation list
+    """
+    db.info.setdefault(PENDING_KEY, []).append((user_id, digest, list(revoked_tokens)))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_revocations(session: Session) -> None:
+    for user_id, digest, revoked_tokens in session.info.pop(PENDING_KEY, ()):
+        if digest is None:
+            token_cache.invalidate_user(user_id)
+        else:
+            token_cache.invalidate(digest)
+        
+        for jti, expires_at in revoked_tokens:
+            revocation_list.revoke(jti, expires_at)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_revocations(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
@@ -1,18 +1,67 @@
-from passlib.context import CryptContext
-from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
+import hashlib
+import threading
+import uuid
 from app.config import get_settings
+from app.utils.hash_calibration import build_password_context, calibrate_rounds
+from app.utils.jwt_backend import JWTBackend, build_jwt_backend, TokenDecodeError
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
 settings = get_settings()
 
-#Password hashing context me diaforetikes rithmiseis
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12,  #Perissoteri asfalia
-    bcrypt__ident="2b"  #Xrisi tis pio kainourias ekdosis bcrypt
-)
+#JWT codec (epilegetai apo to Settings.JWT_BACKEND, idio format tokens).
+#Dimiourgeitai sto proto token, gia na min fortonetai to jose sto startup
+_jwt_backend: Optional[JWTBackend] = None
+
+#Password hashing context (dimiourgeitai lazy, giati mporei na xreiastei calibration)
+_pwd_context: Optional["CryptContext"] = None
+_pwd_context_settings: Optional[tuple[str, int]] = None
+_pwd_context_lock = threading.Lock()
+
+
+def configure_password_context(scheme: str, rounds: int) -> None:
+    """
+    Orizei to password hashing context
+    Kaleitai kai apo ta workers tou password pool me ta settings tou parent
+    """
+    global _pwd_context, _pwd_context_settings
+    _pwd_context = build_password_context(scheme, rounds)
+    _pwd_context_settings = (scheme, rounds)
+
+
+def get_password_context_settings() -> tuple[str, int]:
+    """
+    Pairnei to (scheme, rounds) tou password hashing
+    An PASSWORD_HASH_ROUNDS = 0, to cost vgainei apo calibration sto trexon host
+    """
+    with _pwd_context_lock:
+        if _pwd_context_settings is None:
+            scheme = settings.PASSWORD_HASH_SCHEME
+            rounds = settings.PASSWORD_HASH_ROUNDS
+            
+            if rounds <= 0:
+                rounds = calibrate_rounds(scheme, settings.PASSWORD_HASH_TARGET_MS, settings.PASSWORD_HASH_MIN_ROUNDS)
+                print(f"Password hashing calibrated: {scheme} rounds={rounds} (target {settings.PASSWORD_HASH_TARGET_MS}ms)")
+            
+            configure_password_context(scheme, rounds)
+        
+        return _pwd_context_settings
+
+
+def get_jwt_backend() -> JWTBackend:
+    global _jwt_backend
+    if _jwt_backend is None:
+        _jwt_backend = build_jwt_backend(settings.JWT_BACKEND, settings.SECRET_KEY, settings.ALGORITHM)
+    return _jwt_backend
+
+
+def get_pwd_context() -> "CryptContext":
+    if _pwd_context is None:
+        get_password_context_settings()
+    return _pwd_context
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -20,12 +69,27 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Elegxei an to plain password tairiazei me to hashed
     """
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        return get_pwd_context().verify(plain_password, hashed_password)
     except Exception as e:
         print(f"Password verification error: {e}")
         return False
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    Elegxei to password kai, an to hash exei palio cost i scheme, dimiourgei
+    neo hash me ta trexonta settings
+    
+    Returns:
+        Tuple (is_valid, new_hash) - to new_hash einai None an den xreiazetai rehash
+    """
+    try:
+        return get_pwd_context().verify_and_update(plain_password, hashed_password)
+    except Exception as e:
+        print(f"Password verification error: {e}")
+        return False, None
+
+
 def get_password_hash(password: str) -> str:
     """
     Dimiourgei hash apo to password
@@ -35,7 +99,7 @@ def get_password_hash(password: str) -> str:
         raise ValueError("Password is too long (max 72 bytes)")
     
     try:
-        return pwd_context.hash(password)
+        return get_pwd_context().hash(password)
     except Exception as e:
         print(f"Password hashing error: {e}")
         raise
@@ -61,11 +125,7 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     
     to_encode.update({"exp": expire})
     
-    encoded_jwt = jwt.encode(
-        to_encode, 
-        settings.SECRET_KEY, 
-        algorithm=settings.ALGORITHM
-    )
+    encoded_jwt = get_jwt_backend().encode(to_encode)
     
     return encoded_jwt
 
@@ -81,17 +141,27 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
         Ta dedomena tou token an einai valid, alliws None
     """
     try:
-        payload = jwt.decode(
-            token, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
+        payload = get_jwt_backend().decode(token)
         return payload
-    except JWTError:
+    except TokenDecodeError:
         return None
 
 
-def generate_token_for_user(user_id: int, username: str) -> tuple[str, datetime]:
+def token_digest(token: str) -> bytes:
+    """
+    SHA-256 digest tou token (fixed-width key gia lookups kai cache)
+    """
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+def generate_token_id() -> str:
+    """
+    Dimiourgei monadiko JWT ID (jti claim)
+    """
+    return uuid.uuid4().hex
+
+
+def generate_token_for_user(user_id: int, username: str, jti: Optional[str] = None) -> tuple[str, datetime]:
     """
     Dimiourgei token gia sugkekrimeno user
     
@@ -107,6 +177,9 @@ def generate_token_for_user(user_id: int, username: str) -> tuple[str, datetime]
         "exp": expire_time
     }
     
+    if jti:
+        token_data["jti"] = jti
+    
     token = create_access_token(token_data)
     
     return token, expire_time
\ No newline at end of file
@@ -0,0 +1,166 @@
+import hashlib
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+
+settings = get_settings()
+
+#To route tou request pou ektelei to query (to orizei to middleware)
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+START_KEY = "slow_query_start"
+MAX_STATEMENT_LENGTH = 2000
+
+#Normalization: literals kai placeholders -> ?, IN lists -> IN (?...)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s|:\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    SQL xoris times, gia na omadopoiountai ta idia queries
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _IN_LIST.sub("(?...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()[:MAX_STATEMENT_LENGTH]
+
+
+def params_fingerprint(parameters) -> Optional[str]:
+    #Hash ton parameters: ta idia queries me ta idia values fainontai,
+    #xoris na apothikeuontai oi times (passwords, token digests)
+    if not parameters:
+        return None
+    return hashlib.sha256(repr(parameters).encode("utf-8")).hexdigest()[:16]
+
+
+class SlowQueryLog:
+    """
+    Ring buffer me ta queries pou kseperasan to threshold
+    
+    Metraei ton xrono kathe statement me ta cursor events tou engine.
+    Optionally kanei kai EXPLAIN sto idio connection gia ta slow SELECT.
+    """
+    
+    def __init__(self, threshold_ms: float, buffer_size: int, explain: bool):
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._entries = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self.statements = 0
+        self.slow = 0
+        self.explain_failures = 0
+    
+    
+    def install(self, engine: Engine) -> None:
+        """
+        Syndesi me ta cursor events enos engine (gia async engine: to sync_engine)
+        """
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._on_error)
+    
+    
+    def entries(self) -> list:
+        with self._lock:
+            return list(reversed(self._entries))
+    
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_ms,
+                "explain": self.explain,
+                "statements": self.statements,
+                "slow": self.slow,
+                "explain_failures": self.explain_failures,
+                "buffered": len(self._entries),
+                "buffer_size": self._entries.maxlen
+            }
+    
+    
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(START_KEY, []).append(time.perf_counter())
+    
+    
+    def _on_error(self, exception_context) -> None:
+        #To statement apetyxe, den kaleitai to after_cursor_execute
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(START_KEY):
+            conn.info[START_KEY].pop()
+    
+    
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info[START_KEY].pop()) * 1000
+        
+        with self._lock:
+            self.statements += 1
+        
+        if duration_ms < self.threshold_ms:
+            return
+        
+        plan = None
+        explain_error = None
+        if self.explain and not executemany and statement.lstrip()[:6].upper() == "SELECT":
+            try:
+                plan = _explain(conn, statement, parameters)
+            except Exception as e:
+                explain_error = str(e)
+        
+        entry = {
+            "at": datetime.utcnow().isoformat(),
+            "duration_ms": round(duration_ms, 3),
+            "route": current_route.get(),
+            "statement": normalize_sql(statement),
+            "params_fingerprint": params_fingerprint(parameters),
+            "executemany": executemany,
+            "database": conn.engine.url.database,
+            "plan": plan,
+            "explain_error": explain_error
+        }
+        
+        with self._lock:
+            self.slow += 1
+            if explain_error is not None:
+                self.explain_failures += 1
+            self._entries.append(entry)
+        
+        print(f"Slow query ({duration_ms:.1f}ms) {entry['route'] or '-'}: {entry['statement'][:200]}")
+
+
+def _explain(conn, statement: str, parameters) -> list:
+    #Apeutheias DBAPI cursor: to EXPLAIN den perna apo ta events (oute metrietai)
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, [str(value) for value in row])) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+#Ena log ana process (koino gia ola ta engines)
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    buffer_size=settings.SLOW_QUERY_BUFFER_SIZE,
+    explain=settings.SLOW_QUERY_EXPLAIN
+)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import atexit
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, URL
+
+from app.config import MEMORY_DATABASE, get_settings
+
+settings = get_settings()
+
+#Ta arxeia tis memory vasis pou diagraftikan idi se auto to process
+_reset_files = set()
+
+
+def is_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite"
+
+
+def is_memory(url: URL) -> bool:
+    #In-memory SQLite vasi (adeia se kathe startup)
+    return is_memory_file(url) or is_single_connection(url)
+
+
+def is_memory_file(url: URL) -> bool:
+    #SQLITE_PATH=":memory:": arxeio sto tmpfs (MEMORY_DATABASE)
+    return is_sqlite(url) and url.database == MEMORY_DATABASE
+
+
+def is_single_connection(url: URL) -> bool:
+    #Pragmatiki in-memory vasi (sqlite://): yparxei mono mesa se ena connection
+    return is_sqlite(url) and (url.database in (None, "", ":memory:") or url.query.get("mode") == "memory")
+
+
+def install(engine: Engine, memory: bool) -> None:
+    """
+    Pragmas se kathe neo connection (gia async engine: to sync_engine)
+    """
+    event.listen(engine, "connect", _file_pragmas if not memory else _memory_pragmas)
+
+
+def reset_memory_file(url: URL) -> None:
+    """
+    Diagrafi tis memory vasis (mia fora ana process, prin to proto connection)
+    kai sto exit tou process
+    """
+    if url.database in _reset_files:
+        return
+    
+    _reset_files.add(url.database)
+    _remove_database_files(url.database)
+    atexit.register(_remove_database_files, url.database)
+
+
+def _remove_database_files(path: str) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def _common_pragmas(cursor) -> None:
+    #To SQLite den elegxei ta foreign keys by default (to MySQL nai: CASCADE/RESTRICT)
+    cursor.execute("PRAGMA foreign_keys = ON")
+    cursor.execute(f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_MB * 1024}")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+
+
+def _file_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        #WAL: ta reads den perimenoun ton writer (kai o writer ta reads)
+        cursor.execute("PRAGMA journal_mode = WAL")
+        #NORMAL me WAL: fsync mono sto checkpoint, oxi se kathe commit
+        cursor.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+        #Anamoni gia to write lock anti gia amesa "database is locked"
+        cursor.execute(f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+        _common_pragmas(cursor)
+    finally:
+        cursor.close()
+
+
+def _memory_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        #Idia locks me to arxeio (WAL, busy_timeout), xoris fsync: i vasi xanetai sto restart
+        cursor.execute("PRAGMA journal_mode = WAL")
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute(f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}")
+        _common_pragmas(cursor)
+    finally:
+        cursor.close()
\ No newline at end of file
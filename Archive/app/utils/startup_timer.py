@@ -0,0 +1,34 @@
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupTimer:
+    """
+    Xronos ana fasi tou startup, gia to log "Startup completed in ..."
+    """
+    
+    def __init__(self):
+        self.phases: List[Tuple[str, float]] = []
+    
+    
+    def add(self, name: str, duration_ms: float) -> None:
+        self.phases.append((name, duration_ms))
+    
+    
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - started) * 1000)
+    
+    
+    def total_ms(self) -> float:
+        return sum(duration_ms for _, duration_ms in self.phases)
+    
+    
+    def summary(self) -> str:
+        phases = ", ".join(f"{name} {duration_ms:.0f}ms" for name, duration_ms in self.phases)
+        return f"Startup completed in {self.total_ms():.0f}ms ({phases})"
\ No newline at end of file
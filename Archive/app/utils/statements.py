@@ -0,0 +1,45 @@
+"""
+Cached statements gia ta lookups pou ginontai polles fores se kathe request
+
+To lambda_stmt kanei cache to statement me vasi to code tis lambda: to select()
+kai to cache key dimiourgountai mia fora kai se kathe klisi allazoun mono oi
+times ton parameters (program_id, user_id, ...). To db.query(...).filter(...)
+ksanaftiaxnei to Query kai to cache key se kathe klisi.
+
+Xrisi:
+    program = db.scalars(statements.program_by_id(program_id)).first()
+    roles = db.scalars(statements.program_roles(user_id, program_id)).all()
+"""
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from app.models.program import Program, ProgramRole
+from app.models.screening import Screening
+from app.models.user import User
+
+
+def program_by_id(program_id: int) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(Program).where(Program.id == program_id).limit(1))
+
+
+def program_state(program_id: int) -> StatementLambdaElement:
+    #Mono to state, gia tous elegxous pou den xreiazontai olo to Program
+    return lambda_stmt(lambda: select(Program.state).where(Program.id == program_id).limit(1))
+
+
+def screening_by_id(screening_id: int) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(Screening).where(Screening.id == screening_id).limit(1))
+
+
+def user_by_id(user_id: int) -> StatementLambdaElement:
+    return lambda_stmt(lambda: select(User).where(User.id == user_id).limit(1))
+
+
+def program_roles(user_id: int, program_id: int) -> StatementLambdaElement:
+    #Mono ta roles (oxi olo to ProgramRole): xoris identity map kai object loading
+    return lambda_stmt(
+        lambda: select(ProgramRole.role).where(
+            ProgramRole.user_id == user_id,
+            ProgramRole.program_id == program_id
+        ).order_by(ProgramRole.id)
+    )
\ No newline at end of file
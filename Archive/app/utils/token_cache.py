@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Set
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class CachedToken(NamedTuple):
+    user_id: int
+    role: str
+    is_active: bool
+    expires_at: datetime
+
+
+class TokenCache:
+    """
+    Bounded LRU cache me TTL gia tokens pou exoun idi elegxthei sti vasi
+    
+    Key einai to SHA-256 digest tou token, oxi to idio to token.
+    To cache einai ana process, opote to TTL orizei poso stale mporei
+    na einai ena entry se allo worker meta apo invalidation.
+    """
+    
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, tuple[CachedToken, float]]" = OrderedDict()
+        self._user_index: Dict[int, Set[bytes]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    
+    def get(self, digest: bytes) -> Optional[CachedToken]:
+        """
+        Pairnei entry apo to cache (None an den yparxei i exei lixei)
+        """
+        with self._lock:
+            item = self._entries.get(digest)
+            
+            if item is None:
+                self.misses += 1
+                return None
+            
+            entry, deadline = item
+            if deadline <= time.monotonic():
+                self._remove(digest)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return entry
+    
+    
+    def set(self, digest: bytes, entry: CachedToken) -> None:
+        """
+        Apothikeusi entry
+        To TTL den kseperna pote to expiration tou idiou tou token
+        """
+        token_ttl = (entry.expires_at - datetime.utcnow()).total_seconds()
+        ttl = min(self.ttl_seconds, token_ttl)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        
+        with self._lock:
+            if digest in self._entries:
+                self._remove(digest)
+            
+            self._entries[digest] = (entry, time.monotonic() + ttl)
+            self._user_index.setdefault(entry.user_id, set()).add(digest)
+            
+            #LRU eviction
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+    
+    
+    def invalidate(self, digest: bytes) -> None:
+        """
+        Afairesi enos token apo to cache
+        """
+        with self._lock:
+            if digest in self._entries:
+                self._remove(digest)
+                self.invalidations += 1
+    
+    
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Afairesi olon ton tokens enos user apo to cache
+        """
+        with self._lock:
+            for digest in list(self._user_index.get(user_id, ())):
+                self._remove(digest)
+                self.invalidations += 1
+    
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._user_index.clear()
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+    
+    
+    def _remove(self, digest: bytes) -> None:
+        #Prepei na kaleitai me to lock
+        entry, _ = self._entries.pop(digest)
+        user_digests = self._user_index.get(entry.user_id)
+        if user_digests is not None:
+            user_digests.discard(digest)
+            if not user_digests:
+                del self._user_index[entry.user_id]
+
+
+#Ena instance ana process
+token_cache = TokenCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE if settings.TOKEN_CACHE_ENABLED else 0,
+    ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS
+)
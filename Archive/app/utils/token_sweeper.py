@@ -0,0 +1,133 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.user import AuthToken
+
+settings = get_settings()
+
+
+class TokenSweeper:
+    """
+    Background thread pou diagrafei ta expired tokens tou pinaka auth_tokens
+    
+    Ta tokens diagrafontai se chunks (ena commit ana batch) gia na min
+    kleidonei o pinakas gia poly. Ta invalid tokens pou den exoun liksei
+    menoun, giati ta xreiazetai to revocation list tou stateless mode.
+    """
+    
+    def __init__(self, interval_seconds: int, batch_size: int, retention_hours: int):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.retention = timedelta(hours=retention_hours)
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.batches = 0
+        self.deleted_total = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_run_deleted = 0
+        self.last_run_duration_ms = 0.0
+        self.last_error: Optional[str] = None
+    
+    
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="token-sweeper", daemon=True)
+        self._thread.start()
+    
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    
+    def run_once(self) -> int:
+        """
+        Mia plires ektelesi tou sweeper
+        
+        Returns:
+            Arithmos diagrammenon tokens
+        """
+        started = time.perf_counter()
+        cutoff = datetime.utcnow() - self.retention
+        deleted = 0
+        
+        db = SessionLocal()
+        try:
+            while not self._stop_event.is_set():
+                #Prota ta ids, giati to MySQL den dexetai LIMIT se DELETE ... IN (subquery)
+                token_ids = [row[0] for row in db.query(AuthToken.id).filter(
+                    AuthToken.expires_at < cutoff
+                ).order_by(AuthToken.id).limit(self.batch_size).all()]
+                
+                if not token_ids:
+                    break
+                
+                db.query(AuthToken).filter(
+                    AuthToken.id.in_(token_ids)
+                ).delete(synchronize_session=False)
+                db.commit()
+                
+                deleted += len(token_ids)
+                with self._lock:
+                    self.batches += 1
+                
+                if len(token_ids) < self.batch_size:
+                    break
+            
+            error = None
+        except Exception as e:
+            db.rollback()
+            error = str(e)
+        finally:
+            db.close()
+        
+        with self._lock:
+            self.runs += 1
+            self.deleted_total += deleted
+            self.last_run_at = datetime.utcnow()
+            self.last_run_deleted = deleted
+            self.last_run_duration_ms = (time.perf_counter() - started) * 1000
+            self.last_error = error
+        
+        return deleted
+    
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "interval_seconds": self.interval_seconds,
+                "batch_size": self.batch_size,
+                "retention_hours": self.retention.total_seconds() / 3600,
+                "runs": self.runs,
+                "batches": self.batches,
+                "deleted_total": self.deleted_total,
+                "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+                "last_run_deleted": self.last_run_deleted,
+                "last_run_duration_ms": self.last_run_duration_ms,
+                "last_error": self.last_error
+            }
+    
+    
+    def _loop(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self.run_once()
+
+
+#Ena sweeper ana process
+token_sweeper = TokenSweeper(
+    interval_seconds=settings.TOKEN_SWEEPER_INTERVAL_SECONDS,
+    batch_size=settings.TOKEN_SWEEPER_BATCH_SIZE,
+    retention_hours=settings.TOKEN_RETENTION_HOURS
+)
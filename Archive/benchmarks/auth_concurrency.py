@@ -0,0 +1,84 @@
+"""
+Benchmark: throughput ton authenticated endpoints ypo concurrency
+
+Sygkrinei to palio async get_current_user (blocking queries mesa sto
+event loop) me to twrino sync dependency pou trexei sto threadpool.
+
+Xrisi (apo to Archive/):
+    python -m benchmarks.auth_concurrency --requests 400 --concurrency 50 --latency-ms 5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+#To token cache tha ekrype to kostos tou DB lookup
+os.environ.setdefault("TOKEN_CACHE_ENABLED", "false")
+os.environ.setdefault("DEBUG", "false")
+
+import httpx
+from fastapi import Depends, Header
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.main import app
+from app.database import get_db
+from app.utils.dependencies import get_current_user, get_current_user_async
+from benchmarks.common import make_bench_engine, seed_active_user, override_get_db
+
+
+async def _blocking_get_current_user(
+    authorization: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    #Anaparagogi tis palias symperiforas: sync DB I/O mesa se async def
+    return get_current_user(authorization, db)
+
+
+async def _run(path: str, token: str, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+    
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200, response.text
+        
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Texniti kathysterisi ana SQL statement")
+    parser.add_argument("--path", default="/users/me")
+    args = parser.parse_args()
+    
+    _, session_factory = make_bench_engine(args.latency_ms)
+    token = seed_active_user(session_factory)
+    override_get_db(app, session_factory)
+    
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {args.latency_ms}ms ana statement, GET {args.path}")
+    
+    #To /users/me xrisimopoiei to async dependency, opote antikathistatai
+    #me ti ekdosi pou metrame (to benchmark database einai mono sync)
+    for label, override in (("before (async def, blocking)", _blocking_get_current_user), ("after (sync def, threadpool)", get_current_user)):
+        app.dependency_overrides[get_current_user_async] = override
+        
+        elapsed = asyncio.run(_run(args.path, token, args.requests, args.concurrency))
+        print(f"  {label:32s} {args.requests / elapsed:8.1f} req/s  ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: xronos ana klisi gia ta hot lookups, me kai xoris cached statements
+
+"query" einai to palio db.query(...).filter(...).first(), "cached" einai ta
+lambda statements tou app.utils.statements. To SQLite (xoris latency) kanei
+to DB meros poly mikro, opote i diafora einai kyrios to Python overhead.
+
+Xrisi (apo to Archive/):
+    python -m benchmarks.cached_statements --iterations 5000
+"""
+import argparse
+import time
+from datetime import date
+
+from benchmarks.common import make_bench_engine
+from app.models.program import Program, ProgramRole, ProgramState, ProgramRoleType
+from app.models.screening import Screening, ScreeningState
+from app.models.user import User, UserRole
+from app.utils import statements
+
+
+def _seed(session_factory) -> tuple:
+    db = session_factory()
+    try:
+        user = User(username="benchuser", password_hash="-", full_name="Benchmark User", role=UserRole.USER, is_active=True)
+        program = Program(name="Bench", start_date=date.today(), end_date=date.today(), state=ProgramState.SUBMISSION)
+        db.add_all([user, program])
+        db.flush()
+        
+        screening = Screening(program_id=program.id, submitter_id=user.id, film_title="Bench", state=ScreeningState.CREATED)
+        db.add_all([screening, ProgramRole(user_id=user.id, program_id=program.id, role=ProgramRoleType.SUBMITTER)])
+        db.commit()
+        
+        return user.id, program.id, screening.id
+    finally:
+        db.close()
+
+
+def _microseconds_per_call(session_factory, func, iterations: int) -> float:
+    db = session_factory()
+    try:
+        func(db)  #Warm-up (compiled cache kai lambda cache)
+        
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func(db)
+            db.expunge_all()
+        return (time.perf_counter() - started) / iterations * 1_000_000
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    
+    _, session_factory = make_bench_engine()
+    user_id, program_id, screening_id = _seed(session_factory)
+    
+    lookups = {
+        "program by id": (
+            lambda db: db.query(Program).filter(Program.id == program_id).first(),
+            lambda db: db.scalars(statements.program_by_id(program_id)).first()
+        ),
+        "screening by id": (
+            lambda db: db.query(Screening).filter(Screening.id == screening_id).first(),
+            lambda db: db.scalars(statements.screening_by_id(screening_id)).first()
+        ),
+        "user by id": (
+            lambda db: db.query(User).filter(User.id == user_id).first(),
+            lambda db: db.scalars(statements.user_by_id(user_id)).first()
+        ),
+        "program role": (
+            lambda db: db.query(ProgramRole).filter(
+                ProgramRole.user_id == user_id,
+                ProgramRole.program_id == program_id
+            ).first().role,
+            lambda db: db.scalars(statements.program_roles(user_id, program_id)).first()
+        )
+    }
+    
+    print(f"{args.iterations} iterations, SQLite without latency")
+    print(f"{'lookup':16s} {'query us/call':>14s} {'cached us/call':>15s} {'speedup':>8s}")
+    
+    for name, (query_lookup, cached_lookup) in lookups.items():
+        db = session_factory()
+        try:
+            assert query_lookup(db) is not None and cached_lookup(db) is not None
+        finally:
+            db.close()
+        
+        query_us = _microseconds_per_call(session_factory, query_lookup, args.iterations)
+        cached_us = _microseconds_per_call(session_factory, cached_lookup, args.iterations)
+        print(f"{name:16s} {query_us:14.1f} {cached_us:15.1f} {query_us / cached_us:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
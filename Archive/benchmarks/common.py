@@ -0,0 +1,89 @@
+"""
+Koina helpers gia ta benchmarks
+
+Ta benchmarks trexoun xoris MySQL: xrisimopoioun ena SQLite arxeio kai
+prosthetoun texniti kathysterisi se kathe statement gia na prosomoiosoun
+to network round trip pros ton database server.
+"""
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+
+def make_bench_engine(latency_ms: float = 0.0):
+    """
+    Dimiourgia SQLite engine se temp arxeio
+    
+    Args:
+        latency_ms: Texniti kathysterisi ana statement (prosomoiosi RTT)
+    """
+    path = os.path.join(tempfile.mkdtemp(prefix="cinema-bench-"), "bench.db")
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=64,
+        max_overflow=0
+    )
+    
+    #Idia pragmas me to DB_BACKEND=sqlite tou app (WAL, busy_timeout)
+    from app.utils import sqlite_backend
+    sqlite_backend.install(engine, memory=False)
+    
+    if latency_ms > 0:
+        @event.listens_for(engine, "before_cursor_execute")
+        def _simulate_latency(conn, cursor, statement, parameters, context, executemany):
+            time.sleep(latency_ms / 1000.0)
+    
+    from app.database import Base
+    from app.models import user, program, screening  # noqa: F401
+    Base.metadata.create_all(bind=engine)
+    
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def seed_active_user(session_factory, username: str = "benchuser", password: str = "Bench@1234") -> str:
+    """
+    Dimiourgia active user kai login
+    
+    Returns:
+        To access token tou user
+    """
+    from app.models.user import User, UserRole
+    from app.schemas.user import UserLogin
+    from app.services.auth_service import AuthService
+    from app.utils.security import get_password_hash
+    
+    db = session_factory()
+    try:
+        db.add(User(
+            username=username,
+            password_hash=get_password_hash(password),
+            full_name="Benchmark User",
+            role=UserRole.USER,
+            is_active=True
+        ))
+        db.commit()
+        
+        _, token = AuthService.authenticate_user(db, UserLogin(username=username, password=password))
+        return token
+    finally:
+        db.close()
+
+
+def override_get_db(app, session_factory) -> None:
+    """
+    Ta routes tou app xrisimopoioun to benchmark database
+    """
+    from app.database import get_db
+    
+    def _get_bench_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[get_db] = _get_bench_db
@@ -0,0 +1,58 @@
+"""
+Benchmark: encode/decode ops ana second gia kathe JWT backend
+
+Elegxei kai oti ola ta backends vgazoun to idio token gia ta idia claims
+kai oti to kathe token ginetai decode apo ola ta alla.
+
+Xrisi (apo to Archive/):
+    python -m benchmarks.jwt_backends --iterations 20000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from app.config import get_settings
+from app.utils.jwt_backend import JWT_BACKENDS, build_jwt_backend
+from app.utils.security import generate_token_id
+
+
+def _ops_per_second(func, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    
+    settings = get_settings()
+    backends = {name: build_jwt_backend(name, settings.SECRET_KEY, settings.ALGORITHM) for name in JWT_BACKENDS}
+    claims = {
+        "sub": "benchuser",
+        "user_id": 42,
+        "exp": datetime.utcnow() + timedelta(minutes=30),
+        "jti": generate_token_id()
+    }
+    
+    #Idio token format apo ola ta backends
+    tokens = {name: backend.encode(claims) for name, backend in backends.items()}
+    assert len(set(tokens.values())) == 1, "Backends produce different tokens"
+    for backend in backends.values():
+        for token in tokens.values():
+            assert backend.decode(token)["user_id"] == 42
+    
+    token = next(iter(tokens.values()))
+    print(f"{settings.ALGORITHM}, {args.iterations} iterations")
+    print(f"{'backend':8s} {'encode ops/s':>14s} {'decode ops/s':>14s}")
+    
+    for name, backend in backends.items():
+        encode_ops = _ops_per_second(lambda: backend.encode(claims), args.iterations)
+        decode_ops = _ops_per_second(lambda: backend.decode(token), args.iterations)
+        print(f"{name:8s} {encode_ops:14.0f} {decode_ops:14.0f}")
+
+
+if __name__ == "__main__":
+    main()
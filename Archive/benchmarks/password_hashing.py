@@ -0,0 +1,54 @@
+"""
+Benchmark: password hashes ana second ana core gia kathe scheme kai cost
+
+Metraei ton xrono enos hash se ena process (= ena core) kai deixnei kai
+to cost pou tha dialege i calibration gia to target latency.
+
+Xrisi (apo to Archive/):
+    python -m benchmarks.password_hashing --target-ms 250
+"""
+import argparse
+
+from app.utils.hash_calibration import calibrate_rounds, measure_hash_time
+
+#Ypopsifia settings ana scheme
+CANDIDATES = {
+    "bcrypt": [10, 11, 12, 13, 14],
+    "scrypt": [14, 15, 16, 17],
+    "argon2": [2, 3, 4, 6]
+}
+
+
+def _available(scheme: str) -> bool:
+    try:
+        measure_hash_time(scheme, CANDIDATES[scheme][0], samples=1)
+        return True
+    except Exception as e:
+        print(f"{scheme}: not available ({e})")
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--schemes", nargs="+", default=list(CANDIDATES))
+    args = parser.parse_args()
+    
+    print(f"{'scheme':8s} {'rounds':>6s} {'ms/hash':>10s} {'hashes/s/core':>14s}")
+    
+    for scheme in args.schemes:
+        if not _available(scheme):
+            continue
+        
+        for rounds in CANDIDATES[scheme]:
+            seconds = measure_hash_time(scheme, rounds, samples=args.samples)
+            print(f"{scheme:8s} {rounds:6d} {seconds * 1000:10.1f} {1 / seconds:14.2f}")
+        
+        chosen = calibrate_rounds(scheme, args.target_ms, min_rounds=1)
+        print(f"{scheme:8s} calibration for {args.target_ms:.0f}ms -> rounds={chosen}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import itertools
+import os
+import tempfile
+from collections import namedtuple
+
+#To settings diavazetai sto import tou app: prota to environment ton tests
+#(SQLite arxeio, grigoro hashing sto idio thread, xoris background sweeper)
+TEST_DIR = tempfile.mkdtemp(prefix="cinema-tests-")
+os.environ["DB_BACKEND"] = "sqlite"
+os.environ["SQLITE_PATH"] = os.path.join(TEST_DIR, "cinema.db")
+os.environ["PASSWORD_HASH_ROUNDS"] = "4"
+os.environ["PASSWORD_HASH_MIN_ROUNDS"] = "4"
+os.environ["PASSWORD_POOL_SIZE"] = "0"
+os.environ["TOKEN_SWEEPER_ENABLED"] = "false"
+os.environ["AUTO_REJECT_ON_DECISION"] = "false"
+os.environ["STARTUP_MODE"] = "full"
+#Ena process: ta invalidations tou program cache ginontai topika, opote o elegxos
+#tou version sti vasi den xreiazetai (kai den allazei ta query counts ana xrono)
+os.environ["PROGRAM_CACHE_VERSION_CHECK_SECONDS"] = "3600"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import SessionLocal
+
+ADMIN_PASSWORD = "Admin@123"
+USER_PASSWORD = "Passw0rd!"
+
+_usernames = itertools.count(1)
+
+ApiUser = namedtuple("ApiUser", ["id", "username", "headers"])
+
+
+def auth_headers(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(scope="session")
+def client():
+    #To startup ftiaxnei to schema kai ton default admin
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    response = client.post("/auth/login", json={"username": "admin", "password": ADMIN_PASSWORD})
+    assert response.status_code == 200, response.text
+    return auth_headers(response.json()["access_token"])
+
+
+@pytest.fixture(scope="session")
+def make_user(client, admin_headers):
+    """
+    Dimiourgia energou user
+    
+    Returns:
+        Function pou epistrefei ena ApiUser (id, username, headers)
+    """
+    def _make_user(prefix: str = "user"):
+        username = f"{prefix}{next(_usernames):04d}"
+        response = client.post("/auth/register", json={
+            "username": username,
+            "password": USER_PASSWORD,
+            "full_name": username
+        })
+        assert response.status_code == 201, response.text
+        user_id = response.json()["id"]
+        
+        response = client.put(f"/users/{user_id}/activate", headers=admin_headers)
+        assert response.status_code == 200, response.text
+        
+        response = client.post("/auth/login", json={"username": username, "password": USER_PASSWORD})
+        assert response.status_code == 200, response.text
+        return ApiUser(user_id, username, auth_headers(response.json()["access_token"]))
+    
+    return _make_user
+
+
+def create_program(client, programmer: ApiUser, staff=()) -> int:
+    """
+    Dimiourgia program apo ton programmer, me tous staff users tou
+    """
+    response = client.post("/programs/", headers=programmer.headers, json={
+        "name": f"Program {next(_usernames):04d}",
+        "start_date": "2026-01-01",
+        "end_date": "2026-02-01"
+    })
+    assert response.status_code == 201, response.text
+    program_id = response.json()["id"]
+    
+    for user in staff:
+        response = client.post(f"/programs/{program_id}/staff", headers=programmer.headers, json={
+            "user_id": user.id,
+            "role": "STAFF"
+        })
+        assert response.status_code == 201, response.text
+    
+    return program_id
+
+
+def set_program_state(client, program_id: int, programmer: ApiUser, state: str) -> None:
+    response = client.put(f"/programs/{program_id}/state", headers=programmer.headers, json={"new_state": state})
+    assert response.status_code == 200, response.text
+
+
+def create_screening(client, program_id: int, submitter: ApiUser, title: str = "Film", submit: bool = True) -> int:
+    """
+    Dimiourgia screening (kai submit) apo ton submitter
+    """
+    response = client.post("/screenings/", headers=submitter.headers, json={
+        "program_id": program_id,
+        "film_title": title,
+        "film_duration": 90,
+        "film_genre": "drama",
+        "auditorium_name": "A",
+        "start_time": "2026-01-02T10:00:00",
+        "end_time": "2026-01-02T12:00:00"
+    })
+    assert response.status_code == 201, response.text
+    screening_id = response.json()["id"]
+    
+    if submit:
+        response = client.post(f"/screenings/{screening_id}/submit", headers=submitter.headers)
+        assert response.status_code == 200, response.text
+    
+    return screening_id
\ No newline at end of file
@@ -0,0 +1,170 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import get_settings
+from app.database import build_async_engine
+from app.models.user import User
+from app.schemas.program import ProgramResponse, ProgramSearchParams
+from app.schemas.screening import ScreeningResponse, ScreeningSearchParams
+from app.schemas.user import UserResponse
+from app.services.program_service import ProgramService
+from app.services.screening_service import ScreeningService
+from tests.conftest import create_program, create_screening, set_program_state
+
+#Ta read routes einai async (get_async_read_db, aiosqlite): ta apotelesmata
+#prepei na einai idia me tis sync ekdoseis ton services
+
+
+@pytest.fixture(scope="module")
+def scenario(client, make_user, admin_headers):
+    programmer, staff, submitter, outsider = (make_user(prefix) for prefix in ("prog", "staff", "subm", "outs"))
+    
+    #Ena ANNOUNCED program me screenings se oles tis katastaseis
+    program_id = create_program(client, programmer, [staff])
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    scheduled = create_screening(client, program_id, submitter, "Alpha")
+    approved = create_screening(client, program_id, submitter, "Beta")
+    created = create_screening(client, program_id, submitter, "Gamma", submit=False)
+    
+    set_program_state(client, program_id, programmer, "ASSIGNMENT")
+    for screening_id in (scheduled, approved):
+        response = client.put(f"/screenings/{screening_id}/assign-handler", headers=programmer.headers, json={"handler_id": staff.id})
+        assert response.status_code == 200, response.text
+    
+    set_program_state(client, program_id, programmer, "REVIEW")
+    for screening_id in (scheduled, approved):
+        response = client.post(f"/screenings/{screening_id}/review", headers=staff.headers, json={"review_score": 8, "review_comments": "ok"})
+        assert response.status_code == 200, response.text
+    
+    set_program_state(client, program_id, programmer, "SCHEDULING")
+    for screening_id in (scheduled, approved):
+        response = client.post(f"/screenings/{screening_id}/approve", headers=submitter.headers, json={"approval_notes": "ok"})
+        assert response.status_code == 200, response.text
+    
+    set_program_state(client, program_id, programmer, "FINAL_PUBLICATION")
+    assert client.post(f"/screenings/{scheduled}/final-submit", headers=submitter.headers).status_code == 200
+    set_program_state(client, program_id, programmer, "DECISION")
+    assert client.post(f"/screenings/{scheduled}/accept", headers=programmer.headers).status_code == 200
+    set_program_state(client, program_id, programmer, "ANNOUNCED")
+    
+    #Kai ena program pou den einai akoma ANNOUNCED
+    draft_id = create_program(client, programmer, [staff])
+    set_program_state(client, draft_id, programmer, "SUBMISSION")
+    draft_screening = create_screening(client, draft_id, submitter, "Delta")
+    
+    admin_id = client.get("/users/me", headers=admin_headers).json()["id"]
+    
+    return {
+        "users": {
+            "visitor": (None, {}),
+            "admin": (admin_id, admin_headers),
+            "programmer": (programmer.id, programmer.headers),
+            "staff": (staff.id, staff.headers),
+            "submitter": (submitter.id, submitter.headers),
+            "outsider": (outsider.id, outsider.headers)
+        },
+        "programs": (program_id, draft_id),
+        "screenings": (scheduled, approved, created, draft_screening)
+    }
+
+
+def _sync_result(call, schema):
+    #Idio format me to response tou route (status, JSON body)
+    try:
+        result = call()
+    except HTTPException as e:
+        return e.status_code, {"detail": e.detail}
+    
+    if isinstance(result, list):
+        return 200, [schema.model_validate(item).model_dump(mode="json") for item in result]
+    return 200, schema.model_validate(result).model_dump(mode="json")
+
+
+def _route_result(client, path, headers):
+    response = client.get(path, headers=headers)
+    return response.status_code, response.json()
+
+
+def _users(scenario, db):
+    for name, (user_id, headers) in scenario["users"].items():
+        user = db.get(User, user_id) if user_id else None
+        yield name, user, headers
+
+
+def _path(path, user):
+    return path + "/authenticated" if user else path
+
+
+def test_program_search_matches_sync(client, db, scenario):
+    for name, user, headers in _users(scenario, db):
+        expected = _sync_result(lambda: ProgramService.search_programs(db, ProgramSearchParams(), user), ProgramResponse)
+        assert _route_result(client, _path("/programs/search", user), headers) == expected, name
+
+
+def test_program_details_match_sync(client, db, scenario):
+    for program_id in scenario["programs"]:
+        for name, user, headers in _users(scenario, db):
+            expected = _sync_result(lambda: ProgramService.get_program_details(db, program_id, user), ProgramResponse)
+            assert _route_result(client, _path(f"/programs/{program_id}", user), headers) == expected, (name, program_id)
+
+
+def test_screening_search_matches_sync(client, db, scenario):
+    for program_id in scenario["programs"]:
+        for name, user, headers in _users(scenario, db):
+            expected = _sync_result(
+                lambda: ScreeningService.search_screenings(db, program_id, ScreeningSearchParams(), user),
+                ScreeningResponse
+            )
+            path = _path(f"/screenings/program/{program_id}/search", user)
+            assert _route_result(client, path, headers) == expected, (name, program_id)
+
+
+def test_visitor_sees_only_scheduled(client, scenario):
+    program_id, draft_id = scenario["programs"]
+    
+    response = client.get(f"/screenings/program/{program_id}/search")
+    assert [screening["id"] for screening in response.json()] == [scenario["screenings"][0]]
+    assert client.get(f"/screenings/program/{draft_id}/search").json() == []
+
+
+def test_screening_details_match_sync(client, db, scenario):
+    for screening_id in scenario["screenings"]:
+        for name, user, headers in _users(scenario, db):
+            expected = _sync_result(lambda: ScreeningService.get_screening_details(db, screening_id, user), ScreeningResponse)
+            path = _path(f"/screenings/{screening_id}", user)
+            assert _route_result(client, path, headers) == expected, (name, screening_id)
+
+
+def test_users_me_matches_sync(client, db, scenario):
+    for name, user, headers in _users(scenario, db):
+        if user is None:
+            assert client.get("/users/me").status_code == 401
+            continue
+        
+        expected = UserResponse.model_validate(user).model_dump(mode="json")
+        assert _route_result(client, "/users/me", headers) == (200, expected), name
+
+
+async def test_async_services_match_sync(client, db, scenario):
+    #Xoristo async engine: to engine tou app anikei sto event loop tou TestClient
+    engine = build_async_engine(get_settings().database_url)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    program_id, _ = scenario["programs"]
+    
+    try:
+        for name, user, _ in _users(scenario, db):
+            async with session_factory() as async_db:
+                programs = await ProgramService.search_programs_async(async_db, ProgramSearchParams(), user)
+                screenings = await ScreeningService.search_screenings_async(async_db, program_id, ScreeningSearchParams(), user)
+            
+            assert (
+                [ProgramResponse.model_validate(item).model_dump(mode="json") for item in programs]
+                == _sync_result(lambda: ProgramService.search_programs(db, ProgramSearchParams(), user), ProgramResponse)[1]
+            ), name
+            assert (
+                [ScreeningResponse.model_validate(item).model_dump(mode="json") for item in screenings]
+                == _sync_result(lambda: ScreeningService.search_screenings(db, program_id, ScreeningSearchParams(), user), ScreeningResponse)[1]
+            ), name
+    finally:
+        await engine.dispose()
\ No newline at end of file
@@ -0,0 +1,36 @@
+from app.utils.query_counter import assert_max_queries
+from tests.conftest import USER_PASSWORD
+
+
+def test_login_success_queries(client, make_user):
+    user = make_user("login")
+    
+    #SELECT user, UPDATE ton palion tokens, INSERT tou neou token
+    with assert_max_queries(3):
+        response = client.post("/auth/login", json={"username": user.username, "password": USER_PASSWORD})
+    assert response.status_code == 200, response.text
+
+
+def test_login_wrong_password_queries(client, make_user):
+    user = make_user("login")
+    
+    #SELECT user kai ena UPDATE gia to failed_login_attempts (kai to lockout)
+    with assert_max_queries(2):
+        response = client.post("/auth/login", json={"username": user.username, "password": "Wrong!123a"})
+    assert response.status_code == 401, response.text
+
+
+def test_login_after_failure_queries(client, make_user):
+    user = make_user("login")
+    client.post("/auth/login", json={"username": user.username, "password": "Wrong!123a"})
+    
+    #Extra UPDATE mono gia to reset tou failed_login_attempts
+    with assert_max_queries(4):
+        response = client.post("/auth/login", json={"username": user.username, "password": USER_PASSWORD})
+    assert response.status_code == 200, response.text
+
+
+def test_login_unknown_user_queries(client):
+    with assert_max_queries(1):
+        response = client.post("/auth/login", json={"username": "nobody99", "password": "Wrong!123a"})
+    assert response.status_code == 401, response.text
\ No newline at end of file
@@ -0,0 +1,153 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.config import get_settings
+from app.models.screening import Screening, ScreeningState
+from app.services.screening_service import ScreeningService
+from app.utils.auto_reject_jobs import AutoRejectJobs, auto_reject_jobs
+from tests.conftest import create_program, create_screening, set_program_state
+
+AUTO_REJECTION_REASON = "Automatic rejection - not finally submitted"
+
+
+def _final_publication_program(client, make_user, approved=5):
+    """
+    Program se FINAL_PUBLICATION me approved screenings (to teleutaio final
+    submitted), ena REVIEWED kai ena CREATED screening
+    """
+    programmer, staff, submitter = make_user("prog"), make_user("staff"), make_user("subm")
+    program_id = create_program(client, programmer, [staff])
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    submitted = [create_screening(client, program_id, submitter, f"Film {i}") for i in range(approved + 2)]
+    created = create_screening(client, program_id, submitter, "Draft", submit=False)
+    
+    set_program_state(client, program_id, programmer, "ASSIGNMENT")
+    for screening_id in submitted:
+        client.put(f"/screenings/{screening_id}/assign-handler", headers=programmer.headers, json={"handler_id": staff.id})
+    
+    set_program_state(client, program_id, programmer, "REVIEW")
+    response = client.post(f"/screenings/program/{program_id}/bulk/review", headers=staff.headers, json={
+        "items": [{"screening_id": screening_id, "review_score": 7, "review_comments": "ok"} for screening_id in submitted]
+    })
+    assert response.json()["succeeded"] == len(submitted), response.text
+    
+    set_program_state(client, program_id, programmer, "SCHEDULING")
+    response = client.post(f"/screenings/program/{program_id}/bulk/approve", headers=submitter.headers, json={
+        "items": [{"screening_id": screening_id} for screening_id in submitted[:-1]]
+    })
+    assert response.json()["succeeded"] == approved + 1, response.text
+    
+    set_program_state(client, program_id, programmer, "FINAL_PUBLICATION")
+    final = submitted[-2]
+    assert client.post(f"/screenings/{final}/final-submit", headers=submitter.headers).status_code == 200
+    
+    return programmer, program_id, {
+        "rejected": submitted[:approved],
+        "final": final,
+        "reviewed": submitted[-1],
+        "created": created
+    }
+
+
+def _states(db, screening_ids):
+    db.expire_all()
+    screenings = db.query(Screening).filter(Screening.id.in_(screening_ids)).all()
+    return {screening.id: (screening.state, screening.rejection_reason) for screening in screenings}
+
+
+@pytest.mark.parametrize("batch_size, batches", [(0, [5]), (2, [2, 2, 1]), (5, [5]), (10, [5])])
+def test_auto_reject_non_submitted(client, db, make_user, batch_size, batches):
+    _, program_id, screenings = _final_publication_program(client, make_user)
+    
+    calls = []
+    count = ScreeningService.auto_reject_non_submitted(db, program_id, batch_size=batch_size, on_batch=calls.append)
+    
+    #Chunks me ti seira ton ids, to teleutaio mikrotero (i adeio) stamataei to loop
+    assert count == 5
+    assert calls == batches
+    
+    states = _states(db, screenings["rejected"])
+    assert set(states.values()) == {(ScreeningState.REJECTED, AUTO_REJECTION_REASON)}
+    
+    #Ta final submitted kai ta mi APPROVED den allazoun
+    states = _states(db, [screenings["final"], screenings["reviewed"], screenings["created"]])
+    assert states[screenings["final"]][0] == ScreeningState.APPROVED
+    assert states[screenings["reviewed"]][0] == ScreeningState.REVIEWED
+    assert states[screenings["created"]][0] == ScreeningState.CREATED
+    
+    #Deuteri ektelesi: tipota gia aporripsi
+    assert ScreeningService.auto_reject_non_submitted(db, program_id, batch_size=batch_size) == 0
+
+
+def _wait(jobs, job_id, timeout=10.0):
+    #To job trexei sto thread tou AutoRejectJobs
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = jobs.get(job_id)
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Auto-reject job {job_id} did not finish")
+
+
+def test_decision_transition_enqueues_job(client, db, make_user, monkeypatch):
+    monkeypatch.setattr(get_settings(), "AUTO_REJECT_ON_DECISION", True)
+    monkeypatch.setattr(auto_reject_jobs, "batch_size", 2)
+    programmer, program_id, screenings = _final_publication_program(client, make_user)
+    
+    #Prin to DECISION den yparxei job
+    path = f"/screenings/program/{program_id}/auto-reject/job"
+    assert client.get(path, headers=programmer.headers).status_code == 404
+    
+    set_program_state(client, program_id, programmer, "DECISION")
+    job = _wait(auto_reject_jobs, auto_reject_jobs.latest(program_id)["id"])
+    
+    assert job["status"] == "completed" and job["error"] is None
+    assert (job["total"], job["rejected"], job["batches"], job["progress"]) == (5, 5, 3, 1.0)
+    assert client.get(path, headers=programmer.headers).json() == job
+    
+    states = _states(db, screenings["rejected"] + [screenings["final"]])
+    assert states[screenings["final"]][0] == ScreeningState.APPROVED
+    assert {states[screening_id][0] for screening_id in screenings["rejected"]} == {ScreeningState.REJECTED}
+
+
+def test_job_status_only_for_programmers(client, make_user, monkeypatch):
+    monkeypatch.setattr(get_settings(), "AUTO_REJECT_ON_DECISION", True)
+    programmer, staff, outsider = make_user("prog"), make_user("staff"), make_user("outs")
+    program_id = create_program(client, programmer, [staff])
+    for state in ("SUBMISSION", "ASSIGNMENT", "REVIEW", "SCHEDULING", "FINAL_PUBLICATION", "DECISION"):
+        set_program_state(client, program_id, programmer, state)
+    _wait(auto_reject_jobs, auto_reject_jobs.latest(program_id)["id"])
+    
+    path = f"/screenings/program/{program_id}/auto-reject/job"
+    assert client.get(path, headers=programmer.headers).json()["total"] == 0
+    for user in (staff, outsider):
+        assert client.get(path, headers=user.headers).status_code == 403
+    assert client.get(path).status_code == 401
+
+
+def test_enqueue_reuses_active_job(client, make_user):
+    _, program_id, _ = _final_publication_program(client, make_user)
+    jobs = AutoRejectJobs(batch_size=2, history_size=10)
+    
+    #To thread tou executor einai apasxolimeno: to job menei queued
+    release = threading.Event()
+    jobs._executor = ThreadPoolExecutor(max_workers=1)
+    jobs._executor.submit(release.wait)
+    try:
+        queued = jobs.enqueue(program_id)
+        assert queued["status"] == "queued"
+        assert jobs.enqueue(program_id)["id"] == queued["id"]
+        assert jobs.stats()["queued"] == 1
+    finally:
+        release.set()
+    
+    job = _wait(jobs, queued["id"])
+    assert (job["status"], job["rejected"], job["batches"]) == ("completed", 5, 3)
+    
+    #Meta to telos tou job, neo enqueue = neo job
+    assert jobs.enqueue(program_id)["id"] != queued["id"]
+    jobs.shutdown()
\ No newline at end of file
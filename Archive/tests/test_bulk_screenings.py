@@ -0,0 +1,126 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from app.models.program import Program, ProgramState
+from app.models.screening import Screening, ScreeningState
+from app.models.user import User
+from app.schemas.screening import BulkScreeningApproval
+from app.services.program_service import ProgramService
+from app.services.screening_service import ScreeningService
+from app.utils.program_cache import program_cache
+from app.utils.query_counter import assert_max_queries
+from tests.conftest import create_program, create_screening, set_program_state
+
+
+@pytest.fixture
+def reviewed(client, make_user):
+    #Program se SCHEDULING me 6 reviewed screenings
+    programmer, staff, submitter = make_user("prog"), make_user("staff"), make_user("subm")
+    program_id = create_program(client, programmer, [staff])
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    screening_ids = [create_screening(client, program_id, submitter, f"Film {i}") for i in range(6)]
+    
+    set_program_state(client, program_id, programmer, "ASSIGNMENT")
+    for screening_id in screening_ids:
+        client.put(f"/screenings/{screening_id}/assign-handler", headers=programmer.headers, json={"handler_id": staff.id})
+    
+    set_program_state(client, program_id, programmer, "REVIEW")
+    response = client.post(f"/screenings/program/{program_id}/bulk/review", headers=staff.headers, json={
+        "items": [{"screening_id": screening_id, "review_score": 7, "review_comments": "ok"} for screening_id in screening_ids]
+    })
+    assert response.status_code == 200 and response.json()["succeeded"] == 6, response.text
+    
+    set_program_state(client, program_id, programmer, "SCHEDULING")
+    return programmer, submitter, program_id, screening_ids
+
+
+def test_bulk_approve_one_update_per_payload(client, reviewed):
+    _, submitter, program_id, screening_ids = reviewed
+    items = [{"screening_id": screening_id, "approval_notes": "ok"} for screening_id in screening_ids]
+    items.append({"screening_id": 999999, "approval_notes": "ok"})
+    
+    #User, program state, SELECT ... FOR UPDATE kai ena UPDATE gia ola ta idia payloads
+    with assert_max_queries(4):
+        response = client.post(f"/screenings/program/{program_id}/bulk/approve", headers=submitter.headers, json={"items": items})
+    
+    result = response.json()
+    assert result["succeeded"] == 6 and result["failed"] == 1, result
+    assert {item["state"] for item in result["results"] if item["success"]} == {"APPROVED"}
+    assert result["results"][-1]["status_code"] == 404
+
+
+def test_bulk_approve_keeps_distinct_payloads(client, reviewed):
+    _, submitter, program_id, screening_ids = reviewed
+    #None kai "None" einai diaforetika payloads (diaforetiko UPDATE)
+    notes = [None if index % 2 else "None" for index in range(len(screening_ids))]
+    items = [{"screening_id": screening_id, "approval_notes": note} for screening_id, note in zip(screening_ids, notes)]
+    
+    response = client.post(f"/screenings/program/{program_id}/bulk/approve", headers=submitter.headers, json={"items": items})
+    assert response.json()["succeeded"] == 6, response.text
+    
+    for screening_id, note in zip(screening_ids, notes):
+        screening = client.get(f"/screenings/{screening_id}/authenticated", headers=submitter.headers).json()
+        assert screening["approval_notes"] == note
+
+
+def test_bulk_reject_groups_by_payload(client, reviewed):
+    programmer, _, program_id, screening_ids = reviewed
+    items = [
+        {"screening_id": screening_id, "rejection_reason": "late" if index % 2 else "duplicate"}
+        for index, screening_id in enumerate(screening_ids)
+    ]
+    
+    #Dyo diaforetika rejection_reason: dyo UPDATE
+    with assert_max_queries(6):
+        response = client.post(f"/screenings/program/{program_id}/bulk/reject", headers=programmer.headers, json={"items": items})
+    assert response.json()["succeeded"] == 6, response.text
+    
+    for index, screening_id in enumerate(screening_ids):
+        screening = client.get(f"/screenings/{screening_id}/authenticated", headers=programmer.headers).json()
+        assert screening["state"] == "REJECTED"
+        assert screening["rejection_reason"] == ("late" if index % 2 else "duplicate")
+
+
+def test_bulk_guards_are_checked_in_the_update(client, db, reviewed):
+    _, submitter, program_id, screening_ids = reviewed
+    
+    #To cached program state leei SCHEDULING, alla to program allakse
+    #sti vasi: o elegxos prin to UPDATE pernaei, to WHERE oxi kai to
+    #error vgainei apo to state tis vasis
+    assert ProgramService.get_program_state(db, program_id) == ProgramState.SCHEDULING
+    db.execute(update(Program).where(Program.id == program_id).values(state=ProgramState.FINAL_PUBLICATION))
+    db.commit()
+    
+    try:
+        bulk_data = BulkScreeningApproval(items=[
+            {"screening_id": screening_id, "approval_notes": "ok"} for screening_id in screening_ids
+        ])
+        with pytest.raises(HTTPException) as error:
+            ScreeningService.bulk_approve_screenings(db, program_id, bulk_data, db.get(User, submitter.id))
+        assert error.value.status_code == 400
+        assert error.value.detail == "Program must be in SCHEDULING state"
+    finally:
+        program_cache.invalidate(program_id=program_id)
+    
+    states = db.query(Screening.state).filter(Screening.id.in_(screening_ids)).all()
+    assert {state for state, in states} == {ScreeningState.REVIEWED}
+
+
+def test_transition_error_uses_database_program_state(client, db, make_user):
+    programmer, submitter = make_user("prog"), make_user("subm")
+    program_id = create_program(client, programmer)
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    screening_id = create_screening(client, program_id, submitter, submit=False)
+    
+    #Allagi apo allon worker: to cache leei akoma SUBMISSION
+    assert ProgramService.get_program_state(db, program_id) == ProgramState.SUBMISSION
+    db.execute(update(Program).where(Program.id == program_id).values(state=ProgramState.ASSIGNMENT))
+    db.commit()
+    
+    try:
+        response = client.post(f"/screenings/{screening_id}/submit", headers=submitter.headers)
+        assert response.status_code == 400, response.text
+        assert response.json()["detail"] == "Program must be in SUBMISSION state"
+    finally:
+        program_cache.invalidate(program_id=program_id)
\ No newline at end of file
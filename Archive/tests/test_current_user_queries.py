@@ -0,0 +1,59 @@
+import pytest
+from fastapi import HTTPException
+
+from app.models.user import User, AuthToken
+from app.utils.dependencies import resolve_current_user
+from app.utils.query_counter import count_queries
+from app.utils.security import generate_token_for_user, token_digest
+from app.utils.token_cache import token_cache
+
+
+def test_cache_miss_single_joined_select(client, db, make_user):
+    user = make_user("current")
+    token_cache.clear()
+    
+    #Token kai owner fortonontai mazi: ena SELECT me JOIN
+    with count_queries() as stats:
+        current_user = resolve_current_user(db, user.headers["Authorization"])
+    
+    assert current_user.id == user.id
+    assert stats.count == 1, list(stats.shapes)
+    statement = next(iter(stats.shapes))
+    assert "auth_tokens" in statement and "JOIN users" in statement
+
+
+def test_cache_hit_loads_only_user(client, db, make_user):
+    user = make_user("current")
+    token_cache.clear()
+    resolve_current_user(db, user.headers["Authorization"])
+    db.expunge_all()
+    
+    with count_queries() as stats:
+        current_user = resolve_current_user(db, user.headers["Authorization"])
+    
+    assert current_user.id == user.id
+    assert stats.count == 1, list(stats.shapes)
+    assert "auth_tokens" not in next(iter(stats.shapes))
+
+
+def test_ownership_mismatch_deactivates_both(client, db, make_user):
+    claimed = make_user("claimed")
+    owner = make_user("owner")
+    token_cache.clear()
+    
+    #Token me to user_id tou claimed, apothikeumeno ston owner
+    token, expires_at = generate_token_for_user(claimed.id, claimed.username)
+    db.add(AuthToken(user_id=owner.id, token_hash=token_digest(token), expires_at=expires_at))
+    db.commit()
+    
+    #Joined SELECT, SELECT tou claimed user kai ena UPDATE (executemany) gia tous 2 users
+    with count_queries() as stats:
+        with pytest.raises(HTTPException) as error:
+            resolve_current_user(db, f"Bearer {token}")
+    
+    assert error.value.status_code == 403
+    assert stats.count <= 3, list(stats.shapes)
+    
+    db.expire_all()
+    assert db.get(User, claimed.id).is_active is False
+    assert db.get(User, owner.id).is_active is False
\ No newline at end of file
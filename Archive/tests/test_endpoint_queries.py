@@ -0,0 +1,114 @@
+import pytest
+
+from app.utils.query_counter import assert_max_queries
+from tests.conftest import create_program, create_screening, set_program_state
+
+#Ta transitions einai ena guarded UPDATE kai ena SELECT gia to response
+#(+1 gia ton current user), anexartita apo to megethos tou program
+TRANSITION_QUERIES = 3
+
+
+@pytest.fixture
+def roles(make_user):
+    return make_user("prog"), make_user("staff"), make_user("subm")
+
+
+def _request(client, method, path, headers, max_queries, json=None, expected_status=200):
+    with assert_max_queries(max_queries):
+        response = client.request(method, path, headers=headers, json=json)
+    assert response.status_code == expected_status, response.text
+    return response
+
+
+def _reviewed_program(client, roles, count=2):
+    #Program se SCHEDULING me count reviewed screenings
+    programmer, staff, submitter = roles
+    program_id = create_program(client, programmer, [staff])
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    screening_ids = [create_screening(client, program_id, submitter, f"Film {i}") for i in range(count)]
+    
+    set_program_state(client, program_id, programmer, "ASSIGNMENT")
+    for screening_id in screening_ids:
+        client.put(f"/screenings/{screening_id}/assign-handler", headers=programmer.headers, json={"handler_id": staff.id})
+    
+    set_program_state(client, program_id, programmer, "REVIEW")
+    for screening_id in screening_ids:
+        client.post(f"/screenings/{screening_id}/review", headers=staff.headers, json={"review_score": 7, "review_comments": "ok"})
+    
+    set_program_state(client, program_id, programmer, "SCHEDULING")
+    return program_id, screening_ids
+
+
+def test_submit_and_withdraw_queries(client, roles):
+    programmer, _, submitter = roles
+    program_id = create_program(client, programmer)
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    submitted = create_screening(client, program_id, submitter, submit=False)
+    withdrawn = create_screening(client, program_id, submitter, submit=False)
+    
+    _request(client, "POST", f"/screenings/{submitted}/submit", submitter.headers, TRANSITION_QUERIES)
+    _request(client, "DELETE", f"/screenings/{withdrawn}/withdraw", submitter.headers, 2, expected_status=204)
+
+
+def test_assignment_and_review_queries(client, roles):
+    programmer, staff, submitter = roles
+    program_id = create_program(client, programmer, [staff])
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    screening_id = create_screening(client, program_id, submitter)
+    
+    set_program_state(client, program_id, programmer, "ASSIGNMENT")
+    _request(
+        client, "PUT", f"/screenings/{screening_id}/assign-handler", programmer.headers, TRANSITION_QUERIES,
+        json={"handler_id": staff.id}
+    )
+    
+    set_program_state(client, program_id, programmer, "REVIEW")
+    _request(
+        client, "POST", f"/screenings/{screening_id}/review", staff.headers, TRANSITION_QUERIES,
+        json={"review_score": 8, "review_comments": "ok"}
+    )
+
+
+def test_decision_queries(client, roles):
+    programmer, _, submitter = roles
+    program_id, (accepted, rejected) = _reviewed_program(client, roles)
+    
+    _request(
+        client, "POST", f"/screenings/{accepted}/approve", submitter.headers, TRANSITION_QUERIES,
+        json={"approval_notes": "ok"}
+    )
+    _request(
+        client, "POST", f"/screenings/{rejected}/reject", programmer.headers, TRANSITION_QUERIES,
+        json={"rejection_reason": "no"}
+    )
+    
+    set_program_state(client, program_id, programmer, "FINAL_PUBLICATION")
+    _request(client, "POST", f"/screenings/{accepted}/final-submit", submitter.headers, TRANSITION_QUERIES)
+    
+    set_program_state(client, program_id, programmer, "DECISION")
+    _request(client, "POST", f"/screenings/{accepted}/accept", programmer.headers, TRANSITION_QUERIES)
+
+
+def test_failed_transition_queries(client, roles):
+    programmer, _, submitter = roles
+    program_id = create_program(client, programmer)
+    set_program_state(client, program_id, programmer, "SUBMISSION")
+    screening_id = create_screening(client, program_id, submitter)
+    
+    #To UPDATE den allazei tipota: ena SELECT gia to error message
+    _request(client, "POST", f"/screenings/{screening_id}/submit", submitter.headers, 4, expected_status=400)
+
+
+def test_search_queries(client, roles):
+    programmer, _, submitter = roles
+    program_id, _ = _reviewed_program(client, roles, count=5)
+    
+    #Ta program_roles fortonontai me ena SELECT ... IN, oxi ena ana program
+    _request(client, "GET", "/programs/search", {}, 2)
+    _request(client, "GET", "/programs/search/authenticated", programmer.headers, 3)
+    
+    #Program, role tou user kai ta screenings
+    _request(client, "GET", f"/screenings/program/{program_id}/search", {}, 2)
+    for user in (programmer, submitter):
+        response = _request(client, "GET", f"/screenings/program/{program_id}/search/authenticated", user.headers, 4)
+        assert len(response.json()) == 5
\ No newline at end of file
@@ -0,0 +1,55 @@
+from sqlalchemy import update
+
+from app.models.program import Program, ProgramState
+from app.services.program_service import ProgramService
+from app.utils.program_cache import SYNCED_KEY, program_cache
+from tests.conftest import create_program, set_program_state
+
+
+def _sync(db):
+    #Sta tests to interval einai 3600s: sync amesws
+    db.info.pop(SYNCED_KEY, None)
+    program_cache._next_check = 0.0
+    program_cache.sync(db)
+
+
+def _cached(db, *program_ids):
+    #Gemisma tou cache kai elegxos poia programs emeinan meta to sync
+    for program_id in program_ids:
+        ProgramService.get_program_state(db, program_id)
+    _sync(db)
+    return {program_id for program_id in program_ids if program_id in program_cache._states}
+
+
+def test_other_worker_change_removes_only_its_program(client, db, make_user):
+    programmer = make_user("prog")
+    first, second = create_program(client, programmer), create_program(client, programmer)
+    #To proto sync afairei ta programs pou den eixan elegxthei akoma
+    _cached(db, first, second)
+    assert _cached(db, first, second) == {first, second}
+    
+    #Allos worker: allagi state kai +1 sto version mono tou first
+    db.execute(
+        update(Program)
+        .where(Program.id == first)
+        .values(state=ProgramState.SUBMISSION, cache_version=Program.cache_version + 1)
+    )
+    db.commit()
+    
+    _sync(db)
+    assert first not in program_cache._states
+    assert second in program_cache._states
+    assert ProgramService.get_program_state(db, first) == ProgramState.SUBMISSION
+
+
+def test_own_change_keeps_other_programs(client, db, make_user):
+    programmer = make_user("prog")
+    first, second = create_program(client, programmer), create_program(client, programmer)
+    _cached(db, first, second)
+    assert _cached(db, first, second) == {first, second}
+    
+    #To invalidation ginetai meta to commit: to epomeno sync den afairei tipota
+    set_program_state(client, first, programmer, "SUBMISSION")
+    assert second in program_cache._states
+    assert _cached(db, first, second) == {first, second}
+    assert ProgramService.get_program_state(db, first) == ProgramState.SUBMISSION
\ No newline at end of file
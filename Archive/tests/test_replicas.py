@@ -0,0 +1,122 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, lambda_stmt, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.database import build_engine
+from app.utils import replicas
+from app.utils.replicas import ReplicaSet, RoutingSession, reads_from_replica
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("name", String(50)))
+
+
+def _database(path, name):
+    #Kathe arxeio exei allo name, gia na fainetai apo pou irthe to SELECT
+    engine = build_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(items.insert().values(id=1, name=name))
+    return engine
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = _database(tmp_path / "primary.db", "primary")
+    replica = _database(tmp_path / "replica.db", "replica")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _session(primary, replica_engines, **options):
+    replica_set = ReplicaSet(
+        engines=replica_engines,
+        max_lag_seconds=options.get("max_lag_seconds", 5.0),
+        check_interval_seconds=10,
+        fallback_to_primary=options.get("fallback_to_primary", True)
+    )
+    replica_set.check()
+    factory = sessionmaker(
+        class_=RoutingSession,
+        autoflush=False,
+        bind=primary,
+        replica_set=replica_set,
+        replica_engines=replica_engines
+    )
+    return factory(), replica_set
+
+
+def _name(db):
+    return db.execute(select(items.c.name).where(items.c.id == 1)).scalar_one()
+
+
+def test_reads_go_to_replica(engines):
+    primary, replica = engines
+    db, replica_set = _session(primary, [replica])
+    
+    with db:
+        assert _name(db) == "replica"
+        assert reads_from_replica(db)
+    assert replica_set.stats()["replicas"][0]["sessions"] == 1
+
+
+def test_lambda_statements_go_to_replica(engines):
+    #Ta cached lookups (app.utils.statements) einai lambda_stmt, oxi Select
+    primary, replica = engines
+    db, _ = _session(primary, [replica])
+    
+    with db:
+        statement = lambda_stmt(lambda: select(items.c.name).where(items.c.id == 1))
+        assert db.execute(statement).scalar_one() == "replica"
+        assert reads_from_replica(db)
+    
+    db, _ = _session(primary, [replica])
+    with db:
+        statement = lambda_stmt(lambda: select(items.c.name).with_for_update())
+        assert db.execute(statement).scalar_one() == "primary"
+
+
+def test_reads_after_write_stay_on_primary(engines):
+    primary, replica = engines
+    db, _ = _session(primary, [replica])
+    
+    with db:
+        assert _name(db) == "replica"
+        
+        db.execute(update(items).where(items.c.id == 1).values(name="written"))
+        assert _name(db) == "written"
+        assert not reads_from_replica(db)
+        
+        #FOR UPDATE diavazei panta apo to primary
+        db.rollback()
+        locked = db.execute(select(items.c.name).with_for_update()).scalar_one()
+        assert locked == "primary"
+
+
+def test_lagging_replica_falls_back_to_primary(engines, monkeypatch):
+    primary, replica = engines
+    monkeypatch.setattr(replicas, "replica_lag", lambda engine: 60.0)
+    
+    db, replica_set = _session(primary, [replica], max_lag_seconds=5.0)
+    with db:
+        assert _name(db) == "primary"
+        assert not reads_from_replica(db)
+    assert replica_set.stats()["primary_fallbacks"] == 1
+    
+    #Xoris fallback: to lagging replica protimatai apo to primary
+    db, _ = _session(primary, [replica], max_lag_seconds=5.0, fallback_to_primary=False)
+    with db:
+        assert _name(db) == "replica"
+
+
+def test_unavailable_replica_falls_back_to_primary(engines, tmp_path):
+    primary, _ = engines
+    missing = build_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    
+    db, replica_set = _session(primary, [missing], fallback_to_primary=False)
+    with db:
+        assert _name(db) == "primary"
+    
+    stats = replica_set.stats()["replicas"][0]
+    assert not stats["usable"] and stats["error"]
+    missing.dispose()
\ No newline at end of file
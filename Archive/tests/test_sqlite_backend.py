@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, func, select
+
+from app.config import MEMORY_DATABASE
+from app.database import build_engine
+
+metadata = MetaData()
+counters = Table("counters", metadata, Column("id", Integer, primary_key=True), Column("value", Integer))
+
+
+@pytest.fixture
+def memory_engine():
+    #To SQLITE_PATH=":memory:" tou app (arxeio sto tmpfs)
+    engine = build_engine(f"sqlite:///{MEMORY_DATABASE}")
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    yield engine
+    metadata.drop_all(engine)
+    engine.dispose()
+
+
+def test_memory_database_concurrent_writers(memory_engine):
+    errors = []
+    
+    def write(worker: int) -> None:
+        try:
+            for value in range(20):
+                with memory_engine.begin() as connection:
+                    connection.execute(counters.insert().values(value=worker * 100 + value))
+        except Exception as e:
+            errors.append(e)
+    
+    #Oi writers perimenoun o enas ton allo (busy_timeout), oxi "table is locked"
+    threads = [threading.Thread(target=write, args=(worker,)) for worker in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    with memory_engine.connect() as connection:
+        assert connection.scalar(select(func.count()).select_from(counters)) == 100
+
+
+def test_memory_database_reads_only_committed(memory_engine):
+    with memory_engine.connect() as writer:
+        transaction = writer.begin()
+        writer.execute(counters.insert().values(value=1))
+        
+        with memory_engine.connect() as reader:
+            assert reader.scalar(select(func.count()).select_from(counters)) == 0
+        
+        transaction.rollback()
+    
+    with memory_engine.connect() as reader:
+        assert reader.scalar(select(func.count()).select_from(counters)) == 0
\ No newline at end of file